@@ -8,12 +8,21 @@ publication-quality outputs.
 """
 
 import contextlib
+import gc
+import hashlib
+import json
 import os
+import queue
+import threading
 import warnings
+from collections.abc import Iterator
+from importlib.metadata import PackageNotFoundError, version
 from multiprocessing import Pool, cpu_count
-from typing import TYPE_CHECKING, Optional, Union
+from multiprocessing.pool import ThreadPool
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 import numpy as np
+import pandas as pd
 from filelock import FileLock
 from monty.json import MontyDecoder
 from monty.serialization import dumpfn, loadfn
@@ -37,16 +46,21 @@ from doped.utils.parsing import (
     _get_bulk_locpot_dict,
     _get_bulk_site_potentials,
     _get_defect_supercell_bulk_site_coords,
+    _get_directory_contents,
     _get_output_files_and_check_if_multiple,
+    _index_output_directories,
     _multiple_files_warning,
+    _profile_defect_parsing,
+    _profile_parsing_stage,
     _vasp_file_parsing_action_dict,
     check_atom_mapping_far_from_defect,
     defect_charge_from_vasprun,
+    find_archived_fname,
+    get_core_potentials,
     get_defect_site_idxs_and_unrelaxed_structure,
     get_defect_type_and_composition_diff,
-    get_locpot,
+    get_locpot_planar_averages,
     get_orientational_degeneracy,
-    get_outcar,
     get_procar,
     get_vasprun,
 )
@@ -59,6 +73,8 @@ from doped.utils.symmetry import (
 )
 
 if TYPE_CHECKING:
+    from multiprocessing.pool import Pool as PoolType
+
     from easyunfold.procar import Procar as EasyunfoldProcar
 
 
@@ -453,6 +469,302 @@ def defect_entry_from_paths(
     return dp.defect_entry
 
 
+_defects_parser_worker_state: dict = {}  # parser (with bulk data), set once per multiprocessing worker
+
+
+def _initialise_defects_parser_worker(defects_parser: "DefectsParser"):
+    """
+    Initialise a ``DefectsParser`` multiprocessing worker process, storing the
+    parser (and thus the bulk data; ``bulk_vr``, ``bulk_procar`` and
+    ``bulk_corrections_data``) once per worker, rather than pickling and
+    sending it with every defect parsing task.
+    """
+    _defects_parser_worker_state["defects_parser"] = defects_parser
+
+
+def _parse_defect_in_worker(defect_folder: str) -> tuple[Optional[DefectEntry], str]:
+    """
+    Parse ``defect_folder`` in a ``DefectsParser`` multiprocessing worker
+    process, using the parser set by ``_initialise_defects_parser_worker``.
+    """
+    defects_parser = _defects_parser_worker_state["defects_parser"]
+    result = defects_parser._parse_defect_and_handle_warnings(defect_folder)
+    if defects_parser.memory_budget is not None:  # release parsing memory before the next folder
+        gc.collect()
+
+    return result
+
+
+def _profile_defect_in_worker(defect_folder: str) -> tuple[Optional[DefectEntry], str, tuple[str, dict]]:
+    """
+    Parse ``defect_folder`` in a ``DefectsParser`` multiprocessing worker
+    process (as in ``_parse_defect_in_worker``), while profiling the parsing
+    stages, returning the parsed ``DefectEntry``, warnings string and
+    ``(defect_folder, parsing profile)``.
+    """
+    with _profile_defect_parsing() as profile:
+        parsed_defect_entry, warnings_string = _parse_defect_in_worker(defect_folder)
+
+    return parsed_defect_entry, warnings_string, (defect_folder, profile)
+
+
+def _summarise_parsing_profile(parsing_profile: dict[str, dict[str, dict[str, float]]]) -> pd.DataFrame:
+    """
+    Summarise the per-folder parsing profiles from ``DefectsParser`` (with
+    ``profile`` set) as a ``DataFrame`` of the total, mean and maximum wall
+    times and the maximum peak RSS for each parsing stage, over all parsed
+    folders, sorted by total time.
+    """
+    profile_df = pd.DataFrame(
+        [
+            {"Stage": stage, **stage_profile}
+            for profile in parsing_profile.values()
+            for stage, stage_profile in profile.items()
+        ]
+    )
+    summary_df = profile_df.groupby("Stage").agg(
+        **{
+            "Folders": ("time", "size"),
+            "Total Time (s)": ("time", "sum"),
+            "Mean Time (s)": ("time", "mean"),
+            "Max Time (s)": ("time", "max"),
+            "Max Peak RSS (MB)": ("peak_rss", "max"),
+        }
+    )
+    summary_df["Max Peak RSS (MB)"] /= 1e6  # bytes to MB
+    stage_order = summary_df.drop(index="total").sort_values("Total Time (s)", ascending=False).index
+    return summary_df.loc[[*stage_order, "total"]]
+
+
+def _contains_vasprun(path: str, dir_index: Optional[dict] = None) -> bool:
+    """
+    Check if the directory at ``path`` contains a ``vasprun.xml(.gz)`` file,
+    using the directory index ``dir_index`` (from
+    ``_index_output_directories``) if ``path`` is indexed.
+    """
+    return any(
+        "vasprun" in file and ".xml" in file for file in _get_directory_contents(path, dir_index)[1]
+    )
+
+
+def _get_folders_with_vasprun(path: str, dir_index: dict) -> list[str]:
+    """
+    Get the names of the subdirectories of ``path`` which contain
+    ``vasprun.xml(.gz)`` files, either directly or in any of their
+    subdirectories, from the directory index ``dir_index`` (from
+    ``_index_output_directories``).
+    """
+    path = os.path.abspath(path)
+    folders_with_vasprun = {
+        os.path.relpath(dir_path, path).split(os.sep)[0]
+        for dir_path in dir_index
+        if dir_path != path
+        and dir_path.startswith(os.path.join(path, ""))
+        and _contains_vasprun(dir_path, dir_index)
+    }
+    return [subdir for subdir in dir_index[path][0] if subdir in folders_with_vasprun]
+
+
+# rough multiples of the (uncompressed) file size for the peak memory usage when parsing each file:
+_parsing_memory_factors = {"vasprun": 0.5, "LOCPOT": 3.0, "OUTCAR": 0.1, "PROCAR": 2.0}
+_compression_ratio = 5  # rough compression ratio for compressed VASP output files
+
+
+def _estimate_parsing_memory(path: str) -> float:
+    """
+    Roughly estimate the peak memory (in bytes) required to parse the VASP
+    calculation in ``path``, from the sizes of the ``vasprun.xml``,
+    ``LOCPOT``, ``OUTCAR`` and ``PROCAR`` files (accounting for compression).
+    If multiple files of the same type are present, the largest estimate is
+    used (as only one is parsed).
+    """
+    file_type_estimates = dict.fromkeys(_parsing_memory_factors, 0.0)
+    with contextlib.suppress(OSError), os.scandir(path) as dir_entries:
+        for dir_entry in dir_entries:
+            file_type = next((i for i in _parsing_memory_factors if i in dir_entry.name), None)
+            if file_type is None or not dir_entry.is_file():
+                continue
+
+            size = dir_entry.stat().st_size
+            if dir_entry.name.lower().endswith((".gz", ".xz", ".bz2", ".bz", ".lzma")):
+                size *= _compression_ratio
+            file_type_estimates[file_type] = max(
+                file_type_estimates[file_type], size * _parsing_memory_factors[file_type]
+            )
+
+    return sum(file_type_estimates.values())
+
+
+def _memory_bounded_imap_unordered(
+    pool: "PoolType",
+    func: Callable,
+    tasks: list,
+    task_costs: list[float],
+    memory_budget: float,
+    max_tasks_in_flight: int,
+) -> Iterator[Any]:
+    """
+    Memory-bounded version of ``Pool.imap_unordered``, where tasks are
+    dispatched largest-first (by ``task_costs``), with the total cost of
+    running tasks kept within ``memory_budget`` (with the exception that a
+    task is always dispatched if no others are running, so tasks larger than
+    the budget run alone). Smaller tasks are dispatched around larger ones
+    where they fit within the budget, so that small tasks still run with full
+    parallelism.
+
+    Args:
+        pool (Pool):
+            ``multiprocessing`` ``Pool`` to run the tasks.
+        func (Callable):
+            Function to apply to each task.
+        tasks (list):
+            List of (single) arguments to ``func``.
+        task_costs (list[float]):
+            Estimated memory cost of each task, in the same units as
+            ``memory_budget``.
+        memory_budget (float):
+            Maximum total cost of concurrently-running tasks.
+        max_tasks_in_flight (int):
+            Maximum number of concurrently-running tasks (i.e. the number of
+            ``pool`` processes).
+
+    Yields:
+        ``func`` outputs, in order of completion.
+    """
+    pending = sorted(zip(task_costs, range(len(tasks))), reverse=True)  # largest first
+    finished: queue.Queue = queue.Queue()
+    running_costs: dict[int, float] = {}
+
+    while pending or running_costs:
+        i = 0
+        while i < len(pending) and len(running_costs) < max_tasks_in_flight:
+            cost, idx = pending[i]
+            if running_costs and sum(running_costs.values()) + cost > memory_budget:
+                i += 1  # try next (smaller) task
+                continue
+
+            pending.pop(i)
+            running_costs[idx] = cost
+            pool.apply_async(
+                func,
+                (tasks[idx],),
+                callback=lambda result, idx=idx: finished.put((idx, result, None)),
+                error_callback=lambda exc, idx=idx: finished.put((idx, None, exc)),
+            )
+
+        idx, result, exc = finished.get()
+        running_costs.pop(idx)
+        if exc is not None:
+            raise exc
+        yield result
+
+
+def _read_ahead_file(path: str, stop_event: threading.Event, chunk_size: int = 2**22) -> None:
+    """
+    Read through the file at ``path`` (discarding the data, until
+    ``stop_event`` is set), so that it is loaded into the OS page cache for
+    subsequent fast reads.
+    """
+    buffer = bytearray(chunk_size)
+    with contextlib.suppress(OSError), open(path, "rb", buffering=0) as f:
+        while not stop_event.is_set() and f.readinto(buffer):
+            pass
+
+
+class _OutputFilesPrefetcher:
+    """
+    Reads ahead the ``vasprun.xml``, ``OUTCAR`` and ``LOCPOT`` files
+    (compressed or not) of upcoming defect folders in a background thread
+    pool, so that file I/O (which can be slow on network/parallel file
+    systems) overlaps with the (CPU-bound) parsing of earlier folders.
+
+    Files are read into the OS page cache rather than held in memory, so
+    that they can then be quickly read by whichever (worker) process parses
+    them. The total size of read-ahead files for folders which have not yet
+    been parsed is kept within ``buffer_size`` (bytes), except that the next
+    folder is always read ahead. If ``buffer_size`` is ``None``, no files are
+    read ahead.
+
+    Args:
+        paths (list[str]):
+            Paths to the defect calculation folders, in the (expected) order
+            in which they will be parsed.
+        buffer_size (float):
+            Maximum total size (in bytes) of read-ahead files for folders
+            which have not yet been parsed.
+        threads (int):
+            Number of threads to use for reading ahead files. (Default: 4)
+        dir_index (dict):
+            Index of directory contents from ``_index_output_directories``,
+            used to locate the output files. (Default: None)
+    """
+
+    def __init__(
+        self,
+        paths: list[str],
+        buffer_size: Optional[float],
+        threads: int = 4,
+        dir_index: Optional[dict] = None,
+    ):
+        self.paths = list(paths)
+        self.buffer_size = buffer_size
+        self.dir_index = dir_index
+        self._folder_sizes: list[int] = []  # total read-ahead file sizes, for each dispatched folder
+        self._num_parsed = 0
+        self._stop_event = threading.Event()
+        self._pool = ThreadPool(threads) if buffer_size is not None and self.paths else None
+        self._read_ahead()
+
+    def _read_ahead(self):
+        if self._pool is None:
+            return
+
+        while len(self._folder_sizes) < len(self.paths):
+            output_files = []
+            with contextlib.suppress(OSError):  # folder may not exist (error raised when parsing)
+                output_files = [
+                    output_file_path
+                    for output_file in ["vasprun.xml", "OUTCAR", "LOCPOT"]
+                    if os.path.isfile(
+                        output_file_path := _get_output_files_and_check_if_multiple(
+                            output_file, self.paths[len(self._folder_sizes)], self.dir_index
+                        )[0]
+                    )
+                ]
+            folder_size = sum(os.path.getsize(output_file) for output_file in output_files)
+            buffered_size = sum(self._folder_sizes[self._num_parsed :])
+            if buffered_size and buffered_size + folder_size > self.buffer_size:  # type: ignore
+                break
+
+            self._folder_sizes.append(folder_size)
+            for output_file in output_files:
+                self._pool.apply_async(_read_ahead_file, (output_file, self._stop_event))
+
+    def folder_parsed(self):
+        """
+        Register that a folder has been parsed, freeing its space in the
+        read-ahead buffer for the next folders.
+        """
+        self._num_parsed += 1
+        self._read_ahead()
+
+    def close(self):
+        """
+        Stop reading ahead files and shut down the thread pool.
+        """
+        self._stop_event.set()
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 class DefectsParser:
     def __init__(
         self,
@@ -466,6 +778,10 @@ class DefectsParser:
         processes: Optional[int] = None,
         json_filename: Optional[Union[str, bool]] = None,
         parse_projected_eigen: Optional[bool] = None,
+        cache: Union[bool, str] = False,
+        memory_budget: Optional[float] = None,
+        prefetch_buffer: Optional[float] = None,
+        profile: Union[bool, str] = False,
         **kwargs,
     ):
         r"""
@@ -485,7 +801,8 @@ class DefectsParser:
 
         By default, tries multiprocessing to speed up defect parsing, which can be
         controlled with ``processes``. If parsing hangs, this may be due to memory
-        issues, in which case you should reduce ``processes`` (e.g. 4 or less).
+        issues, in which case you should reduce ``processes`` (e.g. 4 or less), or
+        set ``memory_budget`` to limit the memory demand of parallel parsing.
 
         Defect charge states are automatically determined from the defect
         calculation outputs if ``POTCAR``\s are set up with ``pymatgen`` (see docs
@@ -571,6 +888,54 @@ class DefectsParser:
                 by anywhere from ~5-25%, so set to ``False`` if parsing speed is crucial.
                 Default is ``None``, which will attempt to load this data but with no
                 warning if it fails (otherwise if ``True`` a warning will be printed).
+            cache (bool or str):
+                Whether to use an on-disk parsing cache, so that re-running
+                ``DefectsParser`` only re-parses defect folders which are new or have
+                changed since the last run, with unchanged folders loaded directly
+                from the cache. Each parsed ``DefectEntry`` is saved to the cache
+                directory along with a hash of its calculation output files (names,
+                sizes and modification times of the ``vasprun.xml``, ``OUTCAR``,
+                ``LOCPOT`` and ``PROCAR`` files), the bulk output files and the parsing
+                settings (``dielectric``, ``subfolder``, ``skip_corrections`` etc.),
+                with any change in these triggering a re-parse.
+                If ``True``, the cache is stored in ``output_path/.doped_cache``, or
+                if a string, it is used as the path to the cache directory.
+                Default is ``False`` (no caching).
+            memory_budget (float):
+                Memory budget (in GB) for multiprocessing parsing. If set, the memory
+                required to parse each defect folder is (roughly) estimated from the
+                sizes of its ``vasprun.xml``, ``LOCPOT``, ``OUTCAR`` and ``PROCAR``
+                files, and defect folders are parsed largest-first, with the total
+                estimated memory of concurrently-parsed folders kept within
+                ``memory_budget`` (up to ``processes`` at a time), and with garbage
+                collection run in the worker processes after each folder to release
+                memory. Folders with estimated memory greater than ``memory_budget``
+                are parsed one at a time. Useful for avoiding out-of-memory crashes/hangs with large
+                (e.g. hybrid DFT) calculations, while still parsing small folders in
+                parallel. Default is ``None`` (no memory budget).
+            prefetch_buffer (float):
+                Size (in GB) of the read-ahead buffer for defect calculation outputs.
+                If set, the ``vasprun.xml``, ``OUTCAR`` and ``LOCPOT`` files of the
+                next defect folders to be parsed are read ahead in background
+                threads (into the OS page cache), with the total size of read-ahead
+                files for not-yet-parsed folders kept within ``prefetch_buffer``, so
+                that file I/O overlaps with parsing. Useful for speeding up parsing
+                on network/parallel file systems with high I/O latency.
+                Default is ``None`` (no read-ahead).
+            profile (bool or str):
+                Whether to profile the defect parsing, recording the wall time and
+                peak memory (RSS) of each parsing stage (``vasprun.xml`` parsing,
+                ``LOCPOT``/``OUTCAR`` loading, site matching, symmetry & degeneracy
+                determination, eigenvalue analysis, charge corrections etc.) for each
+                folder (including in worker processes), stored in
+                ``DefectsParser.parsing_profile`` as
+                ``{folder: {stage: {"time": wall time (s), "peak_rss": peak RSS
+                (bytes)}}}``. A table of the per-stage times and memory usage
+                aggregated over all folders is printed after parsing. Note that the
+                peak RSS is that of the (worker) process by the end of the stage, so
+                includes any previous parsing in the same process. If a string, the
+                per-folder profiles are also saved to this JSON file.
+                Default is ``False`` (no profiling).
             **kwargs:
                 Keyword arguments to pass to ``DefectParser()`` methods
                 (``load_FNV_data()``, ``load_eFNV_data()``, ``load_bulk_gap_data()``)
@@ -602,33 +967,32 @@ class DefectsParser:
         self.processes = processes
         self.json_filename = json_filename
         self.parse_projected_eigen = parse_projected_eigen
+        self.cache = cache
+        self.memory_budget = memory_budget
+        self.prefetch_buffer = prefetch_buffer
+        self.profile = profile
+        self.parsing_profile: dict[str, dict[str, dict[str, float]]] = {}
         self.bulk_vr = None  # loaded later
         self.kwargs = kwargs
 
+        # index the output directory tree once, to avoid repeated (slow on network file systems)
+        # directory listings when determining the defect, bulk and subfolders and output files:
+        self._dir_index = _index_output_directories(self.output_path)
         possible_defect_folders = [
             dir
-            for dir in os.listdir(self.output_path)
-            if any(
-                "vasprun" in file and ".xml" in file
-                for file_list in [tup[2] for tup in os.walk(os.path.join(self.output_path, dir))]
-                for file in file_list
-            )
-            and dir not in (self.bulk_path.split("/") if self.bulk_path else [])
+            for dir in _get_folders_with_vasprun(self.output_path, self._dir_index)
+            if dir not in (self.bulk_path.split("/") if self.bulk_path else [])
         ]
 
         if not possible_defect_folders:  # user may have specified the defect folder directly, so check
             # if we can dynamically determine the defect folder:
+            parent_dir_index = _index_output_directories(os.path.join(self.output_path, os.pardir))
             possible_defect_folders = [
                 dir
-                for dir in os.listdir(os.path.join(self.output_path, os.pardir))
-                if any(
-                    "vasprun" in file and ".xml" in file
-                    for file_list in [
-                        tup[2] for tup in os.walk(os.path.join(self.output_path, os.pardir, dir))
-                    ]
-                    for file in file_list
+                for dir in _get_folders_with_vasprun(
+                    os.path.join(self.output_path, os.pardir), parent_dir_index
                 )
-                and (
+                if (
                     os.path.basename(self.output_path) in dir  # only that defect directory
                     or "bulk" in str(dir).lower()  # or a bulk directory, for later
                 )
@@ -636,14 +1000,16 @@ class DefectsParser:
             ]
             if possible_defect_folders:  # update output path (otherwise will crash with informative error)
                 self.output_path = os.path.join(self.output_path, os.pardir)
+                self._dir_index = parent_dir_index
 
         if self.subfolder is None:  # determine subfolder to use
             vasp_subfolders = [
                 subdir
                 for possible_defect_folder in possible_defect_folders
-                for subdir in os.listdir(os.path.join(self.output_path, possible_defect_folder))
-                if os.path.isdir(os.path.join(self.output_path, possible_defect_folder, subdir))
-                and "vasp_" in subdir
+                for subdir in _get_directory_contents(
+                    os.path.join(self.output_path, possible_defect_folder), self._dir_index
+                )[0]
+                if "vasp_" in subdir
             ]
             vasp_type_count_dict = {  # Count Dik
                 i: len([subdir for subdir in vasp_subfolders if i in subdir])
@@ -674,25 +1040,26 @@ class DefectsParser:
             for dir in possible_defect_folders
             if dir not in possible_bulk_folders
             and (
-                self.subfolder in os.listdir(os.path.join(self.output_path, dir)) or self.subfolder == "."
+                self.subfolder == "."
+                or any(
+                    self.subfolder in names
+                    for names in _get_directory_contents(
+                        os.path.join(self.output_path, dir), self._dir_index
+                    )
+                )
             )
         ]
 
         # add subfolder to bulk_path if present with vasprun.xml(.gz), otherwise use bulk_path as is:
-        if os.path.isdir(os.path.join(self.bulk_path, self.subfolder)) and any(
-            "vasprun" in file and ".xml" in file
-            for file in os.listdir(os.path.join(self.bulk_path, self.subfolder))
+        if os.path.isdir(os.path.join(self.bulk_path, self.subfolder)) and _contains_vasprun(
+            os.path.join(self.bulk_path, self.subfolder), self._dir_index
         ):
             self.bulk_path = os.path.join(self.bulk_path, self.subfolder)
-        elif all("vasprun" not in file or ".xml" not in file for file in os.listdir(self.bulk_path)):
+        elif not _contains_vasprun(self.bulk_path, self._dir_index):
             possible_bulk_subfolders = [
                 dir
-                for dir in os.listdir(self.bulk_path)
-                if os.path.isdir(os.path.join(self.bulk_path, dir))
-                and any(
-                    "vasprun" in file and ".xml" in file
-                    for file in os.listdir(os.path.join(self.bulk_path, dir))
-                )
+                for dir in _get_directory_contents(self.bulk_path, self._dir_index)[0]
+                if _contains_vasprun(os.path.join(self.bulk_path, dir), self._dir_index)
             ]
             if len(possible_bulk_subfolders) == 1 and subfolder is None:
                 # if only one subfolder with a vasprun.xml file in it, and `subfolder` wasn't explicitly
@@ -707,7 +1074,9 @@ class DefectsParser:
 
         # remove trailing '/.' from bulk_path if present:
         self.bulk_path = self.bulk_path.rstrip("/.")
-        bulk_vr_path, multiple = _get_output_files_and_check_if_multiple("vasprun.xml", self.bulk_path)
+        bulk_vr_path, multiple = _get_output_files_and_check_if_multiple(
+            "vasprun.xml", self.bulk_path, self._dir_index
+        )
         if multiple:
             _multiple_files_warning(
                 "vasprun.xml",
@@ -716,13 +1085,19 @@ class DefectsParser:
                 dir_type="bulk",
             )
 
-        self.bulk_vr, self.bulk_procar = _parse_vr_and_poss_procar(
-            bulk_vr_path,
-            parse_projected_eigen=self.parse_projected_eigen,
-            output_path=self.bulk_path,
-            label="bulk",
-            parse_procar=True,
-        )
+        with self._profile_folder_parsing("bulk"):
+            self.bulk_vr, self.bulk_procar = _parse_vr_and_poss_procar(
+                bulk_vr_path,
+                parse_projected_eigen=self.parse_projected_eigen,
+                output_path=self.bulk_path,
+                label="bulk",
+                parse_procar=True,
+                dir_index=self._dir_index,
+            )
+            if isinstance(self.bulk_procar, str):
+                # only the bulk VBM and CBM orbital projections are needed for eigenvalue analysis, so
+                # read these once here and share this small ``StreamedProcar`` with each defect parser:
+                self.bulk_procar = _read_bulk_band_edge_procar(self.bulk_procar, self.bulk_vr)
         self.parse_projected_eigen = (
             self.bulk_vr.projected_eigenvalues is not None or self.bulk_procar is not None
         )
@@ -746,18 +1121,46 @@ class DefectsParser:
         parsed_defect_entries = []
         parsing_warnings = []
 
+        self._cache_dir: Optional[str] = None
+        defect_folders_to_parse = self.defect_folders
+        if self.cache:  # load unchanged defect entries from the parsing cache
+            self._cache_dir = (
+                self.cache
+                if isinstance(self.cache, str)
+                else os.path.join(self.output_path, ".doped_cache")
+            )
+            self._cache_settings_hash = self._get_cache_settings_hash(bulk_band_gap_vr)
+            defect_folders_to_parse = []
+            for defect_folder in self.defect_folders:
+                cached_result = self._load_cached_defect_entry(defect_folder)
+                if cached_result is None:
+                    defect_folders_to_parse.append(defect_folder)
+                    continue
+
+                parsed_defect_entry, warnings_string = cached_result
+                parsing_warnings.append(
+                    self._parse_parsing_warnings(
+                        warnings_string, defect_folder, f"{defect_folder}/{self.subfolder}"
+                    )
+                )
+                parsed_defect_entries.append(parsed_defect_entry)
+
         if self.processes is None:  # multiprocessing?
-            self.processes = min(max(1, cpu_count() - 1), len(self.defect_folders) - 1)  # only
+            self.processes = min(max(1, cpu_count() - 1), len(defect_folders_to_parse) - 1)  # only
             # multiprocess as much as makes sense, if only a handful of defect folders
 
         if self.processes <= 1:  # no multiprocessing
-            with tqdm(self.defect_folders, desc="Parsing defect calculations") as pbar:
+            with (
+                tqdm(defect_folders_to_parse, desc="Parsing defect calculations") as pbar,
+                self._get_output_files_prefetcher(defect_folders_to_parse) as prefetcher,
+            ):
                 for defect_folder in pbar:
                     # set tqdm progress bar description to defect folder being parsed:
                     pbar.set_description(f"Parsing {defect_folder}/{self.subfolder}".replace("/.", ""))
-                    parsed_defect_entry, warnings_string = self._parse_defect_and_handle_warnings(
-                        defect_folder
-                    )
+                    with self._profile_folder_parsing(defect_folder):
+                        parsed_defect_entry, warnings_string = self._parse_defect_and_handle_warnings(
+                            defect_folder
+                        )
                     parsing_warning = self._parse_parsing_warnings(
                         warnings_string, defect_folder, f"{defect_folder}/{self.subfolder}"
                     )
@@ -765,6 +1168,7 @@ class DefectsParser:
                     parsing_warnings.append(parsing_warning)
                     if parsed_defect_entry is not None:
                         parsed_defect_entries.append(parsed_defect_entry)
+                    prefetcher.folder_parsed()
 
         else:  # otherwise multiprocessing:
             with FileLock("voronoi_nodes.json.lock"):  # avoid reading/writing simultaneously
@@ -773,12 +1177,32 @@ class DefectsParser:
             # guess a charged defect in defect_folders, to try initially check if dielectric and
             # corrections correctly set, before multiprocessing with the same settings for all folders:
             charged_defect_folder = None
-            for possible_charged_defect_folder in self.defect_folders:
+            for possible_charged_defect_folder in defect_folders_to_parse:
                 with contextlib.suppress(Exception):
                     if abs(int(possible_charged_defect_folder[-1])) > 0:  # likely charged defect
                         charged_defect_folder = possible_charged_defect_folder
 
-            pbar = tqdm(total=len(self.defect_folders))
+            folders_to_process = [
+                folder for folder in defect_folders_to_parse if folder != charged_defect_folder
+            ]
+            task_costs = (
+                [
+                    _estimate_parsing_memory(os.path.join(self.output_path, folder, self.subfolder))
+                    / 1e9  # bytes to GB
+                    for folder in folders_to_process
+                ]
+                if self.memory_budget is not None
+                else None
+            )
+            prefetcher = self._get_output_files_prefetcher(
+                ([charged_defect_folder] if charged_defect_folder is not None else [])
+                + (  # memory-bounded parsing dispatches largest-first
+                    [folder for _cost, folder in sorted(zip(task_costs, folders_to_process), reverse=True)]
+                    if task_costs is not None
+                    else folders_to_process
+                )
+            )
+            pbar = tqdm(total=len(defect_folders_to_parse))
             try:
                 if charged_defect_folder is not None:
                     # will throw warnings if dielectric is None / charge corrections not possible,
@@ -786,9 +1210,10 @@ class DefectsParser:
                     pbar.set_description(  # set this first as desc is only set after parsing in function
                         f"Parsing {charged_defect_folder}/{self.subfolder}".replace("/.", "")
                     )
-                    parsed_defect_entry, warnings_string = self._parse_defect_and_handle_warnings(
-                        charged_defect_folder
-                    )
+                    with self._profile_folder_parsing(charged_defect_folder):
+                        parsed_defect_entry, warnings_string = self._parse_defect_and_handle_warnings(
+                            charged_defect_folder
+                        )
                     parsing_warning = self._update_pbar_and_return_warnings_from_parsing(
                         (parsed_defect_entry, warnings_string),
                         pbar,
@@ -796,11 +1221,12 @@ class DefectsParser:
                     parsing_warnings.append(parsing_warning)
                     if parsed_defect_entry is not None:
                         parsed_defect_entries.append(parsed_defect_entry)
+                    prefetcher.folder_parsed()
 
                 # also load the other bulk corrections data if possible:
                 for k, v in self.bulk_corrections_data.items():
                     if v is None:
-                        with contextlib.suppress(Exception):
+                        with contextlib.suppress(Exception), self._profile_folder_parsing("bulk"):
                             if k == "bulk_locpot_dict":
                                 self.bulk_corrections_data[k] = _get_bulk_locpot_dict(
                                     self.bulk_path, quiet=True
@@ -810,15 +1236,28 @@ class DefectsParser:
                                     self.bulk_path, quiet=True
                                 )
 
-                folders_to_process = [
-                    folder for folder in self.defect_folders if folder != charged_defect_folder
-                ]
                 pbar.set_description("Setting up multiprocessing")
                 if self.processes > 1:
-                    with Pool(processes=self.processes) as pool:  # result is parsed_defect_entry, warnings
-                        results = pool.imap_unordered(
-                            self._parse_defect_and_handle_warnings, folders_to_process
+                    # send parser (with bulk data) to each worker once, rather than with each task:
+                    with Pool(
+                        processes=self.processes,
+                        initializer=_initialise_defects_parser_worker,
+                        initargs=(self,),
+                    ) as pool:  # result is parsed_defect_entry, warnings
+                        worker_func = (
+                            _profile_defect_in_worker if self.profile else _parse_defect_in_worker
                         )
+                        if task_costs is not None:
+                            results = _memory_bounded_imap_unordered(
+                                pool,
+                                worker_func,
+                                folders_to_process,
+                                task_costs=task_costs,
+                                memory_budget=self.memory_budget,
+                                max_tasks_in_flight=self.processes,
+                            )
+                        else:
+                            results = pool.imap_unordered(worker_func, folders_to_process)
                         for result in results:
                             parsing_warning = self._update_pbar_and_return_warnings_from_parsing(
                                 result, pbar
@@ -826,6 +1265,10 @@ class DefectsParser:
                             parsing_warnings.append(parsing_warning)
                             if result[0] is not None:
                                 parsed_defect_entries.append(result[0])
+                            if self.profile:
+                                folder, profile = result[2]
+                                self.parsing_profile[folder] = profile
+                            prefetcher.folder_parsed()
 
             except Exception as exc:
                 pbar.close()
@@ -833,10 +1276,19 @@ class DefectsParser:
 
             finally:
                 pbar.close()
+                prefetcher.close()
 
             if os.path.exists("voronoi_nodes.json.lock"):  # remove lock file
                 os.remove("voronoi_nodes.json.lock")
 
+        if self.profile:
+            print(
+                f"Defect parsing profile (per stage, over {len(self.parsing_profile)} folders):\n"
+                f"{_summarise_parsing_profile(self.parsing_profile).round(3).to_string()}"
+            )
+            if isinstance(self.profile, str):
+                dumpfn(self.parsing_profile, self.profile)
+
         if parsing_warnings := [
             warning for warning in parsing_warnings if warning  # remove empty strings
         ]:
@@ -1189,6 +1641,107 @@ class DefectsParser:
 
         return result[1] or ""  # failed parsing warning if result[0] is None
 
+    def _get_cache_settings_hash(self, bulk_band_gap_vr: Optional[Union[str, Vasprun]] = None) -> str:
+        """
+        Get a hash of the parsing settings and bulk calculation outputs, which
+        (along with the defect calculation outputs) determine whether a cached
+        ``DefectEntry`` can be reused.
+        """
+        try:
+            doped_version = version("doped")
+        except PackageNotFoundError:  # e.g. running from source without installing
+            doped_version = "unknown"
+
+        cache_settings = {
+            "doped_version": doped_version,
+            "bulk_path": os.path.abspath(self.bulk_path),
+            "bulk_outputs": _get_output_files_fingerprint(self.bulk_path),
+            "bulk_band_gap_vr": getattr(bulk_band_gap_vr, "filename", bulk_band_gap_vr),
+            "dielectric": np.array(self.dielectric).tolist() if self.dielectric is not None else None,
+            "skip_corrections": self.skip_corrections,
+            "error_tolerance": self.error_tolerance,
+            "subfolder": self.subfolder,
+            "parse_projected_eigen": self.parse_projected_eigen,
+            "kwargs": {
+                k: v
+                for k, v in self.kwargs.items()
+                if k not in self.bulk_corrections_data  # bulk corrections data set from bulk outputs
+            },
+        }
+        return hashlib.sha256(json.dumps(cache_settings, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _get_cache_file_and_hash(self, defect_folder: str) -> tuple[str, str]:
+        """
+        Get the parsing cache file path and the hash of the current parsing
+        settings and calculation outputs for ``defect_folder``.
+        """
+        defect_path = os.path.join(self.output_path, defect_folder, self.subfolder)
+        defect_hash = hashlib.sha256(
+            json.dumps(
+                [self._cache_settings_hash, _get_output_files_fingerprint(defect_path)], default=str
+            ).encode()
+        ).hexdigest()
+        return os.path.join(self._cache_dir, f"{defect_folder}.json"), defect_hash  # type: ignore
+
+    def _load_cached_defect_entry(self, defect_folder: str) -> Optional[tuple[DefectEntry, str]]:
+        """
+        Load the parsed ``DefectEntry`` and parsing warnings for
+        ``defect_folder`` from the parsing cache, if present and if the
+        calculation outputs and parsing settings are unchanged, otherwise
+        ``None``.
+        """
+        cache_file, defect_hash = self._get_cache_file_and_hash(defect_folder)
+        if not os.path.exists(cache_file):
+            return None
+
+        with contextlib.suppress(Exception):  # corrupted/incompatible cache files are ignored
+            cached_data = loadfn(cache_file)
+            if cached_data["hash"] == defect_hash:
+                return cached_data["defect_entry"], cached_data["warnings"]
+
+        return None
+
+    def _cache_defect_entry(self, defect_folder: str, defect_entry: DefectEntry, warnings_string: str):
+        """
+        Save the parsed ``DefectEntry`` and parsing warnings for
+        ``defect_folder`` to the parsing cache.
+        """
+        cache_file, defect_hash = self._get_cache_file_and_hash(defect_folder)
+        os.makedirs(self._cache_dir, exist_ok=True)  # type: ignore
+        try:
+            dumpfn(
+                {"hash": defect_hash, "defect_entry": defect_entry, "warnings": warnings_string},
+                cache_file,
+            )
+        except Exception as exc:  # caching is optional, so don't break parsing
+            with contextlib.suppress(OSError):
+                os.remove(cache_file)
+            warnings.warn(
+                f"Could not save parsed {defect_folder} to the parsing cache, got error: {exc!r}"
+            )
+
+    def _profile_folder_parsing(self, folder: str):
+        """
+        Context manager for profiling the parsing of ``folder`` (adding to
+        ``self.parsing_profile[folder]``) if ``self.profile`` is set, otherwise
+        does nothing.
+        """
+        if not self.profile:
+            return contextlib.nullcontext()
+        return _profile_defect_parsing(self.parsing_profile.setdefault(folder, {}))
+
+    def _get_output_files_prefetcher(self, defect_folders: list[str]) -> _OutputFilesPrefetcher:
+        """
+        Get an ``_OutputFilesPrefetcher`` for reading ahead the output files of
+        ``defect_folders`` (in parsing order), with the ``prefetch_buffer``
+        size (no read-ahead if ``prefetch_buffer`` is ``None``).
+        """
+        return _OutputFilesPrefetcher(
+            [os.path.join(self.output_path, folder, self.subfolder) for folder in defect_folders],
+            buffer_size=self.prefetch_buffer * 1e9 if self.prefetch_buffer is not None else None,  # GB
+            dir_index=self._dir_index,
+        )
+
     def _parse_defect_and_handle_warnings(self, defect_folder):
         """
         Process defect and catch warnings along the way, so we can print which
@@ -1210,6 +1763,9 @@ class DefectsParser:
             if not any(warning.message.args[0].startswith(i) for i in ignore_messages)
         )
 
+        if self._cache_dir and parsed_defect_entry is not None:
+            self._cache_defect_entry(defect_folder, parsed_defect_entry, warnings_string)
+
         return parsed_defect_entry, warnings_string
 
     def _parse_single_defect(self, defect_folder):
@@ -1226,6 +1782,7 @@ class DefectsParser:
                 bulk_band_gap_vr=self.bulk_band_gap_vr,
                 oxi_state=self.kwargs.get("oxi_state") if self._bulk_oxi_states else "Undetermined",
                 parse_projected_eigen=self.parse_projected_eigen,
+                dir_index=self._dir_index,
                 **self.kwargs,
             )
 
@@ -1370,12 +1927,34 @@ class DefectsParser:
         )
 
 
+def _get_output_files_fingerprint(path: str) -> list[tuple[str, int, int]]:
+    """
+    Get the names, sizes and modification times (in ns) of the VASP output
+    files used for defect parsing (``vasprun.xml``, ``OUTCAR``, ``LOCPOT`` and
+    ``PROCAR``, including compressed versions) in ``path``, which are used to
+    check whether the calculation outputs have changed, for the
+    ``DefectsParser`` parsing cache.
+    """
+    try:
+        with os.scandir(path) as dir_entries:
+            return sorted(
+                (dir_entry.name, dir_entry.stat().st_size, dir_entry.stat().st_mtime_ns)
+                for dir_entry in dir_entries
+                if dir_entry.is_file()
+                and any(i in dir_entry.name for i in ["vasprun", "OUTCAR", "LOCPOT", "PROCAR"])
+            )
+    except OSError:
+        return []
+
+
+@_profile_parsing_stage("vasprun parsing")
 def _parse_vr_and_poss_procar(
     vr_path: str,
     parse_projected_eigen: Optional[bool] = None,
     output_path: Optional[str] = None,
     label: str = "bulk",
     parse_procar: bool = True,
+    dir_index: Optional[dict] = None,
 ):
     procar = None
 
@@ -1383,26 +1962,28 @@ def _parse_vr_and_poss_procar(
         f"Could not parse eigenvalue data from vasprun.xml.gz files in {label} folder at {output_path}"
     )
 
-    try:
+    try:  # streamed parsing, as only the final ionic step and eigenvalues are needed for defects
         vr = get_vasprun(
             vr_path,
+            streamed=True,
             parse_projected_eigen=parse_projected_eigen is not False,
             parse_eigen=(parse_projected_eigen is not False or label == "bulk"),
         )  # vr.eigenvalues not needed for defects except for vr-only eigenvalue analysis
     except Exception as vr_exc:
-        vr = get_vasprun(vr_path, parse_projected_eigen=False, parse_eigen=label == "bulk")
+        vr = get_vasprun(vr_path, streamed=True, parse_projected_eigen=False, parse_eigen=label == "bulk")
         failed_eig_parsing_warning_message += f", got error:\n{vr_exc}"
 
         if parse_procar:
-            procar_path, multiple = _get_output_files_and_check_if_multiple("PROCAR", output_path)
+            procar_path, multiple = _get_output_files_and_check_if_multiple(
+                "PROCAR", output_path, dir_index
+            )
             if "PROCAR" in procar_path and parse_projected_eigen is not False:
-                try:
-                    procar = get_procar(procar_path)
-
-                except Exception as procar_exc:
+                # PROCAR only parsed for the bands near the band edges later, in eigenvalue analysis:
+                procar = find_archived_fname(procar_path, raise_error=False)
+                if procar is None:
                     failed_eig_parsing_warning_message += (
-                        f"\nThen got the following error when attempting to parse projected eigenvalues "
-                        f"from the defect PROCAR(.gz):\n{procar_exc}"
+                        f"\nThen could not find a PROCAR(.gz) file to parse projected eigenvalues "
+                        f"from, at {procar_path}(.gz/.xz/.bz/.lzma)"
                     )
 
     if vr.projected_eigenvalues is None and procar is None and parse_projected_eigen is True:
@@ -1412,6 +1993,24 @@ def _parse_vr_and_poss_procar(
     return vr, procar if parse_procar else vr
 
 
+def _read_bulk_band_edge_procar(procar_path: str, bulk_vr: Vasprun) -> Union[str, Procar]:
+    """
+    Read the orbital projections for the bulk band edges (i.e. the window of
+    bands spanning the VBM and CBM) from the bulk ``PROCAR`` at
+    ``procar_path``, returning a ``StreamedProcar`` object.
+
+    If this fails (e.g. if the band edges cannot be determined from
+    ``bulk_vr``), ``procar_path`` is returned, so that reading is attempted
+    (and any errors reported) during eigenvalue analysis of each defect.
+    """
+    try:
+        from doped.utils.eigenvalues import _get_bulk_band_edge_window
+
+        return get_procar(procar_path, bands=_get_bulk_band_edge_window(bulk_vr))
+    except Exception:
+        return procar_path
+
+
 class DefectParser:
     def __init__(
         self,
@@ -1461,9 +2060,10 @@ class DefectParser:
                 (``load_FNV_data()``, ``load_eFNV_data()``, ``load_bulk_gap_data()``)
                 ``point_symmetry_from_defect_entry()`` or ``defect_from_structures``,
                 including ``bulk_locpot_dict``, ``bulk_site_potentials``, ``use_MP``,
-                ``mpid``, ``api_key``, ``symprec`` or ``oxi_state``. Primarily used by
-                ``DefectsParser`` to expedite parsing by avoiding reloading bulk data
-                for each defect.
+                ``mpid``, ``api_key``, ``symprec``, ``oxi_state`` or ``dir_index`` (an
+                index of directory contents, to avoid re-listing directories when
+                locating output files). Primarily used by ``DefectsParser`` to expedite
+                parsing by avoiding reloading bulk data for each defect.
         """
         self.defect_entry: DefectEntry = defect_entry
         self.defect_vr = defect_vr
@@ -1479,7 +2079,7 @@ class DefectParser:
         defect_path: str,
         bulk_path: Optional[str] = None,
         bulk_vr: Optional[Vasprun] = None,
-        bulk_procar: Optional[Union["EasyunfoldProcar", Procar]] = None,
+        bulk_procar: Optional[Union[str, "EasyunfoldProcar", Procar]] = None,
         dielectric: Optional[Union[float, int, np.ndarray, list]] = None,
         charge_state: Optional[int] = None,
         initial_defect_structure_path: Optional[str] = None,
@@ -1511,10 +2111,11 @@ class DefectParser:
                 ``pymatgen`` ``Vasprun`` object for the reference bulk supercell
                 calculation, if already loaded (can be supplied to expedite parsing).
                 Default is ``None``.
-            bulk_procar (Procar):
-                ``easyunfold``/``pymatgen`` ``Procar`` object, for the reference bulk
-                supercell calculation if already loaded (can be supplied to expedite
-                parsing). Default is ``None``.
+            bulk_procar (str, Procar):
+                ``easyunfold``/``pymatgen`` ``Procar`` object (or path to the
+                ``PROCAR(.gz)`` file), for the reference bulk supercell calculation
+                if already loaded (can be supplied to expedite parsing). Default is
+                ``None``.
             dielectric (float or int or 3x1 matrix or 3x3 matrix):
                 Ionic + static contributions to the dielectric constant. If not provided,
                 charge corrections cannot be computed and so ``skip_corrections`` will be
@@ -1568,9 +2169,10 @@ class DefectParser:
                 (``load_FNV_data()``, ``load_eFNV_data()``, ``load_bulk_gap_data()``)
                 ``point_symmetry_from_defect_entry()`` or ``defect_from_structures``,
                 including ``bulk_locpot_dict``, ``bulk_site_potentials``, ``use_MP``,
-                ``mpid``, ``api_key``, ``symprec`` or ``oxi_state``. Primarily used by
-                ``DefectsParser`` to expedite parsing by avoiding reloading bulk data
-                for each defect.
+                ``mpid``, ``api_key``, ``symprec``, ``oxi_state`` or ``dir_index`` (an
+                index of directory contents, to avoid re-listing directories when
+                locating output files). Primarily used by ``DefectsParser`` to expedite
+                parsing by avoiding reloading bulk data for each defect.
 
         Return:
             ``DefectParser`` object.
@@ -1584,7 +2186,9 @@ class DefectParser:
 
         if bulk_path is not None and bulk_vr is None:
             # add bulk simple properties
-            bulk_vr_path, multiple = _get_output_files_and_check_if_multiple("vasprun.xml", bulk_path)
+            bulk_vr_path, multiple = _get_output_files_and_check_if_multiple(
+                "vasprun.xml", bulk_path, kwargs.get("dir_index")
+            )
             if multiple:
                 _multiple_files_warning(
                     "vasprun.xml",
@@ -1598,6 +2202,7 @@ class DefectParser:
                 bulk_path,
                 label="bulk",
                 parse_procar=bulk_procar is None,
+                dir_index=kwargs.get("dir_index"),
             )
             if bulk_procar is None and reparsed_bulk_procar is not None:
                 bulk_procar = reparsed_bulk_procar
@@ -1611,7 +2216,7 @@ class DefectParser:
         (
             defect_vr_path,
             multiple,
-        ) = _get_output_files_and_check_if_multiple("vasprun.xml", defect_path)
+        ) = _get_output_files_and_check_if_multiple("vasprun.xml", defect_path, kwargs.get("dir_index"))
         if multiple:
             _multiple_files_warning(
                 "vasprun.xml",
@@ -1621,7 +2226,11 @@ class DefectParser:
             )
 
         defect_vr, defect_procar = _parse_vr_and_poss_procar(
-            defect_vr_path, parse_projected_eigen, defect_path, label="defect"
+            defect_vr_path,
+            parse_projected_eigen,
+            defect_path,
+            label="defect",
+            dir_index=kwargs.get("dir_index"),
         )
         parse_projected_eigen = defect_procar is not None or defect_vr.projected_eigenvalues is not None
 
@@ -1692,66 +2301,69 @@ class DefectParser:
                 return loadfn(os.path.join(bulk_path, "voronoi_nodes.json"))
             return {}
 
-        if os.path.exists("voronoi_nodes.json.lock"):
-            with FileLock("voronoi_nodes.json.lock"):
+        with _profile_parsing_stage("site matching"):
+            if os.path.exists("voronoi_nodes.json.lock"):
+                with FileLock("voronoi_nodes.json.lock"):
+                    bulk_voronoi_node_dict = _read_bulk_voronoi_node_dict(bulk_path)
+            else:
                 bulk_voronoi_node_dict = _read_bulk_voronoi_node_dict(bulk_path)
-        else:
-            bulk_voronoi_node_dict = _read_bulk_voronoi_node_dict(bulk_path)
 
-        # Can specify initial defect structure (to help find the defect site if we have a very distorted
-        # final structure), but regardless try using the final structure (from defect OUTCAR) first:
-        try:
-            (
-                defect,
-                defect_site,  # _relaxed_ defect site in supercell (if substitution/interstitial)
-                defect_site_in_bulk,  # bulk site for vacancies/substitutions, relaxed defect site
-                # w/interstitials
-                defect_site_index,
-                bulk_site_index,
-                guessed_initial_defect_structure,
-                unrelaxed_defect_structure,
-                bulk_voronoi_node_dict,
-            ) = defect_from_structures(
-                bulk_supercell,
-                defect_structure.copy(),
-                return_all_info=True,
-                bulk_voronoi_node_dict=bulk_voronoi_node_dict,
-                oxi_state=kwargs.get("oxi_state"),
-            )
+            # Can specify initial defect structure (to help find the defect site if we have a very
+            # distorted final structure), but regardless try using the final structure (from defect
+            # OUTCAR) first:
+            try:
+                (
+                    defect,
+                    defect_site,  # _relaxed_ defect site in supercell (if substitution/interstitial)
+                    defect_site_in_bulk,  # bulk site for vacancies/substitutions, relaxed defect site
+                    # w/interstitials
+                    defect_site_index,
+                    bulk_site_index,
+                    guessed_initial_defect_structure,
+                    unrelaxed_defect_structure,
+                    bulk_voronoi_node_dict,
+                ) = defect_from_structures(
+                    bulk_supercell,
+                    defect_structure.copy(),
+                    return_all_info=True,
+                    bulk_voronoi_node_dict=bulk_voronoi_node_dict,
+                    oxi_state=kwargs.get("oxi_state"),
+                )
 
-        except RuntimeError:
-            if not initial_defect_structure_path:
-                raise
-
-            defect_structure_for_ID = Poscar.from_file(initial_defect_structure_path).structure.copy()
-            (
-                defect,
-                defect_site_in_initial_struct,
-                defect_site_in_bulk,  # bulk site for vac/sub, relaxed defect site w/interstitials
-                defect_site_index,  # in this initial_defect_structure
-                bulk_site_index,
-                guessed_initial_defect_structure,
-                unrelaxed_defect_structure,
-                bulk_voronoi_node_dict,
-            ) = defect_from_structures(
-                bulk_supercell,
-                defect_structure_for_ID,
-                return_all_info=True,
-                bulk_voronoi_node_dict=bulk_voronoi_node_dict,
-                oxi_state=kwargs.get("oxi_state"),
-            )
+            except RuntimeError:
+                if not initial_defect_structure_path:
+                    raise
+
+                defect_structure_for_ID = Poscar.from_file(initial_defect_structure_path).structure.copy()
+                (
+                    defect,
+                    defect_site_in_initial_struct,
+                    defect_site_in_bulk,  # bulk site for vac/sub, relaxed defect site w/interstitials
+                    defect_site_index,  # in this initial_defect_structure
+                    bulk_site_index,
+                    guessed_initial_defect_structure,
+                    unrelaxed_defect_structure,
+                    bulk_voronoi_node_dict,
+                ) = defect_from_structures(
+                    bulk_supercell,
+                    defect_structure_for_ID,
+                    return_all_info=True,
+                    bulk_voronoi_node_dict=bulk_voronoi_node_dict,
+                    oxi_state=kwargs.get("oxi_state"),
+                )
 
-            # then try get defect_site in final structure:
-            # need to check that it's the correct defect site and hasn't been reordered/changed compared to
-            # the initial_defect_structure used here -> check same element and distance reasonable:
-            defect_site = defect_site_in_initial_struct
+                # then try get defect_site in final structure:
+                # need to check that it's the correct defect site and hasn't been reordered/changed
+                # compared to the initial_defect_structure used here -> check same element and distance
+                # reasonable:
+                defect_site = defect_site_in_initial_struct
 
-            if defect.defect_type != core.DefectType.Vacancy:
-                final_defect_site = defect_structure[defect_site_index]
-                if (
-                    defect_site_in_initial_struct.specie.symbol == final_defect_site.specie.symbol
-                ) and final_defect_site.distance(defect_site_in_initial_struct) < 2:
-                    defect_site = final_defect_site
+                if defect.defect_type != core.DefectType.Vacancy:
+                    final_defect_site = defect_structure[defect_site_index]
+                    if (
+                        defect_site_in_initial_struct.specie.symbol == final_defect_site.specie.symbol
+                    ) and final_defect_site.distance(defect_site_in_initial_struct) < 2:
+                        defect_site = final_defect_site
 
         calculation_metadata["guessed_initial_defect_structure"] = guessed_initial_defect_structure
         calculation_metadata["defect_site_index"] = defect_site_index
@@ -1790,44 +2402,45 @@ class DefectParser:
             degeneracy_factors=degeneracy_factors,
         )
 
-        bulk_supercell_symm_ops = _get_sga(
-            defect_entry.defect.structure, symprec=0.01
-        ).get_symmetry_operations()
-        if defect.defect_type == core.DefectType.Interstitial:
-            # site multiplicity is automatically computed for vacancies and substitutions (much easier),
-            # but not interstitials
-            defect_entry.defect.multiplicity = len(
-                _get_all_equiv_sites(
-                    _get_defect_supercell_bulk_site_coords(defect_entry),
-                    defect_entry.defect.structure,
-                    symm_ops=bulk_supercell_symm_ops,
-                    symprec=0.01,
-                    dist_tol=0.01,
+        with _profile_parsing_stage("symmetry & degeneracy"):
+            bulk_supercell_symm_ops = _get_sga(
+                defect_entry.defect.structure, symprec=0.01
+            ).get_symmetry_operations()
+            if defect.defect_type == core.DefectType.Interstitial:
+                # site multiplicity is automatically computed for vacancies and substitutions (much
+                # easier), but not interstitials
+                defect_entry.defect.multiplicity = len(
+                    _get_all_equiv_sites(
+                        _get_defect_supercell_bulk_site_coords(defect_entry),
+                        defect_entry.defect.structure,
+                        symm_ops=bulk_supercell_symm_ops,
+                        symprec=0.01,
+                        dist_tol=0.01,
+                    )
                 )
-            )
 
-        # get orientational degeneracy
-        relaxed_point_group, periodicity_breaking = point_symmetry_from_defect_entry(
-            defect_entry,
-            relaxed=True,
-            verbose=False,
-            return_periodicity_breaking=True,
-            symprec=kwargs.get("symprec"),
-        )  # relaxed so defect symm_ops
-        bulk_site_point_group = point_symmetry_from_defect_entry(
-            defect_entry,
-            symm_ops=bulk_supercell_symm_ops,  # unrelaxed so bulk symm_ops
-            relaxed=False,
-            symprec=0.01,  # same symprec used w/interstitial multiplicity for consistency
-        )
-        with contextlib.suppress(ValueError):
-            defect_entry.degeneracy_factors["orientational degeneracy"] = get_orientational_degeneracy(
-                relaxed_point_group=relaxed_point_group,
-                bulk_site_point_group=bulk_site_point_group,
+            # get orientational degeneracy
+            relaxed_point_group, periodicity_breaking = point_symmetry_from_defect_entry(
+                defect_entry,
+                relaxed=True,
+                verbose=False,
+                return_periodicity_breaking=True,
+                symprec=kwargs.get("symprec"),
+            )  # relaxed so defect symm_ops
+            bulk_site_point_group = point_symmetry_from_defect_entry(
+                defect_entry,
+                symm_ops=bulk_supercell_symm_ops,  # unrelaxed so bulk symm_ops
+                relaxed=False,
+                symprec=0.01,  # same symprec used w/interstitial multiplicity for consistency
             )
-        defect_entry.calculation_metadata["relaxed point symmetry"] = relaxed_point_group
-        defect_entry.calculation_metadata["bulk site symmetry"] = bulk_site_point_group
-        defect_entry.calculation_metadata["periodicity_breaking_supercell"] = periodicity_breaking
+            with contextlib.suppress(ValueError):
+                defect_entry.degeneracy_factors["orientational degeneracy"] = get_orientational_degeneracy(
+                    relaxed_point_group=relaxed_point_group,
+                    bulk_site_point_group=bulk_site_point_group,
+                )
+            defect_entry.calculation_metadata["relaxed point symmetry"] = relaxed_point_group
+            defect_entry.calculation_metadata["bulk site symmetry"] = bulk_site_point_group
+            defect_entry.calculation_metadata["periodicity_breaking_supercell"] = periodicity_breaking
 
         if bulk_voronoi_node_dict and bulk_path:  # save to bulk folder for future expedited parsing:
             if os.path.exists("voronoi_nodes.json.lock"):
@@ -1852,20 +2465,22 @@ class DefectParser:
 
         if parse_projected_eigen is not False:
             try:
-                dp.defect_entry._load_and_parse_eigenvalue_data(
-                    bulk_vr=bulk_vr,
-                    bulk_procar=bulk_procar,
-                    defect_vr=defect_vr,
-                    defect_procar=defect_procar,
-                )
+                with _profile_parsing_stage("eigenvalue analysis"):
+                    dp.defect_entry._load_and_parse_eigenvalue_data(
+                        bulk_vr=bulk_vr,
+                        bulk_procar=bulk_procar,
+                        defect_vr=defect_vr,
+                        defect_procar=defect_procar,
+                    )
             except Exception as exc:
                 if parse_projected_eigen is True:  # otherwise no warning
                     warnings.warn(f"Projected eigenvalues/orbitals parsing failed with error: {exc!r}")
 
         defect_vr.projected_eigenvalues = None  # no longer needed, delete to reduce memory demand
         defect_vr.eigenvalues = None  # no longer needed, delete to reduce memory demand
-        dp.load_and_check_calculation_metadata()  # Load standard defect metadata
-        dp.load_bulk_gap_data(bulk_band_gap_vr=bulk_band_gap_vr)  # Load band gap data
+        with _profile_parsing_stage("calculation metadata"):
+            dp.load_and_check_calculation_metadata()  # Load standard defect metadata
+            dp.load_bulk_gap_data(bulk_band_gap_vr=bulk_band_gap_vr)  # Load band gap data
 
         if not skip_corrections and defect_entry.charge_state != 0:
             # no finite-size charge corrections by default for neutral defects
@@ -1909,6 +2524,7 @@ class DefectParser:
 
         return dp
 
+    @_profile_parsing_stage("charge corrections")
     def _check_and_load_appropriate_charge_correction(self):
         skip_corrections = False
         dielectric = self.defect_entry.calculation_metadata["dielectric"]
@@ -2025,6 +2641,7 @@ class DefectParser:
 
         return skip_corrections
 
+    @_profile_parsing_stage("LOCPOT loading")
     def load_FNV_data(self, bulk_locpot_dict=None):
         """
         Load metadata required for performing Freysoldt correction (i.e. LOCPOT
@@ -2061,7 +2678,7 @@ class DefectParser:
         )
 
         defect_locpot_path, multiple = _get_output_files_and_check_if_multiple(
-            "LOCPOT", self.defect_entry.calculation_metadata["defect_path"]
+            "LOCPOT", self.defect_entry.calculation_metadata["defect_path"], self.kwargs.get("dir_index")
         )
         if multiple:
             _multiple_files_warning(
@@ -2070,8 +2687,7 @@ class DefectParser:
                 defect_locpot_path,
                 dir_type="defect",
             )
-        defect_locpot = get_locpot(defect_locpot_path)
-        defect_locpot_dict = {str(k): defect_locpot.get_average_along_axis(k) for k in [0, 1, 2]}
+        defect_locpot_dict = get_locpot_planar_averages(defect_locpot_path)
 
         self.defect_entry.calculation_metadata.update(
             {
@@ -2082,6 +2698,7 @@ class DefectParser:
 
         return bulk_locpot_dict
 
+    @_profile_parsing_stage("OUTCAR loading")
     def load_eFNV_data(self, bulk_site_potentials=None):
         """
         Load metadata required for performing Kumagai correction (i.e. atomic
@@ -2121,7 +2738,7 @@ class DefectParser:
             )
 
         defect_outcar_path, multiple = _get_output_files_and_check_if_multiple(
-            "OUTCAR", self.defect_entry.calculation_metadata["defect_path"]
+            "OUTCAR", self.defect_entry.calculation_metadata["defect_path"], self.kwargs.get("dir_index")
         )
         if multiple:
             _multiple_files_warning(
@@ -2130,12 +2747,12 @@ class DefectParser:
                 defect_outcar_path,
                 dir_type="defect",
             )
-        defect_outcar = get_outcar(defect_outcar_path)
+        defect_core_potentials = get_core_potentials(defect_outcar_path)
 
-        if defect_outcar.electrostatic_potential is None:
+        if defect_core_potentials is None:
             _raise_incomplete_outcar_error(defect_outcar_path, dir_type="defect")
 
-        defect_site_potentials = -1 * np.array(defect_outcar.electrostatic_potential)
+        defect_site_potentials = -1 * defect_core_potentials
 
         self.defect_entry.calculation_metadata.update(
             {
@@ -2381,6 +2998,7 @@ class DefectParser:
         }
         self.defect_entry.calculation_metadata.update(gap_calculation_metadata)
 
+    @_profile_parsing_stage("charge corrections")
     def apply_corrections(self):
         """
         Get defect corrections and warn if likely to be inappropriate.
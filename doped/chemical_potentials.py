@@ -8,6 +8,7 @@ import contextlib
 import copy
 import os
 import warnings
+from itertools import combinations
 from pathlib import Path, PurePath
 
 import numpy as np
@@ -19,6 +20,7 @@ from pymatgen.entries.computed_entries import ComputedStructureEntry
 from pymatgen.ext.matproj import MPRester
 from pymatgen.io.vasp.inputs import Kpoints
 from pymatgen.io.vasp.outputs import UnconvergedVASPWarning
+from scipy.spatial import Delaunay
 from tqdm import tqdm
 
 from doped import _ignore_pmg_warnings
@@ -1937,6 +1939,107 @@ def get_X_poor_limit(X: str, chempots: dict):
     return X_poor_limit
 
 
+def get_chempot_grid(chempots: dict, n_points: int = 10, method: str = "simplex") -> pd.DataFrame:
+    """
+    Sample points within the chemical potential stability region (polytope)
+    of the host, spanned by the chemical potential limits (vertices) in the
+    input chempots dict.
+
+    The limits are projected onto the subspace that they span (e.g. a line
+    segment for binary hosts, a polygon for ternaries), within which points are
+    sampled either on a barycentric lattice within each simplex of a Delaunay
+    triangulation of the limits (``method = "simplex"``), or on a regular grid
+    in the chemical potentials of the first independent elements, clipped to
+    the stability region (``method = "grid"``, for which the limits themselves
+    are also included).
+
+    Note that chemical potentials of any extrinsic species are linearly
+    interpolated between their values at the limits.
+
+    Args:
+        chempots (dict):
+            The chemical potential limits dict, as returned by
+            ``CompetingPhasesAnalyzer.chempots``.
+        n_points (int):
+            Number of points to sample along each edge of the simplices
+            (``method = "simplex"``) or each dimension of the grid
+            (``method = "grid"``), including the end points. (Default: 10)
+        method (str):
+            Either ``"simplex"`` (default) or ``"grid"``; see above.
+
+    Returns:
+        ``pandas`` ``DataFrame`` of the sampled chemical potentials, with one
+        column per element. These are the formal chemical potentials (relative to
+        the elemental reference phases) if ``"limits_wrt_el_refs"`` is present in
+        ``chempots``, otherwise the absolute chemical potentials in ``"limits"``.
+    """
+    if method not in ["simplex", "grid"]:
+        raise ValueError(f"`method` must be either 'simplex' or 'grid', got: {method}")
+    if n_points < 2:
+        raise ValueError(f"`n_points` must be at least 2, got: {n_points}")
+
+    limits = chempots["limits_wrt_el_refs"] if "limits_wrt_el_refs" in chempots else chempots["limits"]
+    elements = list(next(iter(limits.values())).keys())
+    vertices = np.array([[limit_dict[el] for el in elements] for limit_dict in limits.values()])
+
+    # project vertices onto the (affine) subspace which they span:
+    centroid = vertices.mean(axis=0)
+    _u, singular_values, v_transpose = np.linalg.svd(vertices - centroid)
+    basis = v_transpose[: np.sum(singular_values > 1e-8 * max(1, np.max(singular_values)))].T
+    projected_vertices = (vertices - centroid) @ basis
+    dimension = basis.shape[1]
+
+    if dimension == 0:  # single point
+        projected_points = np.zeros((1, 0))
+    elif dimension == 1:  # line segment
+        projected_points = np.linspace(
+            projected_vertices.min(), projected_vertices.max(), n_points
+        ).reshape(-1, 1)
+    else:
+        triangulation = Delaunay(projected_vertices)
+        if method == "simplex":
+            barycentric_coords = np.array(  # all non-negative integer tuples summing to n_points - 1
+                [
+                    np.diff([-1, *dividers, n_points + dimension - 1]) - 1
+                    for dividers in combinations(range(n_points + dimension - 1), dimension)
+                ]
+            ) / (n_points - 1)
+            projected_points = np.concatenate(
+                [barycentric_coords @ projected_vertices[simplex] for simplex in triangulation.simplices]
+            )
+        else:  # regular grid in the chemical potentials of the first independent elements:
+            grid_element_indices: list[int] = []
+            for i in range(len(elements)):
+                if np.linalg.matrix_rank(basis[[*grid_element_indices, i]], tol=1e-8) > len(
+                    grid_element_indices
+                ):
+                    grid_element_indices.append(i)
+                if len(grid_element_indices) == dimension:
+                    break
+
+            grid_axes = [
+                np.linspace(vertices[:, i].min(), vertices[:, i].max(), n_points)
+                for i in grid_element_indices
+            ]
+            grid_points = np.stack(np.meshgrid(*grid_axes, indexing="ij"), axis=-1).reshape(-1, dimension)
+            projected_grid_points = np.linalg.solve(
+                basis[grid_element_indices], (grid_points - centroid[grid_element_indices]).T
+            ).T
+            projected_points = np.concatenate(
+                [
+                    projected_vertices,
+                    projected_grid_points[
+                        triangulation.find_simplex(projected_grid_points, tol=1e-8) >= 0
+                    ],
+                ]
+            )
+
+    points = centroid + projected_points @ basis.T
+    _unique_points, unique_indices = np.unique(np.round(points, 8), axis=0, return_index=True)
+
+    return pd.DataFrame(points[np.sort(unique_indices)], columns=elements)
+
+
 def _move_dict_to_start(data, key, value):
     for index, item in enumerate(data):
         if key in item and item[key] == value:
@@ -602,11 +602,11 @@ class DefectEntry(thermo.DefectEntry):
         if self.calculation_metadata.get("eigenvalue_data") is not None and not force_reparse:
             return
 
-        from doped.utils.eigenvalues import _parse_procar, get_band_edge_info
+        from doped.utils.eigenvalues import get_band_edge_info
         from doped.utils.parsing import (
             _get_output_files_and_check_if_multiple,
             _multiple_files_warning,
-            get_procar,
+            find_archived_fname,
             get_vasprun,
         )
 
@@ -644,10 +644,6 @@ class DefectEntry(thermo.DefectEntry):
                     f"{path}. Required for eigenvalue analysis!"
                 )
 
-            # try load procar data, to see if projected eigenvalues are available:
-            if procar is not None and vr.projected_eigenvalues is None:
-                procar = _parse_procar(procar)  # noqa: PLW2901
-
             if procar is None and path is not None and vr.projected_eigenvalues is None:
                 # no procar, try parse from directory:
                 try:
@@ -659,7 +655,9 @@ class DefectEntry(thermo.DefectEntry):
                             procar_path,
                             dir_type=label,
                         )
-                    procar = get_procar(procar_path)  # noqa: PLW2901
+                    # only the projections for bands near the band edges are parsed from the PROCAR, in
+                    # ``get_band_edge_info``:
+                    procar = find_archived_fname(procar_path)  # noqa: PLW2901
 
                 except (FileNotFoundError, IsADirectoryError):
                     procar = None  # noqa: PLW2901
@@ -37,16 +37,20 @@ eFNV) were developed, they should be used here.
 
 import os
 import warnings
-from typing import Optional, Union
+from copy import copy
+from multiprocessing import Pool, cpu_count
+from typing import Any, Callable, Optional, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 from matplotlib.lines import Line2D
 from monty.json import MontyDecoder
 from pymatgen.analysis.defects.corrections import freysoldt
-from pymatgen.analysis.defects.utils import CorrectionResult
+from pymatgen.analysis.defects.utils import CorrectionResult, QModel
 from pymatgen.core.periodic_table import Element
 from pymatgen.io.vasp.outputs import Locpot, Outcar
+from scipy.special import erfc
 from shakenbreak.plotting import _install_custom_font
 
 from doped.analysis import _convert_dielectric_to_tensor
@@ -54,7 +58,8 @@ from doped.utils.parsing import (
     _get_bulk_supercell,
     _get_defect_supercell,
     _get_defect_supercell_bulk_site_coords,
-    get_locpot,
+    get_core_potentials,
+    get_locpot_planar_averages,
     get_outcar,
 )
 from doped.utils.plotting import _get_backend, format_defect_name
@@ -84,6 +89,184 @@ def _monty_decode_nested_dicts(d):
                 print(f"Failed to decode {key} with error {exc!r}")
 
 
+# cache of charge-correction terms which depend only on the supercell lattice, dielectric and
+# accuracy settings (e.g. Ewald sums), so these are computed once per supercell rather than for
+# every defect and charge state:
+_CORRECTION_CACHE_SIZE = 32
+_correction_cache: dict[tuple, Any] = {}
+
+
+def clear_correction_cache():
+    """
+    Clear the cache of supercell charge-correction terms (Ewald objects and
+    lattice energies for the Kumagai (eFNV) correction, and point-charge
+    energies for the Freysoldt (FNV) correction).
+    """
+    _correction_cache.clear()
+
+
+def _array_cache_key(array, decimals: int = 8) -> tuple:
+    """
+    Get a hashable cache key for a numerical array (e.g. lattice matrix or
+    dielectric tensor), rounded to ``decimals`` decimal places.
+    """
+    return tuple(np.round(np.asarray(array, dtype=float), decimals).ravel().tolist())
+
+
+def _get_cached_correction_term(key: tuple, func: Callable) -> Any:
+    """
+    Return the cached value for ``key`` from the charge-correction cache,
+    computing it with ``func()`` (and caching it) if not already present.
+    The oldest entries are evicted once the cache exceeds
+    ``_CORRECTION_CACHE_SIZE``.
+    """
+    if key not in _correction_cache:
+        if len(_correction_cache) >= _CORRECTION_CACHE_SIZE:
+            _correction_cache.pop(next(iter(_correction_cache)))
+        _correction_cache[key] = func()
+    return _correction_cache[key]
+
+
+def _get_cached_ewald(lattice_matrix, dielectric_tensor, accuracy: float):
+    """
+    Get the ``pydefect`` ``Ewald`` object for the given supercell lattice,
+    dielectric tensor and accuracy, from the charge-correction cache if
+    present.
+    """
+    from pydefect.corrections.ewald import Ewald
+
+    key = ("ewald", _array_cache_key(lattice_matrix), _array_cache_key(dielectric_tensor), accuracy)
+    return _get_cached_correction_term(
+        key, lambda: Ewald(lattice_matrix, dielectric_tensor, accuracy=accuracy)
+    )
+
+
+def _get_cached_ewald_lattice_energy(lattice_matrix, dielectric_tensor, accuracy: float) -> float:
+    """
+    Get the (unit charge) Ewald lattice energy for the given supercell
+    lattice, dielectric tensor and accuracy, from the charge-correction cache
+    if present. The point-charge energy for charge ``q`` is then simply
+    ``q**2`` times this.
+    """
+    key = (
+        "ewald_lattice_energy",
+        _array_cache_key(lattice_matrix),
+        _array_cache_key(dielectric_tensor),
+        accuracy,
+    )
+    return _get_cached_correction_term(
+        key, lambda: _get_cached_ewald(lattice_matrix, dielectric_tensor, accuracy).lattice_energy
+    )
+
+
+def _get_cached_freysoldt_es_corr(
+    lattice, q: float, dielectric: float, q_model, energy_cutoff: float, mad_tol: float, step: float
+) -> float:
+    """
+    Get the Freysoldt (FNV) point-charge energy (from ``perform_es_corr`` in
+    ``pymatgen.analysis.defects.corrections.freysoldt``) for the given
+    supercell lattice, charge, dielectric constant, charge model and accuracy
+    settings, from the charge-correction cache if present. This only depends
+    on ``q**2``, so is only computed once per supercell and charge magnitude.
+    """
+    key = (
+        "freysoldt_es_corr",
+        _array_cache_key(lattice.matrix),
+        round(float(q) ** 2, 8),
+        round(float(dielectric), 8),
+        tuple(sorted((k, str(v)) for k, v in vars(q_model).items())),
+        energy_cutoff,
+        mad_tol,
+        step,
+    )
+    return _get_cached_correction_term(
+        key,
+        lambda: freysoldt.perform_es_corr(
+            lattice=lattice,
+            q=q,
+            dielectric=dielectric,
+            q_model=q_model,
+            energy_cutoff=energy_cutoff,
+            mad_tol=mad_tol,
+            step=step,
+        ),
+    )
+
+
+def _get_freysoldt_correction_result(
+    q: int,
+    dielectric: np.ndarray,
+    defect_locpot: Union[Locpot, dict],
+    bulk_locpot: Union[Locpot, dict],
+    defect_frac_coords: np.ndarray,
+    lattice=None,
+    energy_cutoff: float = 520,
+    mad_tol: float = 1e-4,
+    q_model: Optional[QModel] = None,
+    step: float = 1e-4,
+) -> CorrectionResult:
+    """
+    Compute the Freysoldt (FNV) correction as in ``get_freysoldt_correction``
+    from ``pymatgen.analysis.defects.corrections.freysoldt``, but with the
+    point-charge energy taken from the charge-correction cache (see
+    ``_get_cached_freysoldt_es_corr``).
+    """
+    dielectric = float(np.mean(np.diagonal(dielectric)))  # isotropic correction
+    q_model = QModel() if q_model is None else q_model
+
+    if isinstance(defect_locpot, dict):
+        defect_locpot = {int(k): v for k, v in defect_locpot.items()}
+        list_defect_plnr_avg_esp = [defect_locpot[i] for i in range(3)]
+        list_axis_grid = [
+            np.linspace(0, lattice.abc[i], len(list_defect_plnr_avg_esp[i])) for i in range(3)
+        ]
+    else:
+        lattice = defect_locpot.structure.lattice.copy()
+        list_defect_plnr_avg_esp = [defect_locpot.get_average_along_axis(i) for i in range(3)]
+        list_axis_grid = [defect_locpot.get_axis_grid(i) for i in range(3)]
+
+    if isinstance(bulk_locpot, dict):
+        bulk_locpot = {int(k): v for k, v in bulk_locpot.items()}
+        list_bulk_plnr_avg_esp = [bulk_locpot[i] for i in range(3)]
+    else:
+        list_bulk_plnr_avg_esp = [bulk_locpot.get_average_along_axis(i) for i in range(3)]
+
+    es_corr = _get_cached_freysoldt_es_corr(
+        lattice, q, dielectric, q_model, energy_cutoff=energy_cutoff, mad_tol=mad_tol, step=step
+    )
+
+    alignment_corrs = {}
+    plot_data = {}
+    for axis in range(3):
+        alignment_corrs[axis], plot_data[axis] = freysoldt.perform_pot_corr(
+            axis_grid=list_axis_grid[axis],
+            pureavg=list_bulk_plnr_avg_esp[axis],
+            defavg=list_defect_plnr_avg_esp[axis],
+            lattice=lattice,
+            q=q,
+            defect_frac_coords=defect_frac_coords,
+            axis=axis,
+            dielectric=dielectric,
+            q_model=q_model,
+            mad_tol=mad_tol,
+            widthsample=1.0,
+        )
+
+    mean_alignment = np.mean(list(alignment_corrs.values()))
+    pot_corr = mean_alignment * q
+
+    return CorrectionResult(
+        correction_energy=es_corr + pot_corr,
+        metadata={
+            "plot_data": plot_data,
+            "electrostatic": es_corr,
+            "alignments": alignment_corrs,
+            "mean_alignments": mean_alignment,
+            "potential": pot_corr,
+        },
+    )
+
+
 def _check_if_None_and_raise_error_if_so(var, var_name, display_name):
     if var is None:
         raise ValueError(
@@ -100,8 +283,8 @@ def _get_and_check_metadata(entry, key, display_name):
 
 def _check_if_str_and_get_pmg_obj(locpot_or_outcar, obj_type="locpot"):
     if isinstance(locpot_or_outcar, str):
-        if obj_type == "locpot":
-            return get_locpot(locpot_or_outcar)
+        if obj_type == "locpot":  # only planar averages needed, so stream these rather than full Locpot
+            return get_locpot_planar_averages(locpot_or_outcar)
         return get_outcar(locpot_or_outcar)
 
     if not isinstance(locpot_or_outcar, (Locpot, Outcar, dict)):
@@ -113,6 +296,18 @@ def _check_if_str_and_get_pmg_obj(locpot_or_outcar, obj_type="locpot"):
     return locpot_or_outcar
 
 
+def _get_site_potentials_from_outcar(outcar, dir_type="bulk"):
+    if isinstance(outcar, str):  # only core potentials needed, so tail-scan these rather than full Outcar
+        core_potentials = get_core_potentials(outcar)
+    else:
+        core_potentials = _check_if_str_and_get_pmg_obj(outcar, obj_type="outcar").electrostatic_potential
+
+    if core_potentials is None:
+        _raise_incomplete_outcar_error(outcar, dir_type=dir_type)
+
+    return -1 * np.array(core_potentials)
+
+
 def get_freysoldt_correction(
     defect_entry,
     dielectric: Optional[Union[float, int, np.ndarray, list]] = None,
@@ -175,9 +370,9 @@ def get_freysoldt_correction(
             (default), uses the default doped style
             (from ``doped/utils/doped.mplstyle``).
         **kwargs:
-            Additional kwargs to pass to
-            pymatgen.analysis.defects.corrections.freysoldt.get_freysoldt_correction
-            (e.g. energy_cutoff, mad_tol, q_model, step).
+            Additional kwargs to pass to the
+            pymatgen.analysis.defects.corrections.freysoldt correction functions
+            (i.e. energy_cutoff, mad_tol, q_model, step).
 
     Returns:
         CorrectionResults (summary of the corrections applied and metadata), and
@@ -200,12 +395,12 @@ def get_freysoldt_correction(
     defect_locpot = _check_if_str_and_get_pmg_obj(defect_locpot, obj_type="locpot")
     bulk_locpot = _check_if_str_and_get_pmg_obj(bulk_locpot, obj_type="locpot")
 
-    fnv_correction = freysoldt.get_freysoldt_correction(
+    fnv_correction = _get_freysoldt_correction_result(  # point-charge energy computed once per supercell
         q=defect_entry.charge_state,
         dielectric=dielectric,
         defect_locpot=defect_locpot,
         bulk_locpot=bulk_locpot,
-        lattice=_get_defect_supercell(defect_entry).lattice if isinstance(defect_locpot, dict) else None,
+        lattice=(_get_defect_supercell(defect_entry).lattice if isinstance(defect_locpot, dict) else None),
         defect_frac_coords=_get_defect_supercell_bulk_site_coords(
             defect_entry
         ),  # _relaxed_ defect location in supercell
@@ -308,87 +503,74 @@ def plot_FNV(plot_data, title=None, ax=None, style_file=None):
         return ax
 
 
-def get_kumagai_correction(
+def _get_ewald_site_potentials(ewald, rel_coords, max_chunk_size: int = 2_000_000) -> np.ndarray:
+    """
+    Batched evaluation of ``pydefect`` ``Ewald.atomic_site_potential()``
+    for multiple sites at once.
+
+    Uses the same real-space and reciprocal-space lattice vector sets as
+    ``pydefect``, but evaluates the sums with array operations over all sites
+    (rather than a Python loop over each lattice vector for each site),
+    processing sites in chunks to bound memory usage.
+
+    Args:
+        ewald (Ewald):
+            ``pydefect`` ``Ewald`` object for the supercell lattice and
+            dielectric tensor.
+        rel_coords (array_like):
+            Nx3 array of fractional coordinates of the sites, relative to
+            the defect position.
+        max_chunk_size (int):
+            Maximum number of site / lattice-vector pairs to evaluate at once.
+            Default is 2,000,000.
+
+    Returns:
+        np.ndarray of the Ewald point-charge potentials at each site (in the
+        same units as ``Ewald.atomic_site_potential()``).
+    """
+    rel_coords = np.atleast_2d(np.asarray(rel_coords, dtype=float))
+    lattice = np.asarray(ewald.lattice)
+    cart_coords = rel_coords @ lattice
+
+    # real-space sum; r = (n - s) @ lattice = n @ lattice - s @ lattice:
+    r_lattice = ewald.xyz(ewald.r_vector_nums) @ lattice
+    chunk_size = max(1, max_chunk_size // len(r_lattice))
+    real_part = np.empty(len(rel_coords))
+    for i in range(0, len(rel_coords), chunk_size):
+        r_vecs = r_lattice[np.newaxis, :, :] - cart_coords[i : i + chunk_size, np.newaxis, :]
+        root_r_inv_epsilon_r = np.sqrt(np.einsum("sni,ij,snj->sn", r_vecs, ewald.epsilon_inv, r_vecs))
+        real_part[i : i + chunk_size] = np.sum(
+            erfc(ewald.mod_ewald_param * root_r_inv_epsilon_r) / root_r_inv_epsilon_r, axis=1
+        )
+    real_part /= 4 * np.pi * ewald.root_epsilon
+
+    # reciprocal-space sum:
+    g_lattice = ewald.g_lattice_set()
+    g_epsilon_g = np.einsum("ni,ij,nj->n", g_lattice, ewald.dielectric_tensor, g_lattice)
+    g_weights = np.exp(-g_epsilon_g / 4 / ewald.mod_ewald_param**2) / g_epsilon_g
+    chunk_size = max(1, max_chunk_size // len(g_lattice))
+    rec_part = np.empty(len(rel_coords))
+    for i in range(0, len(rel_coords), chunk_size):
+        rec_part[i : i + chunk_size] = np.cos(cart_coords[i : i + chunk_size] @ g_lattice.T) @ g_weights
+    rec_part /= ewald.volume
+
+    return real_part + rec_part + ewald.diff_pot
+
+
+def _get_efnv_correction_and_site_indices(
     defect_entry,
     dielectric: Optional[Union[float, int, np.ndarray, list]] = None,
     defect_region_radius: Optional[float] = None,
     excluded_indices: Optional[list[int]] = None,
     defect_outcar: Optional[Union[str, Outcar]] = None,
     bulk_outcar: Optional[Union[str, Outcar]] = None,
-    plot: bool = False,
-    filename: Optional[str] = None,
-    verbose: bool = True,
-    style_file: Optional[str] = None,
     **kwargs,
-) -> CorrectionResult:
+):
     """
-    Function to compute the Kumagai (eFNV) finite-size charge correction for
-    the input defect_entry. Compatible with both isotropic/cubic and
-    anisotropic systems.
-
-    This function `does not` add the correction to ``defect_entry.corrections``
-    (but the defect_entry.get_kumagai_correction method does).
-    If this correction is used, please cite the Kumagai & Oba paper:
-    10.1103/PhysRevB.89.195205
-
-    Typically for reasonably well-converged supercell sizes, the default
-    ``defect_region_radius`` works perfectly well. However, for certain materials
-    at small/intermediate supercell sizes, you may want to adjust this (and/or
-    ``excluded_indices``) to ensure the best sampling of the plateau region away
-    from the defect position - ``doped`` should throw a warning in these cases
-    (about the correction error being above the default tolerance (50 meV)).
-    For example, with layered materials, the defect charge is often localised
-    to one layer, so we may want to adjust ``defect_region_radius`` and/or
-    ``excluded_indices`` to ensure that only sites in other layers are used for
-    the sampling region (plateau) - see example on doped docs Tips page.
-
-    Args:
-        defect_entry (DefectEntry):
-            DefectEntry object with the following for which to compute the
-            Kumagai finite-size charge correction.
-        dielectric (float or int or 3x1 matrix or 3x3 matrix):
-            Total dielectric constant of the host compound (including both
-            ionic and (high-frequency) electronic contributions). If None,
-            then the dielectric constant is taken from the ``defect_entry``
-            ``calculation_metadata`` if available.
-        defect_region_radius (float):
-            Radius of the defect region (in Å). Sites outside the defect
-            region are used for sampling the electrostatic potential far
-            from the defect (to obtain the potential alignment).
-            If None (default), uses the Wigner-Seitz radius of the supercell.
-        excluded_indices (list):
-            List of site indices (in the defect supercell) to exclude from
-            the site potential sampling in the correction calculation/plot.
-            If None (default), no sites are excluded.
-        defect_outcar (str or Outcar):
-            Path to the output VASP OUTCAR file from the defect supercell
-            calculation, or the corresponding pymatgen Outcar object.
-            If None, will try to use the ``defect_site_potentials``
-            from the ``defect_entry`` ``calculation_metadata`` if available.
-        bulk_outcar (str or Outcar):
-            Path to the output VASP OUTCAR file from the bulk supercell
-            calculation, or the corresponding pymatgen Outcar object.
-            If None, will try to use the ``bulk_site_potentials``
-            from the ``defect_entry`` ``calculation_metadata`` if available.
-        plot (bool):
-            Whether to plot the Kumagai site potential plots (for
-            manually checking the behaviour of the charge correction here).
-        filename (str):
-            Filename to save the Kumagai site potential plots to.
-            If None, plots are not saved.
-        verbose (bool):
-            Whether to print the correction energy (default = True).
-        style_file (str):
-            Path to a mplstyle file to use for the plot. If None (default), uses
-            the default doped style (from doped/utils/doped.mplstyle).
-        **kwargs:
-            Additional kwargs to pass to
-            pydefect.corrections.efnv_correction.ExtendedFnvCorrection
-            (e.g. charge, defect_region_radius, defect_coords).
-
-    Returns:
-        CorrectionResults (summary of the corrections applied and metadata), and
-        the matplotlib figure object if ``plot`` is True.
+    Compute the ``pydefect`` ``ExtendedFnvCorrection`` object for the Kumagai
+    (eFNV) correction of ``defect_entry``, as in ``get_kumagai_correction()``
+    (see its docstring for the arguments), also returning the list of defect
+    supercell indices corresponding to ``ExtendedFnvCorrection.sites``.
     """
     orig_simplefilter = warnings.simplefilter
     warnings.simplefilter = lambda *args, **kwargs: None  # monkey-patch to avoid vise warning suppression
@@ -404,8 +586,6 @@ def get_kumagai_correction(
         from pydefect.analyzer.defect_structure_comparator import DefectStructureComparator
         from pydefect.cli.vasp.make_efnv_correction import calc_max_sphere_radius
         from pydefect.corrections.efnv_correction import ExtendedFnvCorrection, PotentialSite
-        from pydefect.corrections.ewald import Ewald
-        from pydefect.corrections.site_potential_plotter import SitePotentialMplPlotter
         from pydefect.defaults import defaults
         from pydefect.util.error_classes import SupercellError
 
@@ -454,41 +634,51 @@ def get_kumagai_correction(
         if defect_coords is None:
             defect_coords = structure_analyzer.defect_center_coord
         lattice = calc_results.structure.lattice
-        sites, rel_coords = [], []
+        sites = []
 
         excluded_indices = [] if excluded_indices is None else [int(i) for i in excluded_indices]
 
-        for d, p in structure_analyzer.atom_mapping.items():
-            if d not in excluded_indices:
-                specie = str(calc_results.structure[d].specie)
-                frac_coords = calc_results.structure[d].frac_coords
-                distance, _ = lattice.get_distance_and_image(defect_coords, frac_coords)
-                pot = calc_results.potentials[d] - perfect_calc_results.potentials[p]
-                sites.append(PotentialSite(specie, distance, pot, None))
-                coord = calc_results.structure[d].frac_coords
-                rel_coords.append([x - y for x, y in zip(coord, defect_coords)])
+        mapping = [(d, p) for d, p in structure_analyzer.atom_mapping.items() if d not in excluded_indices]
+        frac_coords = np.array([calc_results.structure[d].frac_coords for d, _p in mapping]).reshape(-1, 3)
+        # same minimum-image distances as lattice.get_distance_and_image, computed for all sites at once:
+        distances = lattice.get_all_distances(defect_coords, frac_coords)[0] if mapping else []
+        rel_coords = frac_coords - np.asarray(defect_coords, dtype=float)
+
+        for (d, p), distance in zip(mapping, distances):
+            specie = str(calc_results.structure[d].specie)
+            pot = calc_results.potentials[d] - perfect_calc_results.potentials[p]
+            sites.append(PotentialSite(specie, distance, pot, None))
 
         lattice = calc_results.structure.lattice
-        ewald = Ewald(lattice.matrix, dielectric_tensor, accuracy=accuracy)
-        point_charge_correction = -ewald.lattice_energy * charge**2 if charge else 0.0
+        # Ewald sums depend only on the lattice and dielectric, so are cached and reused across
+        # defects and charge states in the same supercell:
+        ewald = _get_cached_ewald(lattice.matrix, dielectric_tensor, accuracy)
+        point_charge_correction = (
+            -_get_cached_ewald_lattice_energy(lattice.matrix, dielectric_tensor, accuracy) * charge**2
+            if charge
+            else 0.0
+        )
 
         if defect_region_radius is None:
             defect_region_radius = calc_max_sphere_radius(lattice.matrix)
 
-        for site, rel_coord in zip(sites, rel_coords):
-            if site.distance > defect_region_radius:
-                if charge == 0:
-                    site.pc_potential = 0
-                else:
-                    site.pc_potential = ewald.atomic_site_potential(rel_coord) * charge * unit_conversion
+        sampled_indices = [i for i, site in enumerate(sites) if site.distance > defect_region_radius]
+        if charge == 0:
+            for i in sampled_indices:
+                sites[i].pc_potential = 0
+        elif sampled_indices:
+            pc_potentials = _get_ewald_site_potentials(ewald, rel_coords[sampled_indices])
+            for i, pc_potential in zip(sampled_indices, pc_potentials):
+                sites[i].pc_potential = float(pc_potential) * charge * unit_conversion
 
-        return ExtendedFnvCorrection(
+        efnv_correction = ExtendedFnvCorrection(
             charge=charge,
             point_charge_correction=point_charge_correction * unit_conversion,
             defect_region_radius=defect_region_radius,
             sites=sites,
             defect_coords=tuple(defect_coords),
         )
+        return efnv_correction, [d for d, _p in mapping]
 
     # ensure calculation_metadata are decoded in case defect_dict was reloaded from json
     if hasattr(defect_entry, "calculation_metadata"):
@@ -499,20 +689,14 @@ def get_kumagai_correction(
     dielectric = _convert_dielectric_to_tensor(dielectric)
 
     if defect_outcar is not None:
-        defect_outcar = _check_if_str_and_get_pmg_obj(defect_outcar, obj_type="outcar")
-        if defect_outcar.electrostatic_potential is None:
-            _raise_incomplete_outcar_error(defect_outcar, dir_type="defect")
-        defect_site_potentials = -1 * np.array(defect_outcar.electrostatic_potential)
+        defect_site_potentials = _get_site_potentials_from_outcar(defect_outcar, dir_type="defect")
     else:
         defect_site_potentials = _get_and_check_metadata(
             defect_entry, "defect_site_potentials", "Defect OUTCAR (for atomic site potentials)"
         )
 
     if bulk_outcar is not None:
-        bulk_outcar = _check_if_str_and_get_pmg_obj(bulk_outcar, obj_type="outcar")
-        if bulk_outcar.electrostatic_potential is None:
-            _raise_incomplete_outcar_error(bulk_outcar, dir_type="bulk")
-        bulk_site_potentials = -1 * np.array(bulk_outcar.electrostatic_potential)
+        bulk_site_potentials = _get_site_potentials_from_outcar(bulk_outcar, dir_type="bulk")
     else:
         bulk_site_potentials = _get_and_check_metadata(
             defect_entry, "bulk_site_potentials", "Bulk OUTCAR (for atomic site potentials)"
@@ -548,7 +732,7 @@ def get_kumagai_correction(
         potentials=bulk_site_potentials,
     )
 
-    efnv_correction = doped_make_efnv_correction(
+    return doped_make_efnv_correction(
         charge=defect_entry.charge_state,
         calc_results=defect_calc_results_for_eFNV,
         perfect_calc_results=bulk_calc_results_for_eFNV,
@@ -560,6 +744,99 @@ def get_kumagai_correction(
         excluded_indices=excluded_indices,
         **kwargs,
     )
+
+
+def get_kumagai_correction(
+    defect_entry,
+    dielectric: Optional[Union[float, int, np.ndarray, list]] = None,
+    defect_region_radius: Optional[float] = None,
+    excluded_indices: Optional[list[int]] = None,
+    defect_outcar: Optional[Union[str, Outcar]] = None,
+    bulk_outcar: Optional[Union[str, Outcar]] = None,
+    plot: bool = False,
+    filename: Optional[str] = None,
+    verbose: bool = True,
+    style_file: Optional[str] = None,
+    **kwargs,
+) -> CorrectionResult:
+    """
+    Function to compute the Kumagai (eFNV) finite-size charge correction for
+    the input defect_entry. Compatible with both isotropic/cubic and
+    anisotropic systems.
+
+    This function `does not` add the correction to ``defect_entry.corrections``
+    (but the defect_entry.get_kumagai_correction method does).
+    If this correction is used, please cite the Kumagai & Oba paper:
+    10.1103/PhysRevB.89.195205
+
+    Typically for reasonably well-converged supercell sizes, the default
+    ``defect_region_radius`` works perfectly well. However, for certain materials
+    at small/intermediate supercell sizes, you may want to adjust this (and/or
+    ``excluded_indices``) to ensure the best sampling of the plateau region away
+    from the defect position - ``doped`` should throw a warning in these cases
+    (about the correction error being above the default tolerance (50 meV)).
+    For example, with layered materials, the defect charge is often localised
+    to one layer, so we may want to adjust ``defect_region_radius`` and/or
+    ``excluded_indices`` to ensure that only sites in other layers are used for
+    the sampling region (plateau) - see example on doped docs Tips page.
+
+    Args:
+        defect_entry (DefectEntry):
+            DefectEntry object with the following for which to compute the
+            Kumagai finite-size charge correction.
+        dielectric (float or int or 3x1 matrix or 3x3 matrix):
+            Total dielectric constant of the host compound (including both
+            ionic and (high-frequency) electronic contributions). If None,
+            then the dielectric constant is taken from the ``defect_entry``
+            ``calculation_metadata`` if available.
+        defect_region_radius (float):
+            Radius of the defect region (in Å). Sites outside the defect
+            region are used for sampling the electrostatic potential far
+            from the defect (to obtain the potential alignment).
+            If None (default), uses the Wigner-Seitz radius of the supercell.
+        excluded_indices (list):
+            List of site indices (in the defect supercell) to exclude from
+            the site potential sampling in the correction calculation/plot.
+            If None (default), no sites are excluded.
+        defect_outcar (str or Outcar):
+            Path to the output VASP OUTCAR file from the defect supercell
+            calculation, or the corresponding pymatgen Outcar object.
+            If None, will try to use the ``defect_site_potentials``
+            from the ``defect_entry`` ``calculation_metadata`` if available.
+        bulk_outcar (str or Outcar):
+            Path to the output VASP OUTCAR file from the bulk supercell
+            calculation, or the corresponding pymatgen Outcar object.
+            If None, will try to use the ``bulk_site_potentials``
+            from the ``defect_entry`` ``calculation_metadata`` if available.
+        plot (bool):
+            Whether to plot the Kumagai site potential plots (for
+            manually checking the behaviour of the charge correction here).
+        filename (str):
+            Filename to save the Kumagai site potential plots to.
+            If None, plots are not saved.
+        verbose (bool):
+            Whether to print the correction energy (default = True).
+        style_file (str):
+            Path to a mplstyle file to use for the plot. If None (default), uses
+            the default doped style (from doped/utils/doped.mplstyle).
+        **kwargs:
+            Additional kwargs to pass to
+            pydefect.corrections.efnv_correction.ExtendedFnvCorrection
+            (e.g. charge, defect_region_radius, defect_coords).
+
+    Returns:
+        CorrectionResults (summary of the corrections applied and metadata), and
+        the matplotlib figure object if ``plot`` is True.
+    """
+    efnv_correction, _site_indices = _get_efnv_correction_and_site_indices(
+        defect_entry,
+        dielectric=dielectric,
+        defect_region_radius=defect_region_radius,
+        excluded_indices=excluded_indices,
+        defect_outcar=defect_outcar,
+        bulk_outcar=bulk_outcar,
+        **kwargs,
+    )
     kumagai_correction_result = CorrectionResult(
         correction_energy=efnv_correction.correction_energy,
         metadata={"pydefect_ExtendedFnvCorrection": efnv_correction},
@@ -573,6 +850,8 @@ def get_kumagai_correction(
     if not plot and filename is None:
         return kumagai_correction_result
 
+    from pydefect.corrections.site_potential_plotter import SitePotentialMplPlotter
+
     _install_custom_font()
 
     spp = SitePotentialMplPlotter.from_efnv_corr(
@@ -629,6 +908,119 @@ def get_kumagai_correction(
     return kumagai_correction_result, fig
 
 
+def get_kumagai_sampling_region_scan(
+    defect_entry,
+    defect_region_radii: Optional[list[Optional[float]]] = None,
+    excluded_indices: Optional[list[Optional[list[int]]]] = None,
+    dielectric: Optional[Union[float, int, np.ndarray, list]] = None,
+    defect_outcar: Optional[Union[str, Outcar]] = None,
+    bulk_outcar: Optional[Union[str, Outcar]] = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Compute the Kumagai (eFNV) finite-size charge correction for the input
+    defect_entry with multiple choices of the sampling region (i.e.
+    ``defect_region_radius`` and/or ``excluded_indices``), to check the
+    convergence of the correction with respect to the sampling region (e.g.
+    for layered materials, where the defect charge is often localised to one
+    layer; see ``get_kumagai_correction()``).
+
+    The site potentials and point-charge (Ewald) potentials are computed only
+    once for all sites, and the correction energy and plateau variance are
+    then obtained for each sampling region from these, rather than rerunning
+    the full correction for each choice. All combinations of
+    ``defect_region_radii`` and ``excluded_indices`` are evaluated.
+
+    Args:
+        defect_entry (DefectEntry):
+            DefectEntry object for which to compute the Kumagai finite-size
+            charge corrections.
+        defect_region_radii (list):
+            List of defect region radii (in Å) to evaluate; sites outside the
+            defect region are used for sampling the electrostatic potential
+            far from the defect. ``None`` entries correspond to the default
+            Wigner-Seitz radius of the supercell. If None (default), only the
+            Wigner-Seitz radius is used.
+        excluded_indices (list):
+            List of alternative lists of site indices (in the defect supercell)
+            to exclude from the site potential sampling (``None`` or ``[]`` for
+            no excluded sites). If None (default), no sites are excluded.
+        dielectric (float or int or 3x1 matrix or 3x3 matrix):
+            Total dielectric constant of the host compound (including both
+            ionic and (high-frequency) electronic contributions). If None,
+            then the dielectric constant is taken from the ``defect_entry``
+            ``calculation_metadata`` if available.
+        defect_outcar (str or Outcar):
+            Path to the output VASP OUTCAR file from the defect supercell
+            calculation, or the corresponding pymatgen Outcar object.
+            If None, will try to use the ``defect_site_potentials``
+            from the ``defect_entry`` ``calculation_metadata`` if available.
+        bulk_outcar (str or Outcar):
+            Path to the output VASP OUTCAR file from the bulk supercell
+            calculation, or the corresponding pymatgen Outcar object.
+            If None, will try to use the ``bulk_site_potentials``
+            from the ``defect_entry`` ``calculation_metadata`` if available.
+        **kwargs:
+            Additional kwargs to pass to
+            pydefect.corrections.efnv_correction.ExtendedFnvCorrection
+            (e.g. defect_coords).
+
+    Returns:
+        ``pandas`` ``DataFrame`` with one row per sampling region, with columns
+        ``"Defect Region Radius (Å)"``, ``"Excluded Indices"``, ``"Sampled Sites"``,
+        ``"Correction Energy (eV)"``, ``"Alignment Term (eV)"``,
+        ``"Plateau Variance (V^2)"`` (the variance of the sampled site potential
+        differences) and ``"Correction Error (eV)"`` (the standard error of the mean
+        of the sampled site potential differences times the defect charge, as in
+        ``DefectEntry.get_kumagai_correction()``).
+    """
+    from pydefect.cli.vasp.make_efnv_correction import calc_max_sphere_radius
+
+    # sampling region of all sites (except any at the defect position), to get all PC potentials at once:
+    efnv_correction, site_indices = _get_efnv_correction_and_site_indices(
+        defect_entry,
+        dielectric=dielectric,
+        defect_region_radius=0,
+        defect_outcar=defect_outcar,
+        bulk_outcar=bulk_outcar,
+        **kwargs,
+    )
+    charge = efnv_correction.charge
+    site_indices = np.array(site_indices, dtype=int)
+    distances = np.array([site.distance for site in efnv_correction.sites], dtype=float)
+    diff_pots = np.array(
+        [site.diff_pot if site.pc_potential is not None else np.nan for site in efnv_correction.sites],
+        dtype=float,
+    )
+    wigner_seitz_radius = calc_max_sphere_radius(_get_defect_supercell(defect_entry).lattice.matrix)
+
+    scan_rows = []
+    for defect_region_radius in defect_region_radii or [None]:
+        radius = wigner_seitz_radius if defect_region_radius is None else defect_region_radius
+        for region_excluded_indices in excluded_indices or [None]:
+            excluded_site_indices = [int(i) for i in region_excluded_indices or []]
+            sampled_diff_pots = diff_pots[
+                (distances > radius) & ~np.isin(site_indices, excluded_site_indices)
+            ]
+            num_sampled_sites = len(sampled_diff_pots)
+            alignment_term = -np.mean(sampled_diff_pots) * charge if num_sampled_sites else np.nan
+            plateau_variance = np.var(sampled_diff_pots, ddof=1) if num_sampled_sites > 1 else np.nan
+            correction_error = np.sqrt(plateau_variance / max(num_sampled_sites, 1)) * abs(charge)
+            scan_rows.append(
+                {
+                    "Defect Region Radius (Å)": radius,
+                    "Excluded Indices": excluded_site_indices,
+                    "Sampled Sites": num_sampled_sites,
+                    "Correction Energy (eV)": efnv_correction.point_charge_correction + alignment_term,
+                    "Alignment Term (eV)": alignment_term,
+                    "Plateau Variance (V^2)": plateau_variance,
+                    "Correction Error (eV)": correction_error,
+                }
+            )
+
+    return pd.DataFrame(scan_rows)
+
+
 def _raise_incomplete_outcar_error(outcar, dir_type="bulk"):
     """
     Raise error about supplied OUTCAR not having atomic core potential info.
@@ -642,3 +1034,270 @@ def _raise_incomplete_outcar_error(outcar, dir_type="bulk"):
         f"finished prematurely with a `STOPCAR`. The Kumagai charge correction cannot be computed "
         f"without this data!"
     )
+
+
+_CHARGE_CORRECTION_KEYS = ("kumagai_charge_correction", "freysoldt_charge_correction")
+_BULK_CORRECTION_METADATA_KEYS = ("bulk_site_potentials", "bulk_locpot_dict")
+_corrections_worker_state: dict = {}  # state shared by correction tasks, set once per worker process
+
+
+def _get_charge_correction_type(defect_entry, correction_type: Optional[str] = None) -> Optional[str]:
+    """
+    Get the type of finite-size charge correction (``"kumagai"`` or
+    ``"freysoldt"``) to (re)compute for ``defect_entry``; the previously
+    applied correction type if present, otherwise the Kumagai (eFNV)
+    correction if the site potentials are available, else the Freysoldt
+    (FNV) correction if the planar-averaged potentials are available, else
+    ``None``.
+    """
+    if correction_type is not None:
+        return correction_type
+
+    for previous_correction_type in ["kumagai", "freysoldt"]:
+        if f"{previous_correction_type}_charge_correction" in defect_entry.corrections:
+            return previous_correction_type
+
+    metadata = defect_entry.calculation_metadata
+    if all(metadata.get(f"{i}_site_potentials") is not None for i in ["bulk", "defect"]):
+        return "kumagai"
+    if all(metadata.get(f"{i}_locpot_dict") is not None for i in ["bulk", "defect"]):
+        return "freysoldt"
+
+    return None
+
+
+def _get_bulk_correction_data(defect_entry) -> dict:
+    """
+    Get the bulk-side data used for the charge corrections of
+    ``defect_entry`` (i.e. the bulk supercell and bulk site potentials /
+    planar-averaged potentials).
+    """
+    return {
+        "bulk_supercell": _get_bulk_supercell(defect_entry),
+        **{key: defect_entry.calculation_metadata.get(key) for key in _BULK_CORRECTION_METADATA_KEYS},
+    }
+
+
+def _bulk_correction_data_match(bulk_data: dict, other_bulk_data: dict) -> bool:
+    """
+    Check if two sets of bulk correction data (from
+    ``_get_bulk_correction_data``) are the same.
+    """
+    for key, value in bulk_data.items():
+        other_value = other_bulk_data[key]
+        if value is other_value:
+            continue
+        if value is None or other_value is None:
+            return False
+
+        if key == "bulk_supercell":
+            if (
+                len(value) != len(other_value)
+                or not np.allclose(value.lattice.matrix, other_value.lattice.matrix)
+                or not np.allclose(value.frac_coords, other_value.frac_coords)
+                or [site.species for site in value] != [site.species for site in other_value]
+            ):
+                return False
+        elif key == "bulk_locpot_dict":
+            if {int(k) for k in value} != {int(k) for k in other_value} or not all(
+                np.array_equal(value[k], other_value.get(k, other_value.get(str(k)))) for k in value
+            ):
+                return False
+        elif not np.array_equal(value, other_value):
+            return False
+
+    return True
+
+
+def _initialise_corrections_worker(shared_bulk_data: Optional[dict], correction_kwargs: dict):
+    """
+    Set the shared state for ``_recompute_entry_correction``, so that the bulk
+    supercell and bulk-side correction data only need to be sent (pickled)
+    once per worker process, rather than with each defect entry.
+    """
+    _corrections_worker_state.update(
+        shared_bulk_data=shared_bulk_data, correction_kwargs=correction_kwargs
+    )
+
+
+def _recompute_entry_correction(task: tuple) -> tuple[Optional[dict], Optional[dict], list[str], str]:
+    """
+    Recompute the finite-size charge correction for a task defect entry, as
+    used in ``recompute_corrections()``.
+
+    Returns the updated ``corrections`` and ``corrections_metadata`` dicts,
+    any warning messages, and the error message if the correction failed
+    (else an empty string).
+    """
+    task_entry, correction_type, uses_shared_bulk_data = task
+    if uses_shared_bulk_data:
+        shared_bulk_data = _corrections_worker_state["shared_bulk_data"]
+        task_entry.bulk_supercell = shared_bulk_data["bulk_supercell"]
+        task_entry.calculation_metadata.update(
+            {key: shared_bulk_data[key] for key in _BULK_CORRECTION_METADATA_KEYS}
+        )
+
+    get_correction = (
+        task_entry.get_kumagai_correction
+        if correction_type == "kumagai"
+        else task_entry.get_freysoldt_correction
+    )
+    with warnings.catch_warnings(record=True) as captured_warnings:
+        warnings.simplefilter("always")
+        try:
+            get_correction(
+                verbose=False,
+                return_correction_error=True,  # error tolerance warnings raised in main process
+                **_corrections_worker_state["correction_kwargs"],
+            )
+        except Exception as exc:
+            return None, None, [str(warning.message) for warning in captured_warnings], repr(exc)
+
+    return (
+        task_entry.corrections,
+        task_entry.corrections_metadata,
+        [str(warning.message) for warning in captured_warnings],
+        "",
+    )
+
+
+def recompute_corrections(
+    defect_entries,
+    correction_type: Optional[str] = None,
+    dielectric: Optional[Union[float, int, np.ndarray, list]] = None,
+    error_tolerance: float = 0.05,
+    processes: Optional[int] = None,
+    **kwargs,
+):
+    r"""
+    Recompute the finite-size charge corrections for multiple
+    ``DefectEntry``\s at once (e.g. ``DefectsParser.defect_dict`` or
+    ``DefectThermodynamics.defect_entries``), such as after changing the
+    dielectric constant or ``defect_region_radius``.
+
+    The ``corrections`` (and ``corrections_metadata``) of each charged defect
+    entry are updated in place, replacing any previous Kumagai (eFNV) or
+    Freysoldt (FNV) charge correction. The bulk-side data (bulk supercell and
+    bulk site potentials / planar-averaged potentials) is shared between
+    entries with the same bulk, so that it only needs to be sent once to each
+    worker process, and the supercell Ewald sums are cached (see
+    ``clear_correction_cache()``).
+
+    If the correction fails for a defect entry, a warning is raised and its
+    previous corrections are kept.
+
+    Args:
+        defect_entries (list or dict):
+            List or dict of ``DefectEntry`` objects for which to recompute the
+            charge corrections.
+        correction_type (str):
+            Charge correction to compute, either ``"kumagai"`` (eFNV) or
+            ``"freysoldt"`` (FNV). If ``None`` (default), the previously
+            applied charge correction type is used for each defect entry, or
+            if not present, the Kumagai (eFNV) correction if the atomic site
+            potentials are in ``calculation_metadata``, otherwise the Freysoldt
+            (FNV) correction if the planar-averaged potentials are present.
+        dielectric (float or int or 3x1 matrix or 3x3 matrix):
+            Total dielectric constant of the host compound. If set, this is
+            also updated in the ``calculation_metadata`` of each defect entry
+            for which the charge correction is successfully recomputed.
+            If ``None`` (default), the dielectric constant in each defect
+            entry's ``calculation_metadata`` is used.
+        error_tolerance (float):
+            If the estimated error in any charge correction is greater than
+            this value (in eV), then a warning is raised. (default: 0.05 eV)
+        processes (int):
+            Number of processes to use for computing the corrections in
+            parallel. If ``None`` (default), uses up to ``cpu_count() - 1``
+            processes (and no multiprocessing if there is only one charged
+            defect entry).
+        **kwargs:
+            Additional keyword arguments to pass to
+            ``DefectEntry.get_kumagai_correction()`` or
+            ``DefectEntry.get_freysoldt_correction()`` (depending on the
+            correction type), such as ``defect_region_radius`` for the Kumagai
+            (eFNV) correction or ``energy_cutoff``/``q_model`` for the
+            Freysoldt (FNV) correction.
+    """
+    if correction_type not in [None, "kumagai", "freysoldt"]:
+        raise ValueError(
+            f"Invalid correction_type `{correction_type}`. Must be one of: None, 'kumagai', "
+            f"'freysoldt'."
+        )
+    if isinstance(defect_entries, dict):
+        defect_entries = list(defect_entries.values())
+
+    entries_to_correct = []
+    for defect_entry in defect_entries:
+        # ensure calculation_metadata are decoded once, before sending to workers
+        _monty_decode_nested_dicts(defect_entry.calculation_metadata)
+        entry_correction_type = _get_charge_correction_type(defect_entry, correction_type)
+        if defect_entry.charge_state != 0 and entry_correction_type is not None:
+            entries_to_correct.append((defect_entry, entry_correction_type))
+
+    if not entries_to_correct:
+        return
+
+    if processes is None:
+        processes = min(max(1, cpu_count() - 1), len(entries_to_correct))
+
+    shared_bulk_data = _get_bulk_correction_data(entries_to_correct[0][0]) if processes > 1 else None
+    tasks = []
+    for defect_entry, entry_correction_type in entries_to_correct:
+        # shallow copy, with previous charge corrections removed, so entries are only updated on success:
+        task_entry = copy(defect_entry)
+        task_entry.corrections = {
+            k: v for k, v in defect_entry.corrections.items() if k not in _CHARGE_CORRECTION_KEYS
+        }
+        task_entry.corrections_metadata = {
+            k: v
+            for k, v in defect_entry.corrections_metadata.items()
+            if not k.startswith(_CHARGE_CORRECTION_KEYS)
+        }
+        task_entry.calculation_metadata = dict(defect_entry.calculation_metadata)
+        if dielectric is not None:
+            task_entry.calculation_metadata["dielectric"] = dielectric
+        uses_shared_bulk_data = shared_bulk_data is not None and _bulk_correction_data_match(
+            _get_bulk_correction_data(defect_entry), shared_bulk_data
+        )
+        if uses_shared_bulk_data:  # remove bulk data, to be set from the worker state
+            task_entry.bulk_entry = task_entry.bulk_supercell = None
+            for key in _BULK_CORRECTION_METADATA_KEYS:
+                task_entry.calculation_metadata.pop(key, None)
+        tasks.append((task_entry, entry_correction_type, uses_shared_bulk_data))
+
+    worker_args = (shared_bulk_data, kwargs)
+    if processes <= 1:
+        _initialise_corrections_worker(*worker_args)
+        results = [_recompute_entry_correction(task) for task in tasks]
+    else:
+        with Pool(
+            processes=processes, initializer=_initialise_corrections_worker, initargs=worker_args
+        ) as pool:
+            results = pool.map(_recompute_entry_correction, tasks)
+    _corrections_worker_state.clear()
+
+    for (defect_entry, entry_correction_type), result in zip(entries_to_correct, results):
+        corrections, corrections_metadata, warning_messages, error_message = result
+        for warning_message in warning_messages:
+            warnings.warn(warning_message)
+        if error_message:
+            warnings.warn(
+                f"Got this error message when attempting to recompute the {entry_correction_type} "
+                f"charge correction for {defect_entry.name}:\n{error_message}\n-> Previous "
+                f"corrections will be kept for this defect."
+            )
+            continue
+
+        defect_entry.corrections.clear()  # update in place
+        defect_entry.corrections.update(corrections)
+        defect_entry.corrections_metadata.clear()
+        defect_entry.corrections_metadata.update(corrections_metadata)
+        if dielectric is not None:
+            defect_entry.calculation_metadata["dielectric"] = dielectric
+        defect_entry._check_correction_error_and_return_output(
+            None,
+            corrections_metadata[f"{entry_correction_type}_charge_correction_error"],
+            type="eFNV" if entry_correction_type == "kumagai" else "FNV",
+            error_tolerance=error_tolerance,
+        )
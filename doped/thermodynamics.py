@@ -8,8 +8,9 @@ import contextlib
 import os
 import warnings
 from copy import deepcopy
-from functools import reduce
+from functools import cached_property, reduce
 from itertools import chain, product
+from multiprocessing import Pool, cpu_count
 from typing import Optional, Union
 
 import matplotlib.pyplot as plt
@@ -20,14 +21,24 @@ from matplotlib.figure import Figure
 from monty.json import MSONable
 from monty.serialization import dumpfn, loadfn
 from pymatgen.core.composition import Composition
+from pymatgen.core.lattice import Lattice
+from pymatgen.core.sites import PeriodicSite
 from pymatgen.electronic_structure.dos import Dos, FermiDos, Spin, f0
 from pymatgen.io.vasp.outputs import Vasprun
+from scipy.constants import value as constants_value
+from scipy.interpolate import CubicSpline
 from scipy.optimize import brentq
-from scipy.spatial import HalfspaceIntersection
+from scipy.spatial import cKDTree
+from scipy.special import logsumexp
 
 from doped import _doped_obj_properties_methods
-from doped.chemical_potentials import get_X_poor_limit, get_X_rich_limit
-from doped.core import DefectEntry, _no_chempots_warning, _orientational_degeneracy_warning
+from doped.chemical_potentials import get_chempot_grid, get_X_poor_limit, get_X_rich_limit
+from doped.core import (
+    DefectEntry,
+    _get_dft_chempots,
+    _no_chempots_warning,
+    _orientational_degeneracy_warning,
+)
 from doped.generation import _sort_defect_entries
 from doped.utils.parsing import (
     _compare_incar_tags,
@@ -244,39 +255,49 @@ def group_defects_by_distance(
     defect_site_dict: dict[str, dict[tuple, list[DefectEntry]]] = (
         {}
     )  # {defect name: {(equiv defect sites): entry list}}
-    bulk_supercell = _get_bulk_supercell(entry_list[0])
-    bulk_lattice = bulk_supercell.lattice
-    bulk_supercell_sga = _get_sga(bulk_supercell)
-    symm_bulk_struct = bulk_supercell_sga.get_symmetrized_structure()
-    bulk_symm_ops = bulk_supercell_sga.get_symmetry_operations()
+    bulk_symmetry_cache: list = []  # [(bulk lattice, symmetrized bulk structure, bulk symmetry ops)]
+
+    def _get_bulk_symmetry(bulk_supercell):
+        # only recalculate bulk symmetry info if the bulk supercell lattice differs from previous ones
+        for bulk_lattice, symm_bulk_struct, bulk_symm_ops in bulk_symmetry_cache:
+            if bulk_supercell.lattice == bulk_lattice:
+                return symm_bulk_struct, bulk_symm_ops
+
+        bulk_supercell_sga = _get_sga(bulk_supercell)
+        symm_bulk_struct = bulk_supercell_sga.get_symmetrized_structure()
+        bulk_symm_ops = bulk_supercell_sga.get_symmetry_operations()
+        bulk_symmetry_cache.append((bulk_supercell.lattice, symm_bulk_struct, bulk_symm_ops))
+        return symm_bulk_struct, bulk_symm_ops
 
     for name, entry_list in defect_name_dict.items():
         defect_site_dict[name] = {}
+        site_index = None  # (lattice, KD-tree, group index of tree points); reset when groups change
         sorted_entry_list = sorted(
             entry_list, key=lambda x: abs(x.charge_state)
         )  # sort by charge, starting with closest to zero, for deterministic behaviour
         for entry in sorted_entry_list:
-            entry_bulk_supercell = _get_bulk_supercell(entry)
-            if entry_bulk_supercell.lattice != bulk_lattice:
-                # recalculate bulk_symm_ops if bulk supercell differs
-                bulk_supercell_sga = _get_sga(entry_bulk_supercell)
-                symm_bulk_struct = bulk_supercell_sga.get_symmetrized_structure()
-                bulk_symm_ops = bulk_supercell_sga.get_symmetry_operations()
-
+            symm_bulk_struct, bulk_symm_ops = _get_bulk_symmetry(_get_bulk_supercell(entry))
             bulk_site = entry.calculation_metadata.get("bulk_site") or _get_defect_supercell_site(entry)
             # need to use relaxed defect site if bulk_site not in calculation_metadata
 
-            min_dist_list = [
-                min(  # get min dist for all equiv site tuples, in case multiple less than dist_tol
-                    bulk_site.distance_and_image(site)[0] for site in equiv_site_tuple
+            equiv_site_tuples = list(defect_site_dict[name].keys())
+            min_dist, idxmin = np.inf, None
+            if equiv_site_tuples:  # get min dist to all equiv site tuples, with periodic KD-tree
+                if site_index is None or site_index[0] != bulk_site.lattice:
+                    site_index = (
+                        bulk_site.lattice,
+                        *_get_periodic_site_kdtree(equiv_site_tuples, bulk_site.lattice),
+                    )
+                min_dist, tree_idx = _query_periodic_site_kdtree(
+                    site_index[1], bulk_site.frac_coords, bulk_site.lattice, dist_tol
                 )
-                for equiv_site_tuple in defect_site_dict[name]
-            ]
-            if min_dist_list and min(min_dist_list) < dist_tol:  # less than dist_tol, add to corresponding
-                idxmin = np.argmin(min_dist_list)  # entry list
-                if min_dist_list[idxmin] > 0.05:  # likely interstitials, need to add equiv sites to tuple
+                if min_dist < dist_tol:
+                    idxmin = site_index[2][tree_idx]
+
+            if idxmin is not None:  # less than dist_tol, add to corresponding entry list
+                if min_dist > 0.05:  # likely interstitials, need to add equiv sites to tuple
                     # pop old tuple, add new tuple with new equiv sites, and add entry to new tuple
-                    orig_tuple = list(defect_site_dict[name].keys())[idxmin]
+                    orig_tuple = equiv_site_tuples[idxmin]
                     defect_entry_list = defect_site_dict[name].pop(orig_tuple)
                     equiv_site_tuple = (
                         tuple(  # tuple because lists aren't hashable (can't be dict keys)
@@ -290,9 +311,10 @@ def group_defects_by_distance(
                     )
                     defect_entry_list.extend([entry])
                     defect_site_dict[name][equiv_site_tuple] = defect_entry_list
+                    site_index = None
 
                 else:  # less than dist_tol, add to corresponding entry list
-                    defect_site_dict[name][list(defect_site_dict[name].keys())[idxmin]].append(entry)
+                    defect_site_dict[name][equiv_site_tuples[idxmin]].append(entry)
 
             else:  # no match found, add new entry
                 try:
@@ -309,10 +331,186 @@ def group_defects_by_distance(
                     )
 
                 defect_site_dict[name][equiv_site_tuple] = [entry]
+                site_index = None
 
     return defect_site_dict
 
 
+def _get_periodic_site_kdtree(
+    equiv_site_tuples: list[tuple[PeriodicSite, ...]], lattice: Lattice
+) -> tuple[cKDTree, np.ndarray]:
+    r"""
+    Build a KD-tree of the sites in ``equiv_site_tuples`` (and their periodic
+    images), for fast nearest-neighbour distance queries with
+    ``_query_periodic_site_kdtree()``.
+
+    Fractional coordinates are converted to the LLL-reduced basis of
+    ``lattice`` and wrapped to the unit cell, so that the minimum image
+    distance of a (similarly wrapped) query point is given by the nearest
+    point among the 27 neighbouring images of each site, matching
+    ``PeriodicSite.distance_and_image()``.
+
+    Args:
+        equiv_site_tuples (list): List of tuples of (equivalent) ``PeriodicSite``\s.
+        lattice (Lattice): Lattice to use for the periodic distances.
+
+    Returns:
+        Tuple of the ``cKDTree`` and an array of the index of the site tuple in
+        ``equiv_site_tuples`` for each point in the tree.
+    """
+    frac_coords = np.array([site.frac_coords for site_tuple in equiv_site_tuples for site in site_tuple])
+    tuple_indices = np.array([i for i, site_tuple in enumerate(equiv_site_tuples) for _site in site_tuple])
+    images = np.array(list(product([-1, 0, 1], repeat=3)))
+    lll_frac_coords = np.mod(lattice.get_lll_frac_coords(frac_coords), 1)
+    image_frac_coords = (lll_frac_coords[:, np.newaxis, :] + images[np.newaxis, :, :]).reshape(-1, 3)
+    cart_coords = np.dot(image_frac_coords, lattice.lll_matrix)
+
+    return cKDTree(cart_coords), np.repeat(tuple_indices, len(images))
+
+
+def _query_periodic_site_kdtree(
+    tree: cKDTree, frac_coords: np.ndarray, lattice: Lattice, dist_tol: float = np.inf
+) -> tuple[float, int]:
+    """
+    Get the minimum periodic distance from ``frac_coords`` to the sites in a
+    KD-tree generated with ``_get_periodic_site_kdtree()``, and the index of
+    the closest tree point. If no point is closer than ``dist_tol``, the
+    returned distance is ``np.inf``.
+    """
+    lll_frac_coords = np.mod(lattice.get_lll_frac_coords(frac_coords), 1)
+    dist, tree_idx = tree.query(np.dot(lll_frac_coords, lattice.lll_matrix), distance_upper_bound=dist_tol)
+    return float(dist), int(tree_idx)
+
+
+def _get_lower_envelope(
+    slopes: list[float], intercepts: list[float], x_range: list[float]
+) -> tuple[list[int], list[float]]:
+    """
+    Get the lower envelope of a set of lines (y = slope * x + intercept)
+    within ``x_range``, using the convex hull trick (O(n log n)).
+
+    Used to determine the stable charge states (lines on the lower envelope)
+    and charge transition levels (intersections of consecutive lines on the
+    lower envelope) of a defect, from the formation energies of each charge
+    state as a function of Fermi level.
+
+    Args:
+        slopes (list): Slopes of the lines (i.e. charge states).
+        intercepts (list): Intercepts of the lines (i.e. formation energies at x = 0).
+        x_range (list): ``[x_min, x_max]`` range within which to determine the envelope.
+
+    Returns:
+        Tuple of the indices of the lines on the lower envelope (in order of
+        increasing x, i.e. decreasing slope), and the x values of the
+        intersections between consecutive lines on the envelope (i.e. the
+        transition levels; one fewer than the number of envelope lines).
+        For lines with the same slope and intercept, the first in the input
+        order is used.
+    """
+    # sort by decreasing slope (lowest line as x -> -inf first), then increasing intercept:
+    order = sorted(range(len(slopes)), key=lambda i: (-slopes[i], intercepts[i]))
+
+    def _intersection(i, j):
+        return (intercepts[j] - intercepts[i]) / (slopes[i] - slopes[j])
+
+    hull: list[int] = []
+    for i in order:
+        if hull and slopes[hull[-1]] == slopes[i]:  # parallel, with higher (or equal) intercept
+            continue
+        while len(hull) >= 2 and _intersection(hull[-2], i) <= _intersection(hull[-2], hull[-1]):
+            hull.pop()  # hull[-1] is never strictly below both hull[-2] and line i
+        hull.append(i)
+
+    # restrict to lines on the envelope within x_range:
+    breakpoints = [_intersection(hull[k], hull[k + 1]) for k in range(len(hull) - 1)]
+    first = next((k for k, x in enumerate(breakpoints) if x > x_range[0]), len(breakpoints))
+    last = next((k for k, x in enumerate(breakpoints) if x >= x_range[1]), len(breakpoints))
+
+    return hull[first : last + 1], breakpoints[first:last]
+
+
+def _entries_match(cached_entries: Union[list, tuple], entries: Union[list, tuple]) -> bool:
+    """
+    Check if two sequences contain the same ``DefectEntry`` objects (by
+    identity, rather than equality), in the same order.
+    """
+    return len(cached_entries) == len(entries) and all(
+        cached_entry is entry for cached_entry, entry in zip(cached_entries, entries)
+    )
+
+
+def _get_compensating_intercepts(
+    intercepts: np.ndarray, mask: np.ndarray, compensating: str = "min"
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the compensating (i.e. minimum or maximum, for ``compensating`` =
+    ``"min"``/``"max"``) intercept and corresponding entry index, over the
+    entries selected by ``mask``, for each row of an (points x entries)
+    ``intercepts`` array.
+
+    If no entries are selected by ``mask``, the returned intercepts are
+    ``np.inf``/``-np.inf`` (for ``"min"``/``"max"``) and the indices are -1.
+    """
+    intercepts = np.atleast_2d(intercepts)
+    fill = np.inf if compensating == "min" else -np.inf
+    if not np.any(mask):
+        return np.full(len(intercepts), fill), np.full(len(intercepts), -1)
+
+    masked_intercepts = np.where(mask, intercepts, fill)
+    indices = (np.argmin if compensating == "min" else np.argmax)(masked_intercepts, axis=-1)
+    return np.take_along_axis(masked_intercepts, indices[:, np.newaxis], axis=-1)[:, 0], indices
+
+
+def _get_limiting_intercept_row(
+    intercepts: np.ndarray,
+    indices: np.ndarray,
+    limiting: str,
+    limits: list,
+    defect_entries: list[DefectEntry],
+) -> dict:
+    """
+    Get the limiting (i.e. minimum or maximum, for ``limiting`` =
+    ``"min"``/``"max"``) compensating intercept over all chemical potential
+    ``limits``, from the outputs of ``_get_compensating_intercepts()``, as a
+    dict with ``"limit"``, ``"name"`` (of the compensating defect entry) and
+    ``"intercept"`` keys.
+    """
+    limit_idx = int((np.argmin if limiting == "min" else np.argmax)(intercepts))
+    if indices[limit_idx] < 0:  # no compensating defects
+        return {"limit": "N/A", "name": "N/A", "intercept": intercepts[limit_idx]}
+
+    return {
+        "limit": limits[limit_idx],
+        "name": defect_entries[indices[limit_idx]].name,
+        "intercept": intercepts[limit_idx],
+    }
+
+
+def _get_chempots_array_from_grid(
+    chempot_grid: pd.DataFrame, el_refs: Optional[dict], elements: list[str]
+) -> np.ndarray:
+    """
+    Convert a ``DataFrame`` of (formal) chemical potentials (as generated by
+    ``get_chempot_grid()``) to an array of absolute (DFT) chemical potential
+    vectors (points x elements), ordered as ``elements``.
+
+    Elements missing from ``chempot_grid`` are set to zero (matching
+    ``DefectConcentrationModel.get_chempots_vector()``), and ``el_refs`` (if
+    present) are added to convert formal to absolute chemical potentials.
+    """
+    el_refs = el_refs or {}  # formal chempots in grid if el_refs present
+    return np.array(
+        [
+            (
+                chempot_grid[el].to_numpy() + el_refs.get(el, 0)
+                if el in chempot_grid
+                else np.zeros(len(chempot_grid))
+            )
+            for el in elements
+        ]
+    ).T.reshape(len(chempot_grid), len(elements))
+
+
 def group_defects_by_name(entry_list: list[DefectEntry]) -> dict[str, list[DefectEntry]]:
     """
     Given an input list of DefectEntry objects, returns a dictionary of
@@ -357,6 +555,619 @@ def group_defects_by_name(entry_list: list[DefectEntry]) -> dict[str, list[Defec
     return grouped_entries
 
 
+class DefectConcentrationModel:
+    r"""
+    Array-based model of the formation energies and `equilibrium`
+    concentrations of a set of ``DefectEntry``\s, used to efficiently evaluate
+    defect concentrations and total defect charges when repeatedly looping
+    over Fermi levels, temperatures and chemical potentials (e.g. in the
+    self-consistent Fermi level solvers of ``DefectThermodynamics``).
+
+    All per-entry quantities (charge states, corrected energy differences,
+    VBM eigenvalues, degeneracy factors, bulk site concentrations and the
+    chemical potential stoichiometry) are parsed once (on initialisation, or
+    on first use for the degeneracy factors and bulk site concentrations) and
+    stored as ``numpy`` arrays, so that concentrations for all entries can be
+    obtained in a single vectorised call. Fermi levels, temperatures and
+    chemical potential vectors can also be given as (broadcastable) arrays, in
+    which case the entry axis is always the last axis of the outputs.
+    """
+
+    def __init__(self, defect_entries: list[DefectEntry], vbm: float):
+        r"""
+        Precompute the per-entry arrays for the input ``DefectEntry``\s.
+
+        Args:
+            defect_entries ([DefectEntry]):
+                List of ``DefectEntry`` objects to include in the model.
+            vbm (float):
+                VBM eigenvalue to use as the Fermi level reference point, for
+                ``DefectEntry``\s without ``"vbm"`` in their ``calculation_metadata``
+                (matching the behaviour of ``DefectThermodynamics``).
+        """
+        self.defect_entries = defect_entries
+        self.names = [entry.name.rsplit("_", 1)[0] for entry in defect_entries]  # without charge
+        self.defect_names = list(dict.fromkeys(self.names))  # unique names, in order of appearance
+        defect_name_indices = {name: i for i, name in enumerate(self.defect_names)}
+        self.defect_indices = np.array([defect_name_indices[name] for name in self.names], dtype=int)
+
+        self.charges = np.array([entry.charge_state for entry in defect_entries], dtype=float)
+        self.ediffs = np.array([entry.get_ediff() for entry in defect_entries])
+        self.vbms = np.array([entry.calculation_metadata.get("vbm", vbm) for entry in defect_entries])
+
+        element_changes = [
+            {elt.symbol: change for elt, change in entry.defect.element_changes.items()}
+            for entry in defect_entries
+        ]
+        self.elements = sorted({el for changes in element_changes for el in changes})
+        self.stoichiometries = np.array(  # chempot coefficients in formation energies, (entries, elements)
+            [[-changes.get(el, 0) for el in self.elements] for changes in element_changes], dtype=float
+        ).reshape(len(defect_entries), len(self.elements))
+
+    @cached_property
+    def site_concentrations(self) -> np.ndarray:
+        """
+        Bulk site concentrations (in cm^-3) of each entry, parsed on first use
+        (as these are not required for formation energies).
+        """
+        return np.array([entry.bulk_site_concentration for entry in self.defect_entries])
+
+    @cached_property
+    def degeneracies(self) -> np.ndarray:
+        """
+        Degeneracy factors of each entry, parsed on first use (as these are not
+        required for formation energies).
+        """
+        # per-site concentration with zero formation energy is the degeneracy factor product; this also
+        # (re)parses the degeneracy factors if necessary and throws any missing degeneracy warnings once:
+        return np.array(
+            [
+                entry.equilibrium_concentration(formation_energy=0, per_site=True)
+                for entry in self.defect_entries
+            ]
+        )
+
+    def get_chempots_vector(
+        self, chempots: Optional[dict] = None, limit: Optional[str] = None, el_refs: Optional[dict] = None
+    ) -> np.ndarray:
+        r"""
+        Get the vector of (absolute/DFT) chemical potentials for
+        ``self.elements``, for the given chemical potentials and limit.
+
+        Args:
+            chempots (dict):
+                Dictionary of chemical potentials, in the same formats as accepted by
+                ``DefectEntry.formation_energy()``. If ``None``, all chemical potentials
+                are set to zero.
+            limit (str):
+                The chemical potential limit to use (see ``DefectEntry.formation_energy()``).
+            el_refs (dict):
+                Dictionary of elemental reference energies, if ``chempots`` has been
+                manually specified as ``{element symbol: formal chemical potential}``.
+
+        Returns:
+            ``numpy`` array of chemical potentials, ordered as ``self.elements``.
+        """
+        dft_chempots = _get_dft_chempots(chempots, el_refs, limit) or {}
+        return np.array([dft_chempots.get(el, 0) for el in self.elements], dtype=float)
+
+    def get_formation_energies(
+        self, fermi_level: Union[float, np.ndarray], chempots_vector: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Get the formation energies of all entries in the model.
+
+        Args:
+            fermi_level (float or np.ndarray):
+                Fermi level(s), relative to the VBM.
+            chempots_vector (np.ndarray):
+                Chemical potentials vector(s), from ``get_chempots_vector()``.
+                If ``None`` (default), uses zero for all chemical potentials.
+
+        Returns:
+            ``numpy`` array of formation energies, with the entries along the last axis.
+        """
+        formation_energies = self.ediffs + self.charges * (
+            self.vbms + np.asarray(fermi_level, dtype=float)[..., np.newaxis]
+        )
+        if chempots_vector is not None:
+            formation_energies = formation_energies + np.asarray(chempots_vector) @ self.stoichiometries.T
+
+        return formation_energies
+
+    def get_concentrations(
+        self,
+        fermi_level: Union[float, np.ndarray],
+        temperature: Union[float, np.ndarray],
+        chempots_vector: Optional[np.ndarray] = None,
+        per_site: bool = False,
+        formation_energies: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Get the `equilibrium` concentrations (in cm^-3, or per site if
+        ``per_site = True``) of all entries in the model.
+
+        Args:
+            fermi_level (float or np.ndarray):
+                Fermi level(s), relative to the VBM.
+            temperature (float or np.ndarray):
+                Temperature(s) in Kelvin.
+            chempots_vector (np.ndarray):
+                Chemical potentials vector(s), from ``get_chempots_vector()``.
+                If ``None`` (default), uses zero for all chemical potentials.
+            per_site (bool):
+                Whether to return fractional concentrations per site, rather than
+                the default of per cm^3. (Default: False)
+            formation_energies (np.ndarray):
+                Pre-calculated formation energies (from ``get_formation_energies()``),
+                to avoid recomputing. (Default: None)
+
+        Returns:
+            ``numpy`` array of concentrations, with the entries along the last axis.
+        """
+        if formation_energies is None:
+            formation_energies = self.get_formation_energies(fermi_level, chempots_vector)
+
+        k_T = constants_value("Boltzmann constant in eV/K") * np.asarray(temperature, dtype=float)
+        with np.errstate(over="ignore"):
+            concentrations = self.degeneracies * np.exp(-formation_energies / k_T[..., np.newaxis])
+
+        return concentrations if per_site else concentrations * self.site_concentrations
+
+    def get_defect_totals(self, concentrations: np.ndarray) -> np.ndarray:
+        """
+        Sum concentrations over charge states for each defect (i.e. each
+        name in ``self.defect_names``).
+
+        Args:
+            concentrations (np.ndarray):
+                Per-entry concentrations, with the entries along the last axis.
+
+        Returns:
+            ``numpy`` array of total defect concentrations, with the defects
+            (``self.defect_names``) along the last axis.
+        """
+        concentrations = np.asarray(concentrations)
+        totals = np.zeros((len(self.defect_names), *concentrations.shape[:-1]))
+        np.add.at(totals, self.defect_indices, np.moveaxis(concentrations, -1, 0))
+        return np.moveaxis(totals, 0, -1)
+
+    def get_constrained_concentrations(
+        self,
+        fermi_level: Union[float, np.ndarray],
+        temperature: Union[float, np.ndarray],
+        total_concentrations: np.ndarray,
+        chempots_vector: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Get the concentrations (in cm^-3) of all entries in the model, with
+        the total concentration of each defect fixed to
+        ``total_concentrations`` but with the relative charge state
+        populations given by `equilibrium` at ``fermi_level`` and
+        ``temperature`` (i.e. the frozen defect approximation).
+
+        Args:
+            fermi_level (float or np.ndarray):
+                Fermi level(s), relative to the VBM.
+            temperature (float or np.ndarray):
+                Temperature(s) in Kelvin.
+            total_concentrations (np.ndarray):
+                Fixed total concentrations of each defect, with the defects
+                (``self.defect_names``) along the last axis.
+            chempots_vector (np.ndarray):
+                Chemical potentials vector(s), from ``get_chempots_vector()``.
+                If ``None`` (default), uses zero for all chemical potentials.
+
+        Returns:
+            ``numpy`` array of concentrations, with the entries along the last axis.
+        """
+        concentrations = self.get_concentrations(fermi_level, temperature, chempots_vector)
+        defect_totals = self.get_defect_totals(concentrations)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (
+                concentrations
+                / defect_totals[..., self.defect_indices]
+                * np.asarray(total_concentrations)[..., self.defect_indices]
+            )
+
+    def get_total_charge(self, concentrations: np.ndarray) -> np.ndarray:
+        """
+        Get the total defect charge (in e cm^-3, if ``concentrations`` are in
+        cm^-3) for the given per-entry concentrations, ignoring any ``NaN``
+        values (from over/underflows).
+
+        Args:
+            concentrations (np.ndarray):
+                Per-entry concentrations, with the entries along the last axis.
+
+        Returns:
+            Total defect charge(s), as a float or ``numpy`` array.
+        """
+        return np.nansum(self.charges * concentrations, axis=-1)
+
+    def get_concentration_derivatives(
+        self,
+        concentrations: np.ndarray,
+        temperature: Union[float, np.ndarray],
+        constrained: bool = False,
+    ) -> np.ndarray:
+        """
+        Get the derivatives of the per-entry concentrations with respect to
+        the Fermi level.
+
+        For `equilibrium` concentrations, dc/dE_F = -q c/kT. If
+        ``constrained = True`` (i.e. concentrations from
+        ``get_constrained_concentrations()``, with fixed total concentrations
+        for each defect), dc/dE_F = -(q - q_mean) c/kT, where q_mean is the
+        concentration-weighted mean charge of the corresponding defect.
+
+        Args:
+            concentrations (np.ndarray):
+                Per-entry concentrations, with the entries along the last axis.
+            temperature (float or np.ndarray):
+                Temperature(s) in Kelvin.
+            constrained (bool):
+                Whether ``concentrations`` are constrained to fixed defect totals.
+                (Default: False)
+
+        Returns:
+            ``numpy`` array of concentration derivatives, with the entries along
+            the last axis.
+        """
+        k_T = constants_value("Boltzmann constant in eV/K") * np.asarray(temperature, dtype=float)
+        charges = self.charges
+        if constrained:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean_charges = (
+                    self.get_defect_totals(np.nan_to_num(self.charges * concentrations))
+                    / self.get_defect_totals(np.nan_to_num(concentrations))
+                )[..., self.defect_indices]
+            charges = self.charges - np.nan_to_num(mean_charges)
+
+        return -charges * concentrations / k_T[..., np.newaxis]
+
+    def get_log_charge_balance(
+        self,
+        concentrations: np.ndarray,
+        concentration_derivatives: np.ndarray,
+        e_conc: Union[float, np.ndarray],
+        h_conc: Union[float, np.ndarray],
+        e_conc_derivative: Union[float, np.ndarray],
+        h_conc_derivative: Union[float, np.ndarray],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the log charge balance, ln(Q+) - ln(Q-), and its derivative with
+        respect to the Fermi level, where Q+ is the total positive charge
+        (positive defects and holes) and Q- is the total negative charge
+        (negative defects and electrons).
+
+        This is zero at charge neutrality, and (unlike the total charge, which
+        varies exponentially) is close to linear in the Fermi level, making
+        it well-suited to Newton root-finding. It is also strictly
+        decreasing with the Fermi level.
+
+        Args:
+            concentrations (np.ndarray):
+                Per-entry concentrations, with the entries along the last axis.
+            concentration_derivatives (np.ndarray):
+                Per-entry concentration derivatives with respect to the Fermi level,
+                from ``get_concentration_derivatives()``.
+            e_conc (float or np.ndarray): Electron concentration(s).
+            h_conc (float or np.ndarray): Hole concentration(s).
+            e_conc_derivative (float or np.ndarray):
+                Electron concentration derivative(s) with respect to the Fermi level.
+            h_conc_derivative (float or np.ndarray):
+                Hole concentration derivative(s) with respect to the Fermi level.
+
+        Returns:
+            Tuple of the log charge balance and its derivative, as ``numpy`` arrays.
+        """
+        positive, negative = self.charges > 0, self.charges < 0
+        charge_concs = np.nan_to_num(self.charges * concentrations)
+        charge_conc_derivatives = np.nan_to_num(self.charges * concentration_derivatives)
+        positive_charge = np.sum(charge_concs[..., positive], axis=-1) + h_conc
+        negative_charge = -np.sum(charge_concs[..., negative], axis=-1) + e_conc
+        positive_derivative = np.sum(charge_conc_derivatives[..., positive], axis=-1) + h_conc_derivative
+        negative_derivative = -np.sum(charge_conc_derivatives[..., negative], axis=-1) + e_conc_derivative
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (
+                np.log(positive_charge) - np.log(negative_charge),
+                positive_derivative / positive_charge - negative_derivative / negative_charge,
+            )
+
+
+class CarrierConcentrationModel:
+    r"""
+    Precomputed model of the electron and hole concentrations of a bulk
+    ``FermiDos``, for fast evaluation of n(E_F, T) and p(E_F, T) when
+    repeatedly solving for the Fermi level.
+
+    Only the band-edge windows of the DOS which contribute to the carrier
+    concentrations (within ``occupation_tol``) for Fermi levels in
+    ``fermi_level_range`` and temperatures up to ``max(temperatures)`` are
+    retained, and for each temperature in ``temperatures``, ``log(n)`` and
+    ``log(p)`` are tabulated over ``fermi_level_range`` and interpolated with
+    cubic splines, with the grid refined until the relative interpolation
+    error is below ``rtol``. Carrier concentrations at other temperatures or
+    Fermi levels are directly integrated over the DOS (using the band-edge
+    windows where valid), as in ``get_e_h_concs()``.
+
+    Can be used in place of ``FermiDos`` objects in ``get_e_h_concs()``,
+    ``get_doping()``, ``scissor_dos()`` and as the ``bulk_dos`` input to the
+    ``DefectThermodynamics`` Fermi level solvers.
+    """
+
+    def __init__(
+        self,
+        fermi_dos: Union[FermiDos, Vasprun, str],
+        temperatures: Optional[Union[float, list[float], np.ndarray]] = None,
+        fermi_level_range: Optional[tuple[float, float]] = None,
+        rtol: float = 1e-6,
+        occupation_tol: float = 1e-12,
+    ):
+        r"""
+        Precompute the band-edge windows and carrier concentration tables
+        for the input ``fermi_dos``.
+
+        Args:
+            fermi_dos (FermiDos or Vasprun or str):
+                ``pymatgen`` ``FermiDos`` for the bulk electronic density of states
+                (DOS), as obtained from ``get_fermi_dos()``. Alternatively, can be a
+                ``pymatgen`` ``Vasprun`` object or path to the ``vasprun.xml(.gz)``
+                output of a bulk DOS calculation, which is parsed with ``get_fermi_dos()``.
+            temperatures (float or list or np.ndarray):
+                Temperature(s) in Kelvin at which to tabulate the carrier
+                concentrations. If ``None`` (default), no tables are built and the
+                full DOS is always directly integrated.
+            fermi_level_range (tuple):
+                Range of (absolute, i.e. not VBM-referenced) Fermi level eigenvalues
+                over which to tabulate the carrier concentrations. If ``None``
+                (default), uses 2 eV below the VBM to 2 eV above the CBM of
+                ``fermi_dos``, which covers the Fermi level search range of the
+                ``DefectThermodynamics`` solvers.
+            rtol (float):
+                Relative error tolerance for the interpolated carrier concentrations.
+                (Default: 1e-6)
+            occupation_tol (float):
+                Occupation (Fermi-Dirac) cutoff used to determine the band-edge
+                windows of the DOS, such that all neglected states have occupations
+                below ``occupation_tol`` over the tabulated Fermi level range and
+                temperatures. (Default: 1e-12)
+        """
+        if not isinstance(fermi_dos, FermiDos):
+            fermi_dos = get_fermi_dos(fermi_dos)
+
+        self.fermi_dos = fermi_dos
+        self.temperatures = (
+            sorted({round(float(t), 6) for t in np.atleast_1d(temperatures)})
+            if temperatures is not None
+            else []
+        )
+        self.rtol = rtol
+        self.occupation_tol = occupation_tol
+        if fermi_level_range is None:
+            fermi_level_range = (
+                fermi_dos.energies[fermi_dos.idx_vbm] - 2,
+                fermi_dos.energies[fermi_dos.idx_cbm] + 2,
+            )
+        self.fermi_level_range = (float(min(fermi_level_range)), float(max(fermi_level_range)))
+
+        # same DOS partitioning as in get_e_h_concs():
+        idx_mid_gap = int(fermi_dos.idx_vbm + (fermi_dos.idx_cbm - fermi_dos.idx_vbm) / 2)
+        volume_in_cm3 = fermi_dos.volume * fermi_dos.A_to_cm**3
+        weights = fermi_dos.tdos * fermi_dos.de / volume_in_cm3
+        self._electron_states = (fermi_dos.energies[idx_mid_gap:], weights[idx_mid_gap:])
+        self._hole_states = (fermi_dos.energies[: idx_mid_gap + 1], weights[: idx_mid_gap + 1])
+
+        self._windowed_electron_states, self._windowed_hole_states = (
+            self._electron_states,
+            self._hole_states,
+        )
+        if self.temperatures:  # states beyond cutoff have occupations < occupation_tol:
+            cutoff = (
+                constants_value("Boltzmann constant in eV/K")
+                * max(self.temperatures)
+                * np.log(1 / occupation_tol)
+            )
+            electron_mask = self._electron_states[0] <= self.fermi_level_range[1] + cutoff
+            hole_mask = self._hole_states[0] >= self.fermi_level_range[0] - cutoff
+            self._windowed_electron_states = tuple(i[electron_mask] for i in self._electron_states)
+            self._windowed_hole_states = tuple(i[hole_mask] for i in self._hole_states)
+
+        self._tables = {
+            temperature: table
+            for temperature in self.temperatures
+            if (table := self._tabulate(temperature)) is not None  # otherwise directly integrated
+        }
+
+    def _get_log_concs(
+        self, fermi_levels: np.ndarray, temperature: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Directly compute log(n) and log(p) (in log(cm^-3)) for an array of
+        Fermi levels, using the windowed DOS and log-space sums to avoid
+        over/underflows.
+        """
+        k_T = constants_value("Boltzmann constant in eV/K") * temperature
+        log_concs = []
+        for (energies, weights), sign in [
+            (self._windowed_electron_states, 1),
+            (self._windowed_hole_states, -1),
+        ]:
+            with np.errstate(divide="ignore"):
+                log_weights = np.log(weights)[:, np.newaxis]
+            log_concs.append(
+                np.concatenate(
+                    [  # chunk Fermi levels to limit memory usage
+                        logsumexp(
+                            log_weights
+                            - np.logaddexp(0, sign * (energies[:, np.newaxis] - fermi_level_chunk) / k_T),
+                            axis=0,
+                        )
+                        for fermi_level_chunk in np.array_split(
+                            fermi_levels, max(1, int(np.ceil(fermi_levels.size / 256)))
+                        )
+                    ]
+                )
+            )
+
+        return log_concs[0], log_concs[1]
+
+    def _tabulate(self, temperature: float) -> Optional[tuple[tuple[CubicSpline, CubicSpline], ...]]:
+        """
+        Tabulate log(n) and log(p) over ``self.fermi_level_range`` at
+        ``temperature``, refining the grid until the interpolation error (at
+        the grid midpoints) is below ``self.rtol``.
+
+        Returns the splines for log(n) and log(p), each paired with their
+        derivative splines, or ``None`` (with a warning) if the interpolation
+        error is still above ``self.rtol`` after the maximum number of grid
+        refinements, in which case the carrier concentrations at this
+        temperature are directly integrated instead.
+        """
+        k_T = constants_value("Boltzmann constant in eV/K") * temperature
+        spacing = 0.2 * k_T  # initial grid spacing, relative to kT
+        for _ in range(6):
+            num_points = (
+                int(np.ceil((self.fermi_level_range[1] - self.fermi_level_range[0]) / spacing)) + 1
+            )
+            fermi_levels = np.linspace(*self.fermi_level_range, max(num_points, 4))
+            splines = tuple(
+                CubicSpline(fermi_levels, log_concs)
+                for log_concs in self._get_log_concs(fermi_levels, temperature)
+            )
+            midpoints = 0.5 * (fermi_levels[1:] + fermi_levels[:-1])
+            max_error = max(
+                np.max(np.abs(spline(midpoints) - log_concs))  # error in log(conc) ~ relative error
+                for spline, log_concs in zip(splines, self._get_log_concs(midpoints, temperature))
+            )
+            if max_error < self.rtol:
+                return tuple((spline, spline.derivative()) for spline in splines)  # type: ignore
+            spacing /= 2
+
+        warnings.warn(
+            f"Tabulated carrier concentrations at {temperature} K did not converge to within rtol = "
+            f"{self.rtol} (maximum interpolation error = {max_error:.1e}), so these will be directly "
+            f"integrated over the DOS instead."
+        )
+        return None
+
+    def get_e_h_concs(
+        self, fermi_level: Union[float, np.ndarray], temperature: Union[float, np.ndarray]
+    ) -> tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        Get the electron and hole concentrations (in cm^-3) for the given
+        Fermi level(s) (in eV, `not` referenced to the VBM) and
+        temperature(s) (in K).
+
+        Args:
+            fermi_level (float or np.ndarray):
+                Fermi level eigenvalue(s), i.e. the Fermi level relative to
+                the VBM plus the VBM eigenvalue.
+            temperature (float or np.ndarray):
+                Temperature(s) in Kelvin.
+
+        Returns:
+            Electron and hole concentrations, as floats or arrays with the
+            broadcast shape of ``fermi_level`` and ``temperature``.
+        """
+        return self._evaluate(fermi_level, temperature, derivatives=False)
+
+    def get_e_h_conc_derivatives(
+        self, fermi_level: Union[float, np.ndarray], temperature: Union[float, np.ndarray]
+    ) -> tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        Get the derivatives of the electron and hole concentrations with
+        respect to the Fermi level (in cm^-3/eV), for the given Fermi level(s)
+        (in eV, `not` referenced to the VBM) and temperature(s) (in K).
+
+        Args:
+            fermi_level (float or np.ndarray):
+                Fermi level eigenvalue(s), i.e. the Fermi level relative to
+                the VBM plus the VBM eigenvalue.
+            temperature (float or np.ndarray):
+                Temperature(s) in Kelvin.
+
+        Returns:
+            Electron and hole concentration derivatives, as floats or arrays
+            with the broadcast shape of ``fermi_level`` and ``temperature``.
+        """
+        return self._evaluate(fermi_level, temperature, derivatives=True)
+
+    def _evaluate(
+        self,
+        fermi_level: Union[float, np.ndarray],
+        temperature: Union[float, np.ndarray],
+        derivatives: bool = False,
+    ) -> tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        Get the electron and hole concentrations (or their derivatives with
+        respect to the Fermi level, if ``derivatives = True``), using the
+        tabulated values where possible, otherwise directly integrating over
+        the (windowed, where valid) DOS.
+        """
+        fermi_level, temperature = np.broadcast_arrays(
+            np.asarray(fermi_level, dtype=float), np.asarray(temperature, dtype=float)
+        )
+        e_values, h_values = np.empty(fermi_level.shape), np.empty(fermi_level.shape)
+        in_range = (fermi_level >= self.fermi_level_range[0]) & (fermi_level <= self.fermi_level_range[1])
+
+        for temp in np.unique(temperature):
+            temp_mask = temperature == temp
+            rounded_temp = round(float(temp), 6)
+            if rounded_temp in self._tables:  # interpolate from tables
+                table_mask = temp_mask & in_range
+                for values, (spline, derivative_spline) in zip(
+                    [e_values, h_values], self._tables[rounded_temp]
+                ):
+                    values[table_mask] = np.exp(spline(fermi_level[table_mask]))
+                    if derivatives:  # d(conc)/dE_F = conc * d(log(conc))/dE_F
+                        values[table_mask] *= derivative_spline(fermi_level[table_mask])
+                temp_mask &= ~in_range
+
+            if not np.any(temp_mask):
+                continue
+
+            states = [self._electron_states, self._hole_states]
+            if self.temperatures and rounded_temp <= max(self.temperatures):  # windowed DOS valid
+                window_mask = temp_mask & in_range
+                windowed_states = [self._windowed_electron_states, self._windowed_hole_states]
+                if derivatives:
+                    e_values[window_mask], h_values[window_mask] = _get_e_h_conc_derivatives_from_states(
+                        *windowed_states, fermi_level[window_mask], temp
+                    )
+                else:
+                    e_values[window_mask], h_values[window_mask] = (
+                        np.exp(log_concs)
+                        for log_concs in self._get_log_concs(fermi_level[window_mask], temp)
+                    )
+                temp_mask &= ~in_range
+
+            if np.any(temp_mask):  # full DOS integral
+                if derivatives:
+                    e_values[temp_mask], h_values[temp_mask] = _get_e_h_conc_derivatives_from_states(
+                        *states, fermi_level[temp_mask], temp
+                    )
+                    continue
+
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore", "overflow")
+                    for values, (energies, weights), sign in [
+                        (e_values, self._electron_states, 1),
+                        (h_values, self._hole_states, -1),
+                    ]:
+                        values[temp_mask] = np.sum(
+                            weights[:, np.newaxis]
+                            * f0(sign * energies[:, np.newaxis], sign * fermi_level[temp_mask], temp),
+                            axis=0,
+                        )
+
+        if e_values.ndim == 0:
+            return float(e_values), float(h_values)
+        return e_values, h_values
+
+
 class DefectThermodynamics(MSONable):
     """
     Class for analysing the calculated thermodynamics of defects in solids.
@@ -674,32 +1485,20 @@ class DefectThermodynamics(MSONable):
         the pyCDT (pymatgen<=2022.7.25) thermodynamics code (deleted in later
         versions).
 
-        This function uses scipy's HalfspaceIntersection
-        to construct the polygons corresponding to defect stability as
-        a function of the Fermi-level. The Halfspace Intersection
-        constructs N-dimensional hyperplanes, in this case N=2, based
-        on the equation of defect formation energy with considering chemical
-        potentials:
-            E_form = E_0^{Corrected} + Q_{defect}*(E_{VBM} + E_{Fermi}).
-
-        Extra hyperplanes are constructed to bound this space so that
-        the algorithm can actually find enclosed region.
-
-        This code was modeled after the Halfspace Intersection code for
-        the Pourbaix Diagram.
+        As the defect formation energy (without chemical potentials) is linear
+        in the Fermi level:
+            E_form = E_0^{Corrected} + Q_{defect}*(E_{VBM} + E_{Fermi}),
+        the stable charge states of each defect are given by the lower envelope
+        of these lines, and the transition levels by the intersections between
+        consecutive lines on this envelope, for Fermi levels within
+        {VBM - 1, CBM + 1} eV. The lower envelope is determined exactly with
+        the convex hull trick in ``_get_lower_envelope()`` (which replaces the
+        previous ``scipy`` ``HalfspaceIntersection`` approach, modelled after
+        the Pourbaix Diagram code, giving the same results).
         """
-        # determine defect charge transition levels:
-        midgap_formation_energies = [  # without chemical potentials
-            entry.formation_energy(
-                fermi_level=0.5 * self.band_gap, vbm=entry.calculation_metadata.get("vbm", self.vbm)
-            )
-            for entry in self.defect_entries
-        ]
-        # set range to {min E_form - 30, max E_form +30} eV for y (formation energy), and
-        # {VBM - 1, CBM + 1} eV for x (fermi level)
-        min_y_lim = min(midgap_formation_energies) - 30
-        max_y_lim = max(midgap_formation_energies) + 30
-        limits = [[-1, self.band_gap + 1], [min_y_lim, max_y_lim]]  # type: ignore
+        self._concentration_models: dict = {}  # entries/stable entries may change, so clear cache
+        # determine defect charge transition levels, for Fermi levels from VBM - 1 to CBM + 1 eV:
+        fermi_level_range = [-1, self.band_gap + 1]  # type: ignore
 
         stable_entries: dict = {}
         defect_charge_map: dict = {}
@@ -707,11 +1506,9 @@ class DefectThermodynamics(MSONable):
         all_entries: dict = {}  # similar format to stable_entries, but with all (incl unstable) entries
 
         try:
-            defect_site_dict = group_defects_by_distance(self.defect_entries, dist_tol=self.dist_tol)
-            grouped_entries_list = [
-                entry_list for sub_dict in defect_site_dict.values() for entry_list in sub_dict.values()
-            ]
+            grouped_entries_list = self._group_defects_by_distance()
         except Exception as e:
+            self._grouping_cache = {}
             grouped_entries = group_defects_by_name(self.defect_entries)
             grouped_entries_list = list(grouped_entries.values())
             warnings.warn(
@@ -720,120 +1517,47 @@ class DefectThermodynamics(MSONable):
             )  # possibly different bulks (though this should be caught/warned about earlier), or not
             # parsed with recent doped versions etc
 
+        # reuse transition level info for groups with the same entries, energies, VBM and band gap:
+        previous_transition_level_cache = getattr(self, "_transition_level_cache", {})
+        transition_level_cache: dict = {}
         for grouped_defect_entries in grouped_entries_list:
-            sorted_defect_entries = sorted(
-                grouped_defect_entries, key=lambda x: (abs(x.charge_state), x.get_ediff())
-            )  # sort by charge, starting with closest to zero, and then formation energy for
-            # deterministic behaviour
-
-            # prepping coefficient matrix for half-space intersection
-            # [-Q, 1, -1*(E_form+Q*VBM)] -> -Q*E_fermi+E+-1*(E_form+Q*VBM) <= 0 where E_fermi and E are
-            # the variables in the hyperplanes
-            hyperplanes = np.array(
-                [
-                    [
-                        -1.0 * entry.charge_state,
-                        1,
-                        -1.0 * (entry.get_ediff() + entry.charge_state * self.vbm),  # type: ignore
-                    ]
-                    for entry in sorted_defect_entries
-                ]
+            group_key = tuple(id(entry) for entry in grouped_defect_entries)
+            group_energies = (
+                tuple(entry.get_ediff() for entry in grouped_defect_entries),
+                self.vbm,
+                self.band_gap,
             )
+            cached = previous_transition_level_cache.get(group_key)
+            if (
+                cached is not None
+                and cached[1] == group_energies
+                and _entries_match(cached[0], grouped_defect_entries)
+            ):
+                group_info = cached[2]
+            else:
+                group_info = self._get_group_transition_levels(grouped_defect_entries, fermi_level_range)
+            transition_level_cache[group_key] = (tuple(grouped_defect_entries), group_energies, group_info)
 
-            border_hyperplanes = [
-                [-1, 0, limits[0][0]],
-                [1, 0, -1 * limits[0][1]],
-                [0, -1, limits[1][0]],
-                [0, 1, -1 * limits[1][1]],
-            ]
-            hs_hyperplanes = np.vstack([hyperplanes, border_hyperplanes])
-            interior_point = [self.band_gap / 2, min(midgap_formation_energies) - 1.0]  # type: ignore
-            hs_ints = HalfspaceIntersection(hs_hyperplanes, np.array(interior_point))
-
-            # Group the intersections and corresponding facets
-            ints_and_facets_zip = zip(hs_ints.intersections, hs_ints.dual_facets)
-            # Only include the facets corresponding to entries, not the boundaries
-            total_entries = len(sorted_defect_entries)
-            ints_and_facets_filter = filter(
-                lambda int_and_facet: all(np.array(int_and_facet[1]) < total_entries),
-                ints_and_facets_zip,
-            )
-            # sort based on transition level
-            ints_and_facets_list = sorted(
-                ints_and_facets_filter, key=lambda int_and_facet: int_and_facet[0][0]
-            )
-
-            # take simplest (shortest) possible defect name, with lowest energy, as the name for that group
-            possible_defect_names_and_energies = [
-                (defect_entry.name.rsplit("_", 1)[0], defect_entry.get_ediff())
-                for defect_entry in sorted_defect_entries
-            ]  # names without charge
-            defect_name_wout_charge = min(
-                possible_defect_names_and_energies, key=lambda x: (len(x[0]), x[1])
-            )[0]
-
+            (
+                defect_name_wout_charge,
+                sorted_defect_entries,
+                group_transition_levels,
+                group_stable_entries,
+                group_charges,
+            ) = group_info
             defect_name_wout_charge, output_dicts = _rename_key_and_dicts(
                 defect_name_wout_charge,
                 [transition_level_map, all_entries, stable_entries, defect_charge_map],
             )
             transition_level_map, all_entries, stable_entries, defect_charge_map = output_dicts
 
-            if len(ints_and_facets_list) > 0:  # unpack into lists
-                _, facets = zip(*ints_and_facets_list)
-                transition_level_map[defect_name_wout_charge] = {  # map of transition level: charge states
-                    intersection[0]: sorted(
-                        [sorted_defect_entries[i].charge_state for i in facet], reverse=True
-                    )
-                    for intersection, facet in ints_and_facets_list
-                }
-                stable_entries[defect_name_wout_charge] = [
-                    sorted_defect_entries[i] for dual in facets for i in dual
-                ]
-                defect_charge_map[defect_name_wout_charge] = sorted(
-                    [entry.charge_state for entry in sorted_defect_entries], reverse=True
-                )
+            # copies, so that the cached info is not modified if these dicts are edited:
+            transition_level_map[defect_name_wout_charge] = dict(group_transition_levels)
+            stable_entries[defect_name_wout_charge] = list(group_stable_entries)
+            defect_charge_map[defect_name_wout_charge] = list(group_charges)
+            all_entries[defect_name_wout_charge] = list(sorted_defect_entries)
 
-            elif len(sorted_defect_entries) == 1:
-                transition_level_map[defect_name_wout_charge] = {}
-                stable_entries[defect_name_wout_charge] = [sorted_defect_entries[0]]
-                defect_charge_map[defect_name_wout_charge] = [sorted_defect_entries[0].charge_state]
-
-            else:  # if ints_and_facets is empty, then there is likely only one defect...
-                # confirm formation energies dominant for one defect over other identical defects
-                name_set = [entry.name for entry in sorted_defect_entries]
-                vb_list = [
-                    entry.formation_energy(
-                        fermi_level=limits[0][0], vbm=entry.calculation_metadata.get("vbm", self.vbm)
-                    )
-                    for entry in sorted_defect_entries
-                ]
-                cb_list = [
-                    entry.formation_energy(
-                        fermi_level=limits[0][1], vbm=entry.calculation_metadata.get("vbm", self.vbm)
-                    )
-                    for entry in sorted_defect_entries
-                ]
-
-                vbm_def_index = vb_list.index(min(vb_list))
-                name_stable_below_vbm = name_set[vbm_def_index]
-                cbm_def_index = cb_list.index(min(cb_list))
-                name_stable_above_cbm = name_set[cbm_def_index]
-
-                if name_stable_below_vbm != name_stable_above_cbm:
-                    raise ValueError(
-                        f"HalfSpace identified only one stable charge out of list: {name_set}\n"
-                        f"But {name_stable_below_vbm} is stable below vbm and "
-                        f"{name_stable_above_cbm} is stable above cbm.\nList of VBM formation "
-                        f"energies: {vb_list}\nList of CBM formation energies: {cb_list}"
-                    )
-
-                transition_level_map[defect_name_wout_charge] = {}
-                stable_entries[defect_name_wout_charge] = [sorted_defect_entries[vbm_def_index]]
-                defect_charge_map[defect_name_wout_charge] = sorted(
-                    [entry.charge_state for entry in sorted_defect_entries], reverse=True
-                )
-
-            all_entries[defect_name_wout_charge] = sorted_defect_entries
+        self._transition_level_cache = transition_level_cache
 
         self.transition_level_map = transition_level_map
         self.stable_entries = stable_entries
@@ -842,8 +1566,8 @@ class DefectThermodynamics(MSONable):
 
         # sort dictionaries deterministically:
         self._name_wout_charge_appearance_order = {
-            entry.name.rsplit("_", 1)[0]: self._defect_entries.index(entry)
-            for entry in self._defect_entries  # already sorted according to _sort_defect_entries()
+            entry.name.rsplit("_", 1)[0]: i
+            for i, entry in enumerate(self._defect_entries)  # already sorted with _sort_defect_entries()
         }
 
         def _map_sorting_func(name_wout_charge):
@@ -878,6 +1602,152 @@ class DefectThermodynamics(MSONable):
             for defect_name, entries in stable_entries.items()
         }
 
+    def _group_defects_by_distance(self) -> list[list[DefectEntry]]:
+        r"""
+        Group the defect entries by the distances between equivalent defect
+        sites, using ``group_defects_by_distance()``.
+
+        The groupings are cached for each nominal defect type (i.e.
+        ``DefectEntry.defect.name``), so that only defect types with new,
+        removed or reordered entries (or all types, if ``dist_tol`` has changed)
+        are regrouped when reparsing (e.g. with ``add_entries()``), as the
+        grouping of each defect type is independent of the others.
+
+        Returns:
+            list: List of lists of grouped ``DefectEntry``\s.
+        """
+        entries_by_defect_type: dict[str, list[DefectEntry]] = {}
+        for entry in self.defect_entries:
+            entries_by_defect_type.setdefault(entry.defect.name, []).append(entry)
+
+        grouping_cache = getattr(self, "_grouping_cache", {})
+        entries_to_group = [
+            entry
+            for defect_type, entry_list in entries_by_defect_type.items()
+            if defect_type not in grouping_cache
+            or grouping_cache[defect_type][1] != self.dist_tol
+            or not _entries_match(grouping_cache[defect_type][0], entry_list)
+            for entry in entry_list
+        ]
+        if entries_to_group:
+            defect_site_dict = group_defects_by_distance(entries_to_group, dist_tol=self.dist_tol)
+            for defect_type, sub_dict in defect_site_dict.items():
+                grouping_cache[defect_type] = (
+                    tuple(entries_by_defect_type[defect_type]),
+                    self.dist_tol,
+                    list(sub_dict.values()),
+                )
+
+        self._grouping_cache = {  # only keep current defect types
+            defect_type: grouping_cache[defect_type] for defect_type in entries_by_defect_type
+        }
+        return [
+            entry_list
+            for defect_type in entries_by_defect_type
+            for entry_list in self._grouping_cache[defect_type][2]
+        ]
+
+    def _get_group_transition_levels(
+        self, grouped_defect_entries: list[DefectEntry], fermi_level_range: list[float]
+    ) -> tuple[str, list[DefectEntry], dict, list[DefectEntry], list[int]]:
+        """
+        Determine the stable charge states and transition levels for a group of
+        defect entries (i.e. the same defect, in different charge states), for
+        Fermi levels within ``fermi_level_range``.
+
+        Returns:
+            Tuple of the group name (without charge), the sorted group entries,
+            the ``{transition level: [charge states]}`` dict, the list of stable
+            entries and the list of charge states for the group.
+        """
+        sorted_defect_entries = sorted(
+            grouped_defect_entries, key=lambda x: (abs(x.charge_state), x.get_ediff())
+        )  # sort by charge, starting with closest to zero, and then formation energy for
+        # deterministic behaviour
+
+        # formation energies are linear in the Fermi level (y = q*E_F + E_0 + q*VBM), so the stable
+        # charge states and transition levels are given by the lower envelope of these lines:
+        envelope_indices, transition_levels = _get_lower_envelope(
+            slopes=[entry.charge_state for entry in sorted_defect_entries],
+            intercepts=[
+                entry.get_ediff() + entry.charge_state * self.vbm  # type: ignore
+                for entry in sorted_defect_entries
+            ],
+            x_range=fermi_level_range,
+        )
+        ints_and_facets_list = [  # (transition level, (index of entry below TL, index above TL))
+            (transition_level, envelope_indices[i : i + 2])
+            for i, transition_level in enumerate(transition_levels)
+        ]
+
+        # take simplest (shortest) possible defect name, with lowest energy, as the name for that group
+        possible_defect_names_and_energies = [
+            (defect_entry.name.rsplit("_", 1)[0], defect_entry.get_ediff())
+            for defect_entry in sorted_defect_entries
+        ]  # names without charge
+        defect_name_wout_charge = min(possible_defect_names_and_energies, key=lambda x: (len(x[0]), x[1]))[
+            0
+        ]
+
+        if len(ints_and_facets_list) > 0:  # unpack into lists
+            _, facets = zip(*ints_and_facets_list)
+            group_transition_levels = {  # map of transition level: charge states
+                transition_level: sorted(
+                    [sorted_defect_entries[i].charge_state for i in facet], reverse=True
+                )
+                for transition_level, facet in ints_and_facets_list
+            }
+            group_stable_entries = [sorted_defect_entries[i] for dual in facets for i in dual]
+            group_charges = sorted([entry.charge_state for entry in sorted_defect_entries], reverse=True)
+
+        elif len(sorted_defect_entries) == 1:
+            group_transition_levels = {}
+            group_stable_entries = [sorted_defect_entries[0]]
+            group_charges = [sorted_defect_entries[0].charge_state]
+
+        else:  # if ints_and_facets is empty, then there is likely only one defect...
+            # confirm formation energies dominant for one defect over other identical defects
+            name_set = [entry.name for entry in sorted_defect_entries]
+            vb_list = [
+                entry.formation_energy(
+                    fermi_level=fermi_level_range[0],
+                    vbm=entry.calculation_metadata.get("vbm", self.vbm),
+                )
+                for entry in sorted_defect_entries
+            ]
+            cb_list = [
+                entry.formation_energy(
+                    fermi_level=fermi_level_range[1],
+                    vbm=entry.calculation_metadata.get("vbm", self.vbm),
+                )
+                for entry in sorted_defect_entries
+            ]
+
+            vbm_def_index = vb_list.index(min(vb_list))
+            name_stable_below_vbm = name_set[vbm_def_index]
+            cbm_def_index = cb_list.index(min(cb_list))
+            name_stable_above_cbm = name_set[cbm_def_index]
+
+            if name_stable_below_vbm != name_stable_above_cbm:
+                raise ValueError(
+                    f"Lower envelope identified only one stable charge out of list: {name_set}\n"
+                    f"But {name_stable_below_vbm} is stable below vbm and "
+                    f"{name_stable_above_cbm} is stable above cbm.\nList of VBM formation "
+                    f"energies: {vb_list}\nList of CBM formation energies: {cb_list}"
+                )
+
+            group_transition_levels = {}
+            group_stable_entries = [sorted_defect_entries[vbm_def_index]]
+            group_charges = sorted([entry.charge_state for entry in sorted_defect_entries], reverse=True)
+
+        return (
+            defect_name_wout_charge,
+            sorted_defect_entries,
+            group_transition_levels,
+            group_stable_entries,
+            group_charges,
+        )
+
     def _check_bulk_compatibility(self):
         """
         Helper function to quickly check if all entries have compatible bulk
@@ -964,6 +1834,10 @@ class DefectThermodynamics(MSONable):
         """
         Add additional defect entries to the DefectThermodynamics object.
 
+        Only the defect types with new entries are regrouped and have their
+        transition levels recomputed, with the cached groupings and transition
+        level info reused for all other defects.
+
         Args:
             defect_entries ([DefectEntry] or {str: DefectEntry}):
                 A list or dict of DefectEntry objects, to add to the
@@ -990,6 +1864,64 @@ class DefectThermodynamics(MSONable):
         self._defect_entries += defect_entries
         self._sort_parse_and_check_entries(check_compatibility=check_compatibility)
 
+    def recompute_corrections(
+        self,
+        correction_type: Optional[str] = None,
+        dielectric: Optional[Union[float, int, np.ndarray, list]] = None,
+        error_tolerance: float = 0.05,
+        processes: Optional[int] = None,
+        **kwargs,
+    ):
+        r"""
+        Recompute the finite-size charge corrections for all charged defect
+        entries in the DefectThermodynamics object (e.g. after changing the
+        dielectric constant or ``defect_region_radius``), updating the
+        ``corrections`` of each ``DefectEntry`` in place, and then reparse the
+        transition levels once at the end.
+
+        The corrections are computed in parallel, with the bulk-side data
+        shared between entries and the supercell Ewald sums cached; see
+        ``doped.corrections.recompute_corrections()`` for details.
+
+        Args:
+            correction_type (str):
+                Charge correction to compute, either ``"kumagai"`` (eFNV) or
+                ``"freysoldt"`` (FNV). If ``None`` (default), the previously
+                applied charge correction type is used for each defect entry
+                (or the correction for which data is available, if none applied).
+            dielectric (float or int or 3x1 matrix or 3x3 matrix):
+                Total dielectric constant of the host compound. If set, this is
+                also updated in the ``calculation_metadata`` of each defect entry
+                for which the charge correction is successfully recomputed.
+                If ``None`` (default), the dielectric constant in each defect
+                entry's ``calculation_metadata`` is used.
+            error_tolerance (float):
+                If the estimated error in any charge correction is greater than
+                this value (in eV), then a warning is raised. (default: 0.05 eV)
+            processes (int):
+                Number of processes to use for computing the corrections in
+                parallel. If ``None`` (default), uses up to ``cpu_count() - 1``
+                processes.
+            **kwargs:
+                Additional keyword arguments to pass to
+                ``DefectEntry.get_kumagai_correction()`` or
+                ``DefectEntry.get_freysoldt_correction()`` (e.g.
+                ``defect_region_radius`` for the Kumagai (eFNV) correction).
+        """
+        from doped.corrections import recompute_corrections  # avoid circular import
+
+        recompute_corrections(
+            self.defect_entries,
+            correction_type=correction_type,
+            dielectric=dielectric,
+            error_tolerance=error_tolerance,
+            processes=processes,
+            **kwargs,
+        )
+        with warnings.catch_warnings():  # ignore formation energies chempots warning when just parsing TLs
+            warnings.filterwarnings("ignore", message="No chemical potentials")
+            self._parse_transition_levels()
+
     @property
     def defect_entries(self):
         """
@@ -1258,29 +2190,25 @@ class DefectThermodynamics(MSONable):
             chempots, el_refs
         )  # returns self.chempots/self.el_refs if chempots is None
         skip_formatting = skip_formatting or lean
+        if chempots is None:
+            _no_chempots_warning()
 
-        energy_concentration_list = []
+        concentration_model = self._get_concentration_model()
+        formation_energies = concentration_model.get_formation_energies(
+            fermi_level, concentration_model.get_chempots_vector(chempots, limit, el_refs)
+        )
+        raw_concentrations = concentration_model.get_concentrations(
+            fermi_level, temperature, per_site=per_site, formation_energies=formation_energies
+        )
 
-        for defect_entry in self.defect_entries:
-            formation_energy = defect_entry.formation_energy(
-                chempots=chempots,
-                limit=limit,
-                el_refs=el_refs,
-                fermi_level=fermi_level,
-                vbm=defect_entry.calculation_metadata.get("vbm", self.vbm),
-            )
-            raw_concentration = defect_entry.equilibrium_concentration(
-                chempots=chempots,
-                limit=limit,
-                el_refs=el_refs,
-                fermi_level=fermi_level,
-                vbm=self.vbm,
-                temperature=temperature,
-                per_site=per_site,
-                formation_energy=formation_energy,  # reduce compute times
-            )
+        energy_concentration_list = []
 
-            defect_name = defect_entry.name.rsplit("_", 1)[0]  # name without charge
+        for defect_entry, defect_name, formation_energy, raw_concentration in zip(
+            self.defect_entries,
+            concentration_model.names,  # names without charge
+            formation_energies.tolist(),
+            raw_concentrations.tolist(),
+        ):
             charge = (
                 defect_entry.charge_state
                 if skip_formatting
@@ -1331,13 +2259,14 @@ class DefectThermodynamics(MSONable):
         )
 
     def _parse_fermi_dos(
-        self, bulk_dos: Union[str, Vasprun, FermiDos], skip_check: bool = False
-    ) -> FermiDos:
-        if isinstance(bulk_dos, FermiDos):
+        self, bulk_dos: Union[str, Vasprun, FermiDos, CarrierConcentrationModel], skip_check: bool = False
+    ) -> Union[FermiDos, CarrierConcentrationModel]:
+        if isinstance(bulk_dos, (FermiDos, CarrierConcentrationModel)):
             fdos = bulk_dos
+            dos = bulk_dos.fermi_dos if isinstance(bulk_dos, CarrierConcentrationModel) else bulk_dos
             # most similar settings to Vasprun.eigenvalue_band_properties:
-            fdos_vbm = fdos.get_cbm_vbm(tol=1e-4, abs_tol=True)[1]  # tol 1e-4 is lowest possible, as VASP
-            fdos_band_gap = fdos.get_gap(tol=1e-4, abs_tol=True)  # rounds the DOS outputs to 4 dp
+            fdos_vbm = dos.get_cbm_vbm(tol=1e-4, abs_tol=True)[1]  # tol 1e-4 is lowest possible, as VASP
+            fdos_band_gap = dos.get_gap(tol=1e-4, abs_tol=True)  # rounds the DOS outputs to 4 dp
 
         if isinstance(bulk_dos, str):
             bulk_dos = get_vasprun(bulk_dos, parse_dos=True)  # converted to fdos in next block
@@ -1366,15 +2295,174 @@ class DefectThermodynamics(MSONable):
             )
         return fdos
 
+    def _get_concentration_model(self, stable_entries_only: bool = False) -> DefectConcentrationModel:
+        """
+        Get the ``DefectConcentrationModel`` for ``self.defect_entries`` (or
+        ``self.all_stable_entries`` if ``stable_entries_only`` is ``True``),
+        reusing the model cached on this object if its entries, their energies
+        and the VBM are unchanged.
+
+        The cached degeneracy factors and bulk site concentrations of the model
+        are recomputed if those of any entry have changed since the last call.
+        The cache is cleared whenever the transition levels are reparsed (i.e.
+        when entries are set or added, or ``dist_tol`` is changed).
+        """
+        entries = self.all_stable_entries if stable_entries_only else self.defect_entries
+        site_properties = [  # determine the (lazily-parsed) degeneracies and site concentrations
+            (tuple(sorted(entry.degeneracy_factors.items())), entry.bulk_site_concentration)
+            for entry in entries
+        ]
+        concentration_models = getattr(self, "_concentration_models", {})
+        cached = concentration_models.get(stable_entries_only)
+        if (
+            cached is not None
+            and cached[0] == self.vbm
+            and len(cached[1].defect_entries) == len(entries)
+            and all(a is b for a, b in zip(cached[1].defect_entries, entries))
+            and np.array_equal(cached[1].ediffs, [entry.get_ediff() for entry in entries])
+        ):
+            concentration_model = cached[1]
+            if cached[2] != site_properties:  # reparse degeneracies/site concentrations on next use
+                for cached_property_name in ["degeneracies", "site_concentrations"]:
+                    concentration_model.__dict__.pop(cached_property_name, None)
+        else:
+            concentration_model = DefectConcentrationModel(entries, vbm=self.vbm)  # type: ignore
+
+        concentration_models[stable_entries_only] = (self.vbm, concentration_model, site_properties)
+        self._concentration_models = concentration_models
+        return concentration_model
+
+    def _get_log_charge_balance_function(
+        self,
+        fermi_dos: Union[FermiDos, CarrierConcentrationModel],
+        concentration_model: DefectConcentrationModel,
+        temperature: Union[float, np.ndarray],
+        chempots_vector: Optional[np.ndarray] = None,
+        total_concentrations: Optional[np.ndarray] = None,
+    ):
+        """
+        Get a function which returns the log charge balance (and its
+        derivative) for given Fermi level(s) relative to the VBM, for
+        ``_safeguarded_newton``.
+
+        If ``total_concentrations`` is provided, the total concentration of
+        each defect is fixed to these values (i.e. frozen defect approximation,
+        as in ``get_quenched_fermi_level_and_concentrations()``).
+        """
+
+        def _get_log_charge_balance(fermi_level):
+            if total_concentrations is None:
+                concentrations = concentration_model.get_concentrations(
+                    fermi_level, temperature, chempots_vector
+                )
+            else:
+                concentrations = concentration_model.get_constrained_concentrations(
+                    fermi_level, temperature, total_concentrations, chempots_vector
+                )
+            concentration_derivatives = concentration_model.get_concentration_derivatives(
+                concentrations, temperature, constrained=total_concentrations is not None
+            )
+            return concentration_model.get_log_charge_balance(
+                concentrations,
+                concentration_derivatives,
+                *get_e_h_concs(fermi_dos, fermi_level + self.vbm, temperature),
+                *_get_e_h_conc_derivatives(fermi_dos, fermi_level + self.vbm, temperature),
+            )
+
+        return _get_log_charge_balance
+
+    def _solve_fermi_levels(
+        self,
+        fermi_dos: Union[FermiDos, CarrierConcentrationModel],
+        concentration_model: DefectConcentrationModel,
+        temperatures: np.ndarray,
+        chempots_vectors: np.ndarray,
+        total_concentrations: Optional[np.ndarray] = None,
+        solver: str = "bisect",
+    ) -> np.ndarray:
+        """
+        Solve for the self-consistent Fermi levels (relative to ``self.vbm``)
+        under many conditions (``temperatures`` and ``chempots_vectors``
+        arrays) at once, with the vectorised ``solver`` (``"bisect"`` or
+        ``"newton"``).
+
+        If ``total_concentrations`` is provided, the total concentration of
+        each defect is fixed to these values (i.e. frozen defect approximation,
+        as in ``get_quenched_fermi_level_and_concentrations()``).
+        """
+        lower = np.full(len(temperatures), -1.0)
+        upper = np.full(len(temperatures), self.band_gap + 1.0)  # type: ignore
+        if solver == "newton":
+            return _safeguarded_newton(  # type: ignore
+                self._get_log_charge_balance_function(
+                    fermi_dos, concentration_model, temperatures, chempots_vectors, total_concentrations
+                ),
+                lower,
+                upper,
+            )
+
+        def _get_total_q(fermi_levels):
+            if total_concentrations is None:
+                concentrations = concentration_model.get_concentrations(
+                    fermi_levels, temperatures, chempots_vectors
+                )
+            else:
+                concentrations = concentration_model.get_constrained_concentrations(
+                    fermi_levels, temperatures, total_concentrations, chempots_vectors
+                )
+            return concentration_model.get_total_charge(concentrations) + get_doping(
+                fermi_dos=fermi_dos, fermi_level=fermi_levels + self.vbm, temperature=temperatures
+            )
+
+        return _vectorised_bisect(_get_total_q, lower, upper)
+
+    def _solve_quenched_fermi_levels(
+        self,
+        annealing_dos: Union[FermiDos, CarrierConcentrationModel],
+        concentration_model: DefectConcentrationModel,
+        annealing_temperatures: np.ndarray,
+        quenched_temperatures: np.ndarray,
+        chempots_vectors: np.ndarray,
+        solver: str = "bisect",
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Solve for the annealing and quenched Fermi levels (relative to
+        ``self.vbm``) under many conditions at once, within the frozen defect
+        approximation, using ``annealing_dos`` at the annealing temperatures
+        and ``self.fermi_dos`` at the quenched temperatures.
+
+        Returns the annealing Fermi levels, quenched Fermi levels and total
+        defect concentrations (fixed at the annealing temperatures).
+        """
+        annealing_fermi_levels = self._solve_fermi_levels(
+            annealing_dos, concentration_model, annealing_temperatures, chempots_vectors, solver=solver
+        )
+        total_concentrations = concentration_model.get_defect_totals(
+            concentration_model.get_concentrations(
+                annealing_fermi_levels, annealing_temperatures, chempots_vectors
+            )
+        )
+        quenched_fermi_levels = self._solve_fermi_levels(
+            self.fermi_dos,
+            concentration_model,
+            quenched_temperatures,
+            chempots_vectors,
+            total_concentrations=total_concentrations,
+            solver=solver,
+        )
+        return annealing_fermi_levels, quenched_fermi_levels, total_concentrations
+
     def get_equilibrium_fermi_level(
         self,
-        bulk_dos: Optional[Union[FermiDos, Vasprun, str]] = None,
+        bulk_dos: Optional[Union[FermiDos, CarrierConcentrationModel, Vasprun, str]] = None,
         chempots: Optional[dict] = None,
         limit: Optional[str] = None,
         el_refs: Optional[dict] = None,
         temperature: float = 300,
         return_concs: bool = False,
         skip_check: bool = False,
+        solver: str = "brentq",
+        initial_fermi_level: Optional[float] = None,
     ) -> Union[float, tuple[float, float, float]]:
         r"""
         Calculate the self-consistent Fermi level, at a given chemical
@@ -1473,11 +2561,24 @@ class DefectThermodynamics(MSONable):
                 Whether to skip the warning about the DOS VBM differing from ``self.vbm``
                 by >0.05 eV. Should only be used when the reason for this difference is
                 known/acceptable. (default: False)
+            solver (str):
+                Root-finding algorithm used to solve for charge neutrality. Either
+                ``"brentq"`` (default; ``scipy.optimize.brentq`` on the total charge)
+                or ``"newton"``, which uses Newton steps (safeguarded by bisection) on
+                the log charge balance with its analytic derivative (from the defect
+                charges, sum(q^2 c)/kT, and the bulk DOS), typically requiring several
+                times fewer function evaluations.
+            initial_fermi_level (float):
+                Initial guess (warm start) for the Fermi level (in eV from the VBM),
+                used with ``solver = "newton"``, e.g. the solution from a previous
+                (similar) condition when looping over temperatures or chemical
+                potentials. If ``None`` (default), the solver starts from mid-gap.
 
         Returns:
             Self consistent Fermi level (in eV from the VBM (``self.vbm``)), and the
             corresponding electron and hole concentrations (in cm^-3) if ``return_concs=True``.
         """
+        _check_solver(solver, ["brentq", "newton"])
         if bulk_dos is not None:
             self.fermi_dos = self._parse_fermi_dos(bulk_dos, skip_check=skip_check)
         elif not hasattr(self, "fermi_dos"):
@@ -1494,16 +2595,14 @@ class DefectThermodynamics(MSONable):
             # called many times
             _no_chempots_warning()
 
+        # precompile per-entry arrays once, rather than re-looping over entries in each brentq step:
+        concentration_model = self._get_concentration_model()
+        chempots_vector = concentration_model.get_chempots_vector(chempots, limit, el_refs)
+
         def _get_total_q(fermi_level):
-            conc_df = self.get_equilibrium_concentrations(
-                chempots=chempots,
-                limit=limit,
-                el_refs=el_refs,
-                temperature=temperature,
-                fermi_level=fermi_level,
-                lean=True,
+            qd_tot = concentration_model.get_total_charge(
+                concentration_model.get_concentrations(fermi_level, temperature, chempots_vector)
             )
-            qd_tot = (conc_df["Charge"] * conc_df["Concentration (cm^-3)"]).sum()
             qd_tot += get_doping(
                 fermi_dos=self.fermi_dos, fermi_level=fermi_level + self.vbm, temperature=temperature
             )
@@ -1513,7 +2612,17 @@ class DefectThermodynamics(MSONable):
             warnings.filterwarnings("ignore", "No chemical potentials")  # ignore chempots warning,
             # as given once above
 
-            eq_fermi_level: float = brentq(_get_total_q, -1.0, self.band_gap + 1.0)  # type: ignore
+            if solver == "newton":
+                eq_fermi_level: float = _safeguarded_newton(  # type: ignore
+                    self._get_log_charge_balance_function(
+                        self.fermi_dos, concentration_model, temperature, chempots_vector
+                    ),
+                    -1.0,
+                    self.band_gap + 1.0,  # type: ignore
+                    initial=initial_fermi_level,
+                )
+            else:
+                eq_fermi_level = brentq(_get_total_q, -1.0, self.band_gap + 1.0)  # type: ignore
             if return_concs:
                 e_conc, h_conc = get_e_h_concs(
                     self.fermi_dos, eq_fermi_level + self.vbm, temperature  # type: ignore
@@ -1522,9 +2631,124 @@ class DefectThermodynamics(MSONable):
 
         return eq_fermi_level
 
+    def get_equilibrium_fermi_levels(
+        self,
+        bulk_dos: Optional[Union[FermiDos, CarrierConcentrationModel, Vasprun, str]] = None,
+        chempots: Optional[dict] = None,
+        limits: Optional[list[str]] = None,
+        el_refs: Optional[dict] = None,
+        temperatures: Union[float, list[float], np.ndarray] = 300,
+        skip_check: bool = False,
+        solver: str = "bisect",
+    ) -> pd.DataFrame:
+        r"""
+        Calculate the self-consistent Fermi levels and corresponding carrier
+        concentrations for many chemical potential limits and temperatures at
+        once, assuming `equilibrium` defect concentrations and the dilute
+        limit approximation.
+
+        This gives the same results as looping over
+        ``DefectThermodynamics.get_equilibrium_fermi_level()``, but solves
+        for charge neutrality under all conditions simultaneously (using
+        vectorised bisection), which is much faster for large sweeps over
+        temperatures and chemical potentials.
+
+        Note that the returned Fermi levels are given relative to ``self.vbm``,
+        which is the VBM eigenvalue of the bulk supercell calculation by
+        default, unless ``bulk_band_gap_vr`` is set during defect parsing.
+
+        Args:
+            bulk_dos (FermiDos or Vasprun or str):
+                ``pymatgen`` ``FermiDos`` for the bulk electronic density of states (DOS),
+                for calculating carrier concentrations. Alternatively, can be a ``pymatgen``
+                ``Vasprun`` object or path to the ``vasprun.xml(.gz)`` output of a bulk DOS
+                calculation in VASP. See ``get_equilibrium_fermi_level()`` for more details.
+
+                ``bulk_dos`` can also be left as ``None`` (default), if it has previously
+                been provided and parsed, and thus is set as the ``self.fermi_dos`` attribute.
+            chempots (dict):
+                Dictionary of chemical potentials to use for calculating the defect
+                formation energies (and thus concentrations and Fermi levels).
+                If ``None`` (default), will use ``self.chempots`` (= 0 for all chemical
+                potentials by default). Same format as in ``get_equilibrium_fermi_level()``.
+            limits (list):
+                List of chemical potential limits for which to determine the equilibrium
+                Fermi levels. Each limit can be either ``"X-rich"/"X-poor"`` where X is an
+                element in the system (e.g. ``"Li-rich"``), or a key in the
+                ``(self.)chempots["limits"]`` dictionary. If ``None`` (default), all limits
+                in ``chempots`` are used.
+            el_refs (dict):
+                Dictionary of elemental reference energies for the chemical potentials
+                in the format:
+                ``{element symbol: reference energy}`` (to determine the formal chemical
+                potentials, when ``chempots`` has been manually specified as
+                ``{element symbol: chemical potential}``). Unnecessary if ``chempots`` is
+                provided/present in format generated by ``doped`` (see tutorials).
+                (Default: None)
+            temperatures (float or list or np.ndarray):
+                Temperature(s) in Kelvin at which to calculate the equilibrium Fermi
+                levels. Default is 300 K.
+            skip_check (bool):
+                Whether to skip the warning about the DOS VBM differing from ``self.vbm``
+                by >0.05 eV. Should only be used when the reason for this difference is
+                known/acceptable. (default: False)
+            solver (str):
+                Vectorised root-finding algorithm used to solve for charge neutrality.
+                Either ``"bisect"`` (default) or ``"newton"``, which uses Newton steps
+                (safeguarded by bisection) with the analytic derivative of the log
+                charge balance, typically requiring several times fewer function
+                evaluations. See ``get_equilibrium_fermi_level()``.
+
+        Returns:
+            ``pandas`` ``DataFrame`` with one row per (limit, temperature) combination,
+            and columns ``"limit"``, ``"Temperature (K)"``, ``"Fermi Level (eV wrt VBM)"``,
+            ``"Electron Concentration (cm^-3)"`` and ``"Hole Concentration (cm^-3)"``.
+        """
+        _check_solver(solver, ["bisect", "newton"])
+        if bulk_dos is not None:
+            self.fermi_dos = self._parse_fermi_dos(bulk_dos, skip_check=skip_check)
+        elif not hasattr(self, "fermi_dos"):
+            raise ValueError(
+                "No bulk DOS calculation (`bulk_dos`) provided or previously parsed to "
+                "`DefectThermodynamics.fermi_dos`, which is required for calculating carrier "
+                "concentrations and solving for Fermi level position."
+            )
+
+        chempots, el_refs = self._get_chempots(
+            chempots, el_refs
+        )  # returns self.chempots/self.el_refs if chempots is None
+        if chempots is None:
+            _no_chempots_warning()
+            limits = [None]  # type: ignore
+        elif limits is None:
+            limits = list(chempots["limits"].keys())
+
+        concentration_model = self._get_concentration_model()
+        chempots_vectors = {
+            limit: concentration_model.get_chempots_vector(chempots, limit, el_refs) for limit in limits
+        }
+        conditions = list(product(limits, np.atleast_1d(temperatures).astype(float).tolist()))
+        chempots_array = np.array([chempots_vectors[limit] for limit, _temp in conditions])
+        temperatures_array = np.array([temp for _limit, temp in conditions])
+
+        eq_fermi_levels = self._solve_fermi_levels(
+            self.fermi_dos, concentration_model, temperatures_array, chempots_array, solver=solver
+        )
+        e_concs, h_concs = get_e_h_concs(self.fermi_dos, eq_fermi_levels + self.vbm, temperatures_array)
+
+        return pd.DataFrame(
+            {
+                "limit": [limit for limit, _temp in conditions],
+                "Temperature (K)": temperatures_array,
+                "Fermi Level (eV wrt VBM)": eq_fermi_levels,
+                "Electron Concentration (cm^-3)": e_concs,
+                "Hole Concentration (cm^-3)": h_concs,
+            }
+        )
+
     def get_quenched_fermi_level_and_concentrations(
         self,
-        bulk_dos: Optional[Union[FermiDos, Vasprun, str]] = None,
+        bulk_dos: Optional[Union[FermiDos, CarrierConcentrationModel, Vasprun, str]] = None,
         chempots: Optional[dict] = None,
         limit: Optional[str] = None,
         el_refs: Optional[dict] = None,
@@ -1535,6 +2759,8 @@ class DefectThermodynamics(MSONable):
         per_site: bool = False,
         skip_formatting: bool = False,
         return_annealing_values: bool = False,
+        solver: str = "brentq",
+        initial_fermi_level: Optional[float] = None,
         **kwargs,
     ) -> Union[
         tuple[float, float, float, pd.DataFrame],
@@ -1678,6 +2904,15 @@ class DefectThermodynamics(MSONable):
             return_annealing_values (bool):
                 If True, also returns the Fermi level, electron and hole concentrations and
                 defect concentrations at the annealing temperature. (default: False)
+            solver (str):
+                Root-finding algorithm used to solve for charge neutrality, at both the
+                annealing and quenched temperatures. Either ``"brentq"`` (default) or
+                ``"newton"``. See ``get_equilibrium_fermi_level()``.
+            initial_fermi_level (float):
+                Initial guess (warm start) for the `quenched` Fermi level (in eV from the
+                VBM), used with ``solver = "newton"``, e.g. the solution from a previous
+                (similar) condition when scanning annealing temperatures or chemical
+                potentials. If ``None`` (default), the solver starts from mid-gap.
             **kwargs:
                 Additional keyword arguments to pass to ``scissor_dos`` (if ``delta_gap``
                 is not 0) or ``_parse_fermi_dos`` (``skip_check``; to skip the warning about
@@ -1696,6 +2931,7 @@ class DefectThermodynamics(MSONable):
         #  advanced analysis
         if kwargs and any(i not in ["verbose", "tol", "skip_check"] for i in kwargs):
             raise ValueError(f"Invalid keyword arguments: {', '.join(kwargs.keys())}")
+        _check_solver(solver, ["brentq", "newton"])
 
         if bulk_dos is not None:
             self.fermi_dos = self._parse_fermi_dos(bulk_dos, skip_check=kwargs.get("skip_check", False))
@@ -1738,24 +2974,20 @@ class DefectThermodynamics(MSONable):
                 return_concs=False,
                 skip_check=kwargs.get("skip_check", delta_gap != 0),  # skip check by default if delta
                 # gap not 0
+                solver=solver,
             )
             assert not isinstance(annealing_fermi_level, tuple)  # float w/ return_concs=False, for typing
             self.fermi_dos = orig_fermi_dos  # reset to original DOS for quenched calculations
 
-            annealing_defect_concentrations = self.get_equilibrium_concentrations(
-                chempots=chempots,
-                limit=limit,
-                el_refs=el_refs,
-                fermi_level=annealing_fermi_level,  # type: ignore
-                temperature=annealing_temperature,
-                per_charge=False,  # give total concentrations for each defect
-                lean=True,
+            concentration_model = self._get_concentration_model()
+            chempots_vector = concentration_model.get_chempots_vector(chempots, limit, el_refs)
+            total_concentrations_vector = concentration_model.get_defect_totals(
+                concentration_model.get_concentrations(
+                    annealing_fermi_level, annealing_temperature, chempots_vector
+                )
             )
             total_concentrations = dict(  # {Defect: Total Concentration (cm^-3)}
-                zip(
-                    annealing_defect_concentrations.index,  # index is Defect name, when per_charge=False
-                    annealing_defect_concentrations["Concentration (cm^-3)"],
-                )
+                zip(concentration_model.defect_names, total_concentrations_vector.tolist())
             )
 
             def _get_constrained_concentrations(
@@ -1814,60 +3046,466 @@ class DefectThermodynamics(MSONable):
                             _format_per_site_concentration
                         )
 
-                elif not skip_formatting:
-                    conc_df["Concentration (cm^-3)"] = conc_df["Concentration (cm^-3)"].apply(
-                        lambda x: f"{x:.3e}"
-                    )
+                elif not skip_formatting:
+                    conc_df["Concentration (cm^-3)"] = conc_df["Concentration (cm^-3)"].apply(
+                        lambda x: f"{x:.3e}"
+                    )
+
+                return conc_df
+
+            def _get_constrained_total_q(fermi_level):
+                qd_tot = concentration_model.get_total_charge(
+                    concentration_model.get_constrained_concentrations(
+                        fermi_level, quenched_temperature, total_concentrations_vector, chempots_vector
+                    )
+                )
+                qd_tot += get_doping(  # use orig fermi dos for quenched temperature
+                    fermi_dos=orig_fermi_dos,
+                    fermi_level=fermi_level + self.vbm,
+                    temperature=quenched_temperature,
+                )
+                return qd_tot
+
+            if solver == "newton":
+                eq_fermi_level: float = _safeguarded_newton(  # type: ignore
+                    self._get_log_charge_balance_function(
+                        orig_fermi_dos,
+                        concentration_model,
+                        quenched_temperature,
+                        chempots_vector,
+                        total_concentrations=total_concentrations_vector,
+                    ),
+                    -1.0,
+                    self.band_gap + 1.0,  # type: ignore
+                    initial=initial_fermi_level,
+                )
+            else:
+                eq_fermi_level = brentq(
+                    _get_constrained_total_q, -1.0, self.band_gap + 1.0  # type: ignore
+                )
+            e_conc, h_conc = get_e_h_concs(
+                orig_fermi_dos, eq_fermi_level + self.vbm, quenched_temperature  # type: ignore
+            )
+            conc_df = _get_constrained_concentrations(
+                eq_fermi_level, per_charge, per_site, skip_formatting, lean=False
+            )  # not lean for final output
+
+            if not return_annealing_values:
+                return (eq_fermi_level, e_conc, h_conc, conc_df)
+
+            annealing_e_conc, annealing_h_conc = get_e_h_concs(
+                annealing_dos, annealing_fermi_level + self.vbm, annealing_temperature  # type: ignore
+            )
+            annealing_defect_concentrations = self.get_equilibrium_concentrations(
+                chempots=chempots,
+                limit=limit,
+                el_refs=el_refs,
+                fermi_level=annealing_fermi_level,  # type: ignore
+                temperature=annealing_temperature,
+                per_charge=per_charge,
+                per_site=per_site,
+                skip_formatting=skip_formatting,
+            )
+            return (
+                eq_fermi_level,
+                e_conc,
+                h_conc,
+                conc_df,
+                annealing_fermi_level,
+                annealing_e_conc,
+                annealing_h_conc,
+                annealing_defect_concentrations,
+            )
+
+    def get_quenched_fermi_levels_and_concentrations(
+        self,
+        bulk_dos: Optional[Union[FermiDos, CarrierConcentrationModel, Vasprun, str]] = None,
+        chempots: Optional[dict] = None,
+        limits: Optional[list[str]] = None,
+        el_refs: Optional[dict] = None,
+        annealing_temperatures: Union[float, list[float], np.ndarray] = 1000,
+        quenched_temperatures: Union[float, list[float], np.ndarray] = 300,
+        delta_gaps: Union[float, list[float], np.ndarray] = 0,
+        per_charge: bool = True,
+        per_site: bool = False,
+        solver: str = "bisect",
+        **kwargs,
+    ) -> tuple[pd.DataFrame, np.ndarray]:
+        r"""
+        Calculate the self-consistent quenched Fermi levels and corresponding
+        carrier/defect concentrations for many chemical potential limits,
+        annealing temperatures, quenched temperatures and band gap changes
+        (``delta_gap``\s) at once, using the frozen defect and dilute limit
+        approximations under the constraint of charge neutrality.
+
+        This gives the same results as looping over
+        ``DefectThermodynamics.get_quenched_fermi_level_and_concentrations()``,
+        but solves for the annealing and quenched Fermi levels under all
+        conditions simultaneously (with vectorised root-finding), and returns
+        the defect concentrations as a ``numpy`` array rather than formatted
+        ``DataFrame``\s, which is much faster for scans over annealing
+        temperatures (e.g. for plotting). See
+        ``get_quenched_fermi_level_and_concentrations()`` for details on the
+        frozen defect approximation.
+
+        Note that the returned Fermi levels are given relative to ``self.vbm``,
+        which is the VBM eigenvalue of the bulk supercell calculation by
+        default, unless ``bulk_band_gap_vr`` is set during defect parsing.
+
+        Args:
+            bulk_dos (FermiDos or Vasprun or str):
+                ``pymatgen`` ``FermiDos`` for the bulk electronic density of states (DOS),
+                for calculating carrier concentrations. Alternatively, can be a ``pymatgen``
+                ``Vasprun`` object or path to the ``vasprun.xml(.gz)`` output of a bulk DOS
+                calculation in VASP. See ``get_equilibrium_fermi_level()`` for more details.
+
+                ``bulk_dos`` can also be left as ``None`` (default), if it has previously
+                been provided and parsed, and thus is set as the ``self.fermi_dos`` attribute.
+            chempots (dict):
+                Dictionary of chemical potentials to use for calculating the defect
+                formation energies (and thus concentrations and Fermi levels).
+                If ``None`` (default), will use ``self.chempots`` (= 0 for all chemical
+                potentials by default). Same format as in ``get_equilibrium_fermi_level()``.
+            limits (list):
+                List of chemical potential limits for which to determine the quenched
+                Fermi levels. Each limit can be either ``"X-rich"/"X-poor"`` where X is an
+                element in the system (e.g. ``"Li-rich"``), or a key in the
+                ``(self.)chempots["limits"]`` dictionary. If ``None`` (default), all limits
+                in ``chempots`` are used.
+            el_refs (dict):
+                Dictionary of elemental reference energies for the chemical potentials
+                in the format:
+                ``{element symbol: reference energy}`` (to determine the formal chemical
+                potentials, when ``chempots`` has been manually specified as
+                ``{element symbol: chemical potential}``). Unnecessary if ``chempots`` is
+                provided/present in format generated by ``doped`` (see tutorials).
+                (Default: None)
+            annealing_temperatures (float or list or np.ndarray):
+                Temperature(s) in Kelvin at which to calculate the high temperature
+                (fixed) total defect concentrations, which should correspond to the
+                highest temperature during annealing/synthesis of the material (at
+                which we assume equilibrium defect concentrations) within the frozen
+                defect approach. Default is 1000 K.
+            quenched_temperatures (float or list or np.ndarray):
+                Temperature(s) in Kelvin at which to calculate the self-consistent
+                (constrained equilibrium) Fermi levels and carrier concentrations,
+                given the fixed total concentrations, which should correspond to
+                operating temperature of the material (typically room temperature).
+                Default is 300 K.
+            delta_gaps (float or list or np.ndarray):
+                Change(s) in band gap (in eV) of the host material at the annealing
+                temperature (e.g. due to thermal renormalisation), relative to the
+                original band gap of the ``FermiDos`` object, as for ``delta_gap`` in
+                ``get_quenched_fermi_level_and_concentrations()``. (Default: 0)
+            per_charge (bool):
+                Whether to return the concentrations of individual defect charge states
+                (ordered as ``self.defect_entries``), or the total concentrations of
+                each defect (ordered by first appearance in ``self.defect_entries``).
+                (default: True)
+            per_site (bool):
+                Whether to return the concentrations as fractional concentrations per
+                site, rather than the default of per cm^3. (default: False)
+            solver (str):
+                Vectorised root-finding algorithm used to solve for charge neutrality.
+                Either ``"bisect"`` (default) or ``"newton"`` (typically several times
+                fewer function evaluations). See ``get_equilibrium_fermi_level()``.
+            **kwargs:
+                Additional keyword arguments to pass to ``scissor_dos`` (if ``delta_gaps``
+                are not 0) or ``_parse_fermi_dos`` (``skip_check``; to skip the warning about
+                the DOS VBM differing from ``self.vbm`` by >0.05 eV; default is False).
+
+        Returns:
+            Tuple of a ``pandas`` ``DataFrame`` with one row per (limit, delta_gap,
+            annealing temperature, quenched temperature) combination, with columns
+            ``"limit"``, ``"Delta Gap (eV)"``, ``"Annealing Temperature (K)"``,
+            ``"Quenched Temperature (K)"``, ``"Annealing Fermi Level (eV wrt VBM)"``,
+            ``"Fermi Level (eV wrt VBM)"``, ``"Electron Concentration (cm^-3)"`` and
+            ``"Hole Concentration (cm^-3)"``, and a ``numpy`` array of the quenched
+            defect concentrations with shape ``(number of conditions, number of
+            defects/charge states)``.
+        """
+        if kwargs and any(i not in ["verbose", "tol", "skip_check"] for i in kwargs):
+            raise ValueError(f"Invalid keyword arguments: {', '.join(kwargs.keys())}")
+        _check_solver(solver, ["bisect", "newton"])
+
+        if bulk_dos is not None:
+            self.fermi_dos = self._parse_fermi_dos(bulk_dos, skip_check=kwargs.get("skip_check", False))
+        elif not hasattr(self, "fermi_dos"):
+            raise ValueError(
+                "No bulk DOS calculation (`bulk_dos`) provided or previously parsed to "
+                "`DefectThermodynamics.fermi_dos`, which is required for calculating carrier "
+                "concentrations and solving for Fermi level position."
+            )
 
-                return conc_df
+        chempots, el_refs = self._get_chempots(
+            chempots, el_refs
+        )  # returns self.chempots/self.el_refs if chempots is None
+        if chempots is None:
+            _no_chempots_warning()
+            limits = [None]  # type: ignore
+        elif limits is None:
+            limits = list(chempots["limits"].keys())
 
-            def _get_constrained_total_q(fermi_level):
-                conc_df = _get_constrained_concentrations(fermi_level, skip_formatting=True)
-                qd_tot = (conc_df["Charge"] * conc_df["Concentration (cm^-3)"]).sum()
-                qd_tot += get_doping(  # use orig fermi dos for quenched temperature
-                    fermi_dos=orig_fermi_dos,
-                    fermi_level=fermi_level + self.vbm,
-                    temperature=quenched_temperature,
-                )
-                return qd_tot
+        concentration_model = self._get_concentration_model()
+        chempots_vectors = {
+            limit: concentration_model.get_chempots_vector(chempots, limit, el_refs) for limit in limits
+        }
+        conditions = list(
+            product(
+                limits,
+                np.atleast_1d(delta_gaps).astype(float).tolist(),
+                np.atleast_1d(annealing_temperatures).astype(float).tolist(),
+                np.atleast_1d(quenched_temperatures).astype(float).tolist(),
+            )
+        )
+        chempots_array = np.array([chempots_vectors[condition[0]] for condition in conditions])
+        delta_gaps_array, annealing_temperatures_array, quenched_temperatures_array = (
+            np.array([condition[i] for condition in conditions]) for i in range(1, 4)
+        )
 
-            eq_fermi_level: float = brentq(
-                _get_constrained_total_q, -1.0, self.band_gap + 1.0  # type: ignore
+        annealing_fermi_levels, quenched_fermi_levels = np.empty(len(conditions)), np.empty(
+            len(conditions)
+        )
+        total_concentrations = np.empty((len(conditions), len(concentration_model.defect_names)))
+        for delta_gap in np.unique(delta_gaps_array):  # scissor DOS once for each delta_gap
+            delta_gap_mask = delta_gaps_array == delta_gap
+            annealing_dos = (
+                self.fermi_dos
+                if delta_gap == 0
+                else scissor_dos(
+                    delta_gap,
+                    self.fermi_dos,
+                    verbose=kwargs.get("verbose", False),
+                    tol=kwargs.get("tol", 1e-8),
+                )
             )
-            e_conc, h_conc = get_e_h_concs(
-                orig_fermi_dos, eq_fermi_level + self.vbm, quenched_temperature  # type: ignore
+            (
+                annealing_fermi_levels[delta_gap_mask],
+                quenched_fermi_levels[delta_gap_mask],
+                total_concentrations[delta_gap_mask],
+            ) = self._solve_quenched_fermi_levels(
+                annealing_dos,
+                concentration_model,
+                annealing_temperatures_array[delta_gap_mask],
+                quenched_temperatures_array[delta_gap_mask],
+                chempots_array[delta_gap_mask],
+                solver=solver,
             )
-            conc_df = _get_constrained_concentrations(
-                eq_fermi_level, per_charge, per_site, skip_formatting, lean=False
-            )  # not lean for final output
 
-            if not return_annealing_values:
-                return (eq_fermi_level, e_conc, h_conc, conc_df)
+        e_concs, h_concs = get_e_h_concs(
+            self.fermi_dos, quenched_fermi_levels + self.vbm, quenched_temperatures_array
+        )
+        concentrations = concentration_model.get_constrained_concentrations(
+            quenched_fermi_levels, quenched_temperatures_array, total_concentrations, chempots_array
+        )
+        if per_site:
+            concentrations = concentrations / concentration_model.site_concentrations
+        if not per_charge:
+            concentrations = concentration_model.get_defect_totals(concentrations)
+
+        conditions_df = pd.DataFrame(
+            {
+                "limit": [condition[0] for condition in conditions],
+                "Delta Gap (eV)": delta_gaps_array,
+                "Annealing Temperature (K)": annealing_temperatures_array,
+                "Quenched Temperature (K)": quenched_temperatures_array,
+                "Annealing Fermi Level (eV wrt VBM)": annealing_fermi_levels,
+                "Fermi Level (eV wrt VBM)": quenched_fermi_levels,
+                "Electron Concentration (cm^-3)": e_concs,
+                "Hole Concentration (cm^-3)": h_concs,
+            }
+        )
+        return conditions_df, concentrations
 
-            annealing_e_conc, annealing_h_conc = get_e_h_concs(
-                annealing_dos, annealing_fermi_level + self.vbm, annealing_temperature  # type: ignore
+    def get_fermi_level_and_concentrations_map(
+        self,
+        bulk_dos: Optional[Union[FermiDos, CarrierConcentrationModel, Vasprun, str]] = None,
+        chempots: Optional[dict] = None,
+        el_refs: Optional[dict] = None,
+        n_points: int = 10,
+        method: str = "simplex",
+        temperature: float = 300,
+        annealing_temperature: Optional[float] = None,
+        delta_gap: float = 0,
+        per_site: bool = False,
+        solver: str = "bisect",
+        processes: Optional[int] = None,
+        chunk_size: int = 1000,
+        **kwargs,
+    ) -> pd.DataFrame:
+        r"""
+        Calculate the self-consistent Fermi level, carrier concentrations and
+        defect concentrations across the chemical potential stability region
+        (polytope) of the host, rather than just at the chemical potential
+        limits (vertices), for plotting maps/heatmaps of these quantities
+        versus chemical potentials (e.g. to identify optimal growth
+        conditions).
+
+        Chemical potentials are sampled within the stability region using
+        ``get_chempot_grid()`` (see its docstring for details), and the Fermi
+        levels are solved for all points at once with vectorised root-finding,
+        in chunks of ``chunk_size`` points which are distributed over
+        ``processes`` processes for large grids.
+
+        If ``annealing_temperature`` is set, the frozen defect approximation
+        is used (as in ``get_quenched_fermi_level_and_concentrations()``), with
+        the defect concentrations fixed at ``annealing_temperature`` and the
+        Fermi level and carrier concentrations calculated at ``temperature``.
+        Otherwise `equilibrium` defect concentrations at ``temperature`` are
+        assumed (as in ``get_equilibrium_fermi_level()``).
+
+        Args:
+            bulk_dos (FermiDos or Vasprun or str):
+                ``pymatgen`` ``FermiDos`` for the bulk electronic density of states (DOS),
+                for calculating carrier concentrations. Alternatively, can be a ``pymatgen``
+                ``Vasprun`` object or path to the ``vasprun.xml(.gz)`` output of a bulk DOS
+                calculation in VASP. See ``get_equilibrium_fermi_level()`` for more details.
+
+                ``bulk_dos`` can also be left as ``None`` (default), if it has previously
+                been provided and parsed, and thus is set as the ``self.fermi_dos`` attribute.
+            chempots (dict):
+                Dictionary of chemical potential limits, in the ``doped`` format (as
+                generated by ``CompetingPhasesAnalyzer.chempots``; see tutorials). If
+                ``None`` (default), will use ``self.chempots``.
+            el_refs (dict):
+                Dictionary of elemental reference energies for the chemical potentials
+                in the format ``{element symbol: reference energy}``. Unnecessary if
+                ``chempots`` is provided/present in format generated by ``doped``.
+                (Default: None)
+            n_points (int):
+                Number of chemical potential points to sample along each edge/dimension
+                of the stability region, including the limits. (Default: 10)
+            method (str):
+                Sampling method for ``get_chempot_grid()``; either ``"simplex"``
+                (default) or ``"grid"``.
+            temperature (float):
+                Temperature in Kelvin at which to calculate the Fermi level and carrier
+                concentrations (and defect concentrations if ``annealing_temperature``
+                is not set). Default is 300 K.
+            annealing_temperature (float):
+                If set, the temperature in Kelvin at which the total defect concentrations
+                are fixed, within the frozen defect approximation (see
+                ``get_quenched_fermi_level_and_concentrations()``). (Default: None)
+            delta_gap (float):
+                Change in band gap (in eV) of the host material at the annealing
+                temperature, if ``annealing_temperature`` is set; see
+                ``get_quenched_fermi_level_and_concentrations()``. (Default: 0)
+            per_site (bool):
+                Whether to return the defect concentrations as fractional concentrations
+                per site, rather than the default of per cm^3. (default: False)
+            solver (str):
+                Vectorised root-finding algorithm used to solve for charge neutrality.
+                Either ``"bisect"`` (default) or ``"newton"`` (typically several times
+                fewer function evaluations). See ``get_equilibrium_fermi_level()``.
+            processes (int):
+                Number of processes to use for evaluating chunks of chemical potential
+                points in parallel. If ``None`` (default), multiprocessing is only used
+                when there is more than one chunk of points (i.e. more than
+                ``chunk_size`` points), with up to ``cpu_count() - 1`` processes.
+            chunk_size (int):
+                Number of chemical potential points to solve at once, which limits the
+                memory usage of the vectorised solvers. (Default: 1000)
+            **kwargs:
+                Additional keyword arguments to pass to ``scissor_dos`` (if ``delta_gap``
+                is not 0) or ``_parse_fermi_dos`` (``skip_check``; to skip the warning about
+                the DOS VBM differing from ``self.vbm`` by >0.05 eV; default is False).
+
+        Returns:
+            ``pandas`` ``DataFrame`` with one row per sampled chemical potential point,
+            with columns of the (formal) chemical potential of each element,
+            ``"Fermi Level (eV wrt VBM)"``, ``"Electron Concentration (cm^-3)"``,
+            ``"Hole Concentration (cm^-3)"`` (and ``"Annealing Fermi Level (eV wrt VBM)"``
+            if ``annealing_temperature`` is set), the total concentration of each defect
+            (in cm^-3 or per site, with the defect names as column names) and
+            ``"Dominant Defect"`` (the defect with the highest concentration). Points for
+            which charge neutrality could not be bracketed have ``NaN`` Fermi levels and
+            concentrations, and ``NaN`` as the dominant defect.
+        """
+        if kwargs and any(i not in ["verbose", "tol", "skip_check"] for i in kwargs):
+            raise ValueError(f"Invalid keyword arguments: {', '.join(kwargs.keys())}")
+        _check_solver(solver, ["bisect", "newton"])
+
+        if bulk_dos is not None:
+            self.fermi_dos = self._parse_fermi_dos(bulk_dos, skip_check=kwargs.get("skip_check", False))
+        elif not hasattr(self, "fermi_dos"):
+            raise ValueError(
+                "No bulk DOS calculation (`bulk_dos`) provided or previously parsed to "
+                "`DefectThermodynamics.fermi_dos`, which is required for calculating carrier "
+                "concentrations and solving for Fermi level position."
             )
-            annealing_defect_concentrations = self.get_equilibrium_concentrations(
-                chempots=chempots,
-                limit=limit,
-                el_refs=el_refs,
-                fermi_level=annealing_fermi_level,  # type: ignore
-                temperature=annealing_temperature,
-                per_charge=per_charge,
-                per_site=per_site,
-                skip_formatting=skip_formatting,
+
+        chempots, el_refs = self._get_chempots(
+            chempots, el_refs
+        )  # returns self.chempots/self.el_refs if chempots is None
+        if chempots is None:
+            raise ValueError(
+                "No chemical potentials supplied or present in `DefectThermodynamics.chempots`, which "
+                "are required for sampling the chemical potential stability region!"
             )
-            return (
-                eq_fermi_level,
-                e_conc,
-                h_conc,
-                conc_df,
-                annealing_fermi_level,
-                annealing_e_conc,
-                annealing_h_conc,
-                annealing_defect_concentrations,
+
+        chempot_grid = get_chempot_grid(chempots, n_points=n_points, method=method)
+        concentration_model = self._get_concentration_model()
+        chempots_array = _get_chempots_array_from_grid(
+            chempot_grid, chempots.get("elemental_refs"), concentration_model.elements
+        )
+
+        annealing_dos = None
+        if annealing_temperature is not None:
+            annealing_dos = (
+                self.fermi_dos
+                if delta_gap == 0
+                else scissor_dos(
+                    delta_gap,
+                    self.fermi_dos,
+                    verbose=kwargs.get("verbose", False),
+                    tol=kwargs.get("tol", 1e-8),
+                )
             )
 
+        chempots_chunks = np.array_split(
+            chempots_array, max(1, int(np.ceil(len(chempots_array) / chunk_size)))
+        )
+        if processes is None:  # only multiprocess if more than one chunk
+            processes = min(max(1, cpu_count() - 1), len(chempots_chunks))
+
+        worker_args = (
+            self,
+            concentration_model,
+            annealing_dos,
+            temperature,
+            annealing_temperature,
+            per_site,
+            solver,
+        )
+        if processes <= 1:
+            _initialise_chempot_map_worker(*worker_args)
+            results = [_get_chempot_map_chunk(chunk) for chunk in chempots_chunks]
+        else:
+            with Pool(
+                processes=processes, initializer=_initialise_chempot_map_worker, initargs=worker_args
+            ) as pool:
+                results = pool.map(_get_chempot_map_chunk, chempots_chunks)
+        _chempot_map_worker_state.clear()
+
+        map_df = chempot_grid.copy()
+        for key in results[0]:
+            if key != "Defect Concentrations":
+                map_df[key] = np.concatenate([result[key] for result in results])
+
+        defect_concentrations = np.concatenate([result["Defect Concentrations"] for result in results])
+        for defect_name, defect_concentration in zip(
+            concentration_model.defect_names, defect_concentrations.T
+        ):
+            map_df[defect_name] = defect_concentration
+        dominant_defects = np.full(len(defect_concentrations), np.nan, dtype=object)
+        valid = ~np.all(np.isnan(defect_concentrations), axis=1)  # NaN if Fermi level not bracketed
+        dominant_defects[valid] = np.array(concentration_model.defect_names, dtype=object)[
+            np.nanargmax(defect_concentrations[valid], axis=1)
+        ]
+        map_df["Dominant Defect"] = dominant_defects
+
+        return map_df
+
     def get_formation_energy(
         self,
         defect_entry: Union[str, DefectEntry],
@@ -2080,69 +3718,23 @@ class DefectThermodynamics(MSONable):
         limit = _parse_limit(chempots, limit)
         limits = [limit] if limit is not None else list(chempots["limits"].keys())
 
-        donor_intercepts: list[tuple] = []
-        acceptor_intercepts: list[tuple] = []
-
-        for entry in self.all_stable_entries:
-            if entry.charge_state > 0:  # donor
-                # formation energy is y = mx + c where m = charge_state, c = vbm_formation_energy
-                # so x-intercept is -c/m:
-                donor_intercepts.extend(
-                    (
-                        limit,
-                        entry.name,
-                        -self.get_formation_energy(
-                            entry,
-                            chempots=chempots,
-                            limit=limit,
-                            el_refs=el_refs,
-                            fermi_level=0,
-                        )
-                        / entry.charge_state,
-                    )
-                    for limit in limits
-                )
-            elif entry.charge_state < 0:  # acceptor
-                acceptor_intercepts.extend(
-                    (
-                        limit,
-                        entry.name,
-                        -self.get_formation_energy(
-                            entry,
-                            chempots=chempots,
-                            limit=limit,
-                            el_refs=el_refs,
-                            fermi_level=0,
-                        )
-                        / entry.charge_state,
-                    )
-                    for limit in limits
-                )
-
-        if not donor_intercepts:
-            donor_intercepts = [("N/A", "N/A", -np.inf)]
-        if not acceptor_intercepts:
-            acceptor_intercepts = [("N/A", "N/A", np.inf)]
-
-        donor_intercepts_df = pd.DataFrame(donor_intercepts, columns=["limit", "name", "intercept"])
-        acceptor_intercepts_df = pd.DataFrame(acceptor_intercepts, columns=["limit", "name", "intercept"])
+        concentration_model = self._get_concentration_model(stable_entries_only=True)
+        chempots_array = np.array(
+            [concentration_model.get_chempots_vector(chempots, limit, el_refs) for limit in limits]
+        ).reshape(len(limits), len(concentration_model.elements))
+        compensating_intercepts = self._get_compensating_intercepts(concentration_model, chempots_array)
 
         # get the most p/n-type limit, by getting the limit with the minimum/maximum max/min-intercept,
         # where max/min-intercept is the max/min intercept for that limit (i.e. the compensating intercept)
-        idx = (
-            donor_intercepts_df.groupby("limit")["intercept"].transform("max")
-            == donor_intercepts_df["intercept"]
-        )
-        limiting_donor_intercept_row = donor_intercepts_df.iloc[
-            donor_intercepts_df[idx]["intercept"].idxmin()
-        ]
-        idx = (
-            acceptor_intercepts_df.groupby("limit")["intercept"].transform("min")
-            == acceptor_intercepts_df["intercept"]
+        limiting_donor_intercept_row, limiting_acceptor_intercept_row = (
+            _get_limiting_intercept_row(
+                *compensating_intercepts[key], limiting, limits, concentration_model.defect_entries
+            )
+            for key, limiting in [
+                ("p-type Dopability Limit", "min"),
+                ("n-type Dopability Limit", "max"),
+            ]
         )
-        limiting_acceptor_intercept_row = acceptor_intercepts_df.iloc[
-            acceptor_intercepts_df[idx]["intercept"].idxmax()
-        ]
 
         if limiting_donor_intercept_row["intercept"] > limiting_acceptor_intercept_row["intercept"]:
             warnings.warn(
@@ -2176,6 +3768,56 @@ class DefectThermodynamics(MSONable):
             index=["p-type", "n-type"],
         )
 
+    def _get_compensating_intercepts(
+        self, concentration_model: DefectConcentrationModel, chempots_array: np.ndarray
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the compensating intercepts (and indices of the corresponding
+        compensating entries in ``concentration_model``) for the dopability
+        limits and doping windows, for each chemical potential vector in
+        ``chempots_array``.
+
+        The formation energies of all entries at all chemical potentials are
+        obtained as a single (points x entries) matrix at E_F = 0 (i.e. the
+        VBM), from which the dopability limit intercepts (-E_form(E_F=0)/q;
+        where the formation energy line crosses zero) and doping window
+        intercepts (E_form at the corresponding band edge) follow directly.
+
+        Args:
+            concentration_model (DefectConcentrationModel):
+                ``DefectConcentrationModel`` of the entries to consider
+                (typically ``self.all_stable_entries``).
+            chempots_array (np.ndarray):
+                Array of chemical potential vectors (points x elements), ordered
+                as ``concentration_model.elements``.
+
+        Returns:
+            dict: ``{"p/n-type Dopability Limit"/"p/n-type Doping Window":
+            (compensating intercepts, compensating entry indices)}``, with one
+            value per chemical potential vector (and indices of -1 if there are
+            no compensating donors/acceptors).
+        """
+        charges = concentration_model.charges
+        vbm_formation_energies = np.atleast_2d(
+            concentration_model.get_formation_energies(0, chempots_array)
+        )  # (points, entries)
+        donors, acceptors = charges > 0, charges < 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # formation energy is y = mx + c where m = charge_state, c = vbm_formation_energy
+            # so x-intercept is -c/m:
+            dopability_intercepts = -vbm_formation_energies / charges
+
+        return {
+            "p-type Dopability Limit": _get_compensating_intercepts(dopability_intercepts, donors, "max"),
+            "n-type Dopability Limit": _get_compensating_intercepts(
+                dopability_intercepts, acceptors, "min"
+            ),
+            "p-type Doping Window": _get_compensating_intercepts(vbm_formation_energies, donors, "min"),
+            "n-type Doping Window": _get_compensating_intercepts(
+                vbm_formation_energies + charges * self.band_gap, acceptors, "min"
+            ),
+        }
+
     def get_doping_windows(
         self, chempots: Optional[dict] = None, limit: Optional[str] = None, el_refs: Optional[dict] = None
     ) -> pd.DataFrame:
@@ -2257,51 +3899,11 @@ class DefectThermodynamics(MSONable):
         limit = _parse_limit(chempots, limit)
         limits = [limit] if limit is not None else list(chempots["limits"].keys())
 
-        vbm_donor_intercepts: list[tuple] = []
-        cbm_acceptor_intercepts: list[tuple] = []
-
-        for entry in self.all_stable_entries:
-            if entry.charge_state > 0:  # donor
-                vbm_donor_intercepts.extend(
-                    (
-                        limit,
-                        entry.name,
-                        self.get_formation_energy(
-                            entry,
-                            chempots=chempots,
-                            limit=limit,
-                            el_refs=el_refs,
-                            fermi_level=0,
-                        ),
-                    )
-                    for limit in limits
-                )
-            elif entry.charge_state < 0:  # acceptor
-                cbm_acceptor_intercepts.extend(
-                    (
-                        limit,
-                        entry.name,
-                        self.get_formation_energy(
-                            entry,
-                            chempots=chempots,
-                            limit=limit,
-                            el_refs=el_refs,
-                            fermi_level=self.band_gap,  # type: ignore[arg-type]
-                        ),
-                    )
-                    for limit in limits
-                )
-        if not vbm_donor_intercepts:
-            vbm_donor_intercepts = [("N/A", "N/A", np.inf)]
-        if not cbm_acceptor_intercepts:
-            cbm_acceptor_intercepts = [("N/A", "N/A", -np.inf)]
-
-        vbm_donor_intercepts_df = pd.DataFrame(
-            vbm_donor_intercepts, columns=["limit", "name", "intercept"]
-        )
-        cbm_acceptor_intercepts_df = pd.DataFrame(
-            cbm_acceptor_intercepts, columns=["limit", "name", "intercept"]
-        )
+        concentration_model = self._get_concentration_model(stable_entries_only=True)
+        chempots_array = np.array(
+            [concentration_model.get_chempots_vector(chempots, limit, el_refs) for limit in limits]
+        ).reshape(len(limits), len(concentration_model.elements))
+        compensating_intercepts = self._get_compensating_intercepts(concentration_model, chempots_array)
 
         try:
             limit_dict = get_rich_poor_limit_dict(chempots)
@@ -2311,11 +3913,10 @@ class DefectThermodynamics(MSONable):
         # get the most p/n-type limit, by getting the limit with the maximum min-intercept, where
         # min-intercept is the min intercept for that limit (i.e. the compensating intercept)
         limiting_intercept_rows = []
-        for intercepts_df in [vbm_donor_intercepts_df, cbm_acceptor_intercepts_df]:
-            idx = (
-                intercepts_df.groupby("limit")["intercept"].transform("min") == intercepts_df["intercept"]
+        for key in ["p-type Doping Window", "n-type Doping Window"]:
+            limiting_intercept_row = _get_limiting_intercept_row(
+                *compensating_intercepts[key], "max", limits, concentration_model.defect_entries
             )
-            limiting_intercept_row = intercepts_df.iloc[intercepts_df[idx]["intercept"].idxmax()]
             limiting_intercept_rows.append(
                 [
                     _get_limit_name_from_dict(limiting_intercept_row["limit"], limit_dict, bracket=True),
@@ -2330,6 +3931,89 @@ class DefectThermodynamics(MSONable):
             index=["p-type", "n-type"],
         )
 
+    def get_dopability_map(
+        self,
+        chempots: Optional[dict] = None,
+        el_refs: Optional[dict] = None,
+        n_points: int = 10,
+        method: str = "simplex",
+        chempot_grid: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
+        r"""
+        Calculate the dopability limits and doping windows (see
+        ``get_dopability_limits()`` and ``get_doping_windows()``) across the
+        chemical potential stability region (polytope) of the host, rather
+        than just at the chemical potential limits (vertices), for screening
+        the dopability of the host versus chemical potentials.
+
+        Chemical potentials are sampled within the stability region using
+        ``get_chempot_grid()`` (see its docstring for details), unless
+        ``chempot_grid`` is provided. The formation energies of all stable
+        charge states (``self.all_stable_entries``) are computed for all points
+        at once, as a single (points x entries) matrix.
+
+        Args:
+            chempots (dict):
+                Dictionary of chemical potential limits, in the ``doped`` format (as
+                generated by ``CompetingPhasesAnalyzer.chempots``; see tutorials). If
+                ``None`` (default), will use ``self.chempots``.
+            el_refs (dict):
+                Dictionary of elemental reference energies for the chemical potentials
+                in the format ``{element symbol: reference energy}``. Unnecessary if
+                ``chempots`` is provided/present in format generated by ``doped``.
+                (Default: None)
+            n_points (int):
+                Number of chemical potential points to sample along each edge/dimension
+                of the stability region, including the limits. (Default: 10)
+            method (str):
+                Sampling method for ``get_chempot_grid()``; either ``"simplex"``
+                (default) or ``"grid"``.
+            chempot_grid (pd.DataFrame):
+                ``DataFrame`` of chemical potential points to use instead of sampling
+                the stability region, with one column per element, in the same format
+                as the output of ``get_chempot_grid()`` (i.e. formal chemical potentials
+                if ``"elemental_refs"`` are present in ``chempots``, otherwise absolute
+                chemical potentials). (Default: None)
+
+        Returns:
+            ``pandas`` ``DataFrame`` with one row per chemical potential point, with
+            columns of the (formal) chemical potential of each element, then the
+            ``"p/n-type Dopability Limit (eV from VBM/CBM)"`` and ``"p/n-type Doping
+            Window (eV at VBM/CBM)"`` values and the corresponding compensating
+            defects (``"p/n-type Dopability/Doping Window Compensating Defect"``).
+        """
+        chempots, el_refs = self._get_chempots(
+            chempots, el_refs
+        )  # returns self.chempots/self.el_refs if chempots is None
+        if chempots is None:
+            raise ValueError(
+                "No chemical potentials supplied or present in `DefectThermodynamics.chempots`, which "
+                "are required for sampling the chemical potential stability region!"
+            )
+
+        if chempot_grid is None:
+            chempot_grid = get_chempot_grid(chempots, n_points=n_points, method=method)
+        concentration_model = self._get_concentration_model(stable_entries_only=True)
+        chempots_array = _get_chempots_array_from_grid(
+            chempot_grid, chempots.get("elemental_refs"), concentration_model.elements
+        )
+        compensating_intercepts = self._get_compensating_intercepts(concentration_model, chempots_array)
+
+        map_df = chempot_grid.copy()
+        for key, label, units in [
+            ("p-type Dopability Limit", "p-type Dopability", "eV from VBM/CBM"),
+            ("n-type Dopability Limit", "n-type Dopability", "eV from VBM/CBM"),
+            ("p-type Doping Window", "p-type Doping Window", "eV at VBM/CBM"),
+            ("n-type Doping Window", "n-type Doping Window", "eV at VBM/CBM"),
+        ]:
+            intercepts, indices = compensating_intercepts[key]
+            map_df[f"{key} ({units})"] = intercepts
+            map_df[f"{label} Compensating Defect"] = [
+                concentration_model.defect_entries[i].name if i >= 0 else "N/A" for i in indices
+            ]
+
+        return map_df
+
     # TODO: Add option to only plot defect states that are stable at some point in the bandgap
     # TODO: Add option to plot formation energies at the centroid of the chemical stability region? And
     #  make this the default if no chempots are specified? Or better default to plot both the most (
@@ -3134,16 +4818,31 @@ def get_fermi_dos(dos_vr: Union[str, Vasprun]):
     return FermiDos(dos_vr.complete_dos, nelecs=get_nelect_from_vasprun(dos_vr))
 
 
-def get_e_h_concs(fermi_dos: FermiDos, fermi_level: float, temperature: float) -> tuple[float, float]:
+def get_e_h_concs(
+    fermi_dos: Union[FermiDos, CarrierConcentrationModel],
+    fermi_level: Union[float, np.ndarray],
+    temperature: Union[float, np.ndarray],
+) -> tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
     """
     Get the corresponding electron and hole concentrations (in cm^-3) for a
     given Fermi level (in eV) and temperature (in K), for a ``FermiDos``
     object.
 
+    ``fermi_level`` and ``temperature`` can also be (broadcastable) arrays,
+    in which case arrays of electron and hole concentrations are returned.
+
     Note that the Fermi level here is NOT referenced to the VBM! So the Fermi
     level should be the corresponding eigenvalue within the calculation (or in
     other words, the Fermi level relative to the VBM plus the VBM eigenvalue).
+
+    ``fermi_dos`` can also be a ``CarrierConcentrationModel``, in which case
+    its (tabulated) carrier concentrations are used.
     """
+    if isinstance(fermi_dos, CarrierConcentrationModel):
+        return fermi_dos.get_e_h_concs(fermi_level, temperature)
+
+    # add trailing axes to the DOS arrays, to broadcast against any input fermi_level/temperature arrays:
+    dos_shape = (-1,) + (1,) * len(np.broadcast_shapes(np.shape(fermi_level), np.shape(temperature)))
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", "overflow")  # ignore overflow warnings from f0, can remove in
         # future versions following SK's fix in https://github.com/materialsproject/pymatgen/pull/3879
@@ -3151,36 +4850,43 @@ def get_e_h_concs(fermi_dos: FermiDos, fermi_level: float, temperature: float) -
         # FermiDos.get_doping(), and updated by SK to be independent of estimated VBM/CBM positions (using
         # correct DOS integral) and better handle exponential overflows (by editing `f0` in `pymatgen`)
         idx_mid_gap = int(fermi_dos.idx_vbm + (fermi_dos.idx_cbm - fermi_dos.idx_vbm) / 2)
-        e_conc: float = np.sum(
-            fermi_dos.tdos[idx_mid_gap:]
+        e_conc = np.sum(
+            fermi_dos.tdos[idx_mid_gap:].reshape(dos_shape)
             * f0(
-                fermi_dos.energies[idx_mid_gap:],
+                fermi_dos.energies[idx_mid_gap:].reshape(dos_shape),
                 fermi_level,  # type: ignore
                 temperature,
             )
-            * fermi_dos.de[idx_mid_gap:],
+            * fermi_dos.de[idx_mid_gap:].reshape(dos_shape),
             axis=0,
         ) / (fermi_dos.volume * fermi_dos.A_to_cm**3)
-        h_conc: float = np.sum(
-            fermi_dos.tdos[: idx_mid_gap + 1]
+        h_conc = np.sum(
+            fermi_dos.tdos[: idx_mid_gap + 1].reshape(dos_shape)
             * f0(
-                -fermi_dos.energies[: idx_mid_gap + 1],
-                -fermi_level,  # type: ignore
+                -fermi_dos.energies[: idx_mid_gap + 1].reshape(dos_shape),
+                -np.asarray(fermi_level),  # type: ignore
                 temperature,
             )
-            * fermi_dos.de[: idx_mid_gap + 1],
+            * fermi_dos.de[: idx_mid_gap + 1].reshape(dos_shape),
             axis=0,
         ) / (fermi_dos.volume * fermi_dos.A_to_cm**3)
 
     return e_conc, h_conc
 
 
-def get_doping(fermi_dos: FermiDos, fermi_level: float, temperature: float) -> float:
+def get_doping(
+    fermi_dos: Union[FermiDos, CarrierConcentrationModel],
+    fermi_level: Union[float, np.ndarray],
+    temperature: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Get the doping concentration (majority carrier - minority carrier
     concentration) in cm^-3 for a given Fermi level (in eV) and temperature
     (in K), for a ``FermiDos`` object.
 
+    ``fermi_level`` and ``temperature`` can also be (broadcastable) arrays,
+    in which case an array of doping concentrations is returned.
+
     Note that the Fermi level here is NOT referenced to the VBM! So the Fermi
     level should be the corresponding eigenvalue within the calculation (or in
     other words, the Fermi level relative to the VBM plus the VBM eigenvalue).
@@ -3195,7 +4901,315 @@ def get_doping(fermi_dos: FermiDos, fermi_level: float, temperature: float) -> f
     return h_conc - e_conc
 
 
-def scissor_dos(delta_gap: float, dos: Union[Dos, FermiDos], tol: float = 1e-8, verbose: bool = True):
+def _get_e_h_conc_derivatives(
+    fermi_dos: Union[FermiDos, CarrierConcentrationModel],
+    fermi_level: Union[float, np.ndarray],
+    temperature: Union[float, np.ndarray],
+) -> tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+    """
+    Get the derivatives of the electron and hole concentrations with respect
+    to the Fermi level (in cm^-3/eV) for a given Fermi level (in eV, `not`
+    referenced to the VBM, as in ``get_e_h_concs()``) and temperature (in K),
+    for a ``FermiDos`` or ``CarrierConcentrationModel`` object.
+
+    Used for the analytic derivative of the total charge in the Newton
+    Fermi level solver.
+    """
+    if isinstance(fermi_dos, CarrierConcentrationModel):
+        return fermi_dos.get_e_h_conc_derivatives(fermi_level, temperature)
+
+    idx_mid_gap = int(fermi_dos.idx_vbm + (fermi_dos.idx_cbm - fermi_dos.idx_vbm) / 2)
+    weights = fermi_dos.tdos * fermi_dos.de / (fermi_dos.volume * fermi_dos.A_to_cm**3)
+    return _get_e_h_conc_derivatives_from_states(
+        (fermi_dos.energies[idx_mid_gap:], weights[idx_mid_gap:]),
+        (fermi_dos.energies[: idx_mid_gap + 1], weights[: idx_mid_gap + 1]),
+        fermi_level,
+        temperature,
+    )
+
+
+def _get_e_h_conc_derivatives_from_states(
+    electron_states: tuple[np.ndarray, np.ndarray],
+    hole_states: tuple[np.ndarray, np.ndarray],
+    fermi_level: Union[float, np.ndarray],
+    temperature: Union[float, np.ndarray],
+) -> tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+    """
+    Get the derivatives of the electron and hole concentrations with respect
+    to the Fermi level, for the given ``(energies, weights)`` arrays of
+    electron and hole states, where ``weights`` are the DOS times the energy
+    spacing per unit volume (cm^3).
+
+    For Fermi-Dirac occupations f, df/dE_F = f(1 - f)/kT for electrons, and
+    the negative of this for holes, which is evaluated here as
+    e^-|x|/(1 + e^-|x|)^2 (with x = (E - E_F)/kT) to avoid overflows.
+    """
+    shape = np.broadcast_shapes(np.shape(fermi_level), np.shape(temperature))
+    dos_shape = (-1,) + (1,) * len(shape)
+    k_T = constants_value("Boltzmann constant in eV/K") * np.asarray(temperature, dtype=float)
+    derivatives = []
+    for (energies, weights), sign in [(electron_states, 1), (hole_states, -1)]:
+        exp_abs_scaled_energies = np.exp(
+            -np.abs(energies.reshape(dos_shape) - np.asarray(fermi_level, dtype=float)) / k_T
+        )
+        occupation_derivatives = exp_abs_scaled_energies / (1 + exp_abs_scaled_energies) ** 2  # f(1 - f)
+        derivatives.append(
+            sign * np.sum(weights.reshape(dos_shape) * occupation_derivatives, axis=0) / k_T
+        )
+
+    return derivatives[0], derivatives[1]
+
+
+_chempot_map_worker_state: dict = {}  # state shared by chempot map chunks, set once per worker process
+
+
+def _initialise_chempot_map_worker(
+    defect_thermodynamics: "DefectThermodynamics",
+    concentration_model: DefectConcentrationModel,
+    annealing_dos: Optional[Union[FermiDos, CarrierConcentrationModel]],
+    temperature: float,
+    annealing_temperature: Optional[float],
+    per_site: bool,
+    solver: str,
+):
+    """
+    Set the shared state for ``_get_chempot_map_chunk``, so that the
+    ``DefectThermodynamics`` object, DOS and concentration model only need to
+    be sent (pickled) once per worker process, rather than with each chunk.
+    """
+    _chempot_map_worker_state.update(
+        defect_thermodynamics=defect_thermodynamics,
+        concentration_model=concentration_model,
+        annealing_dos=annealing_dos,
+        temperature=temperature,
+        annealing_temperature=annealing_temperature,
+        per_site=per_site,
+        solver=solver,
+    )
+
+
+def _get_chempot_map_chunk(chempots_vectors: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Solve for the Fermi levels and carrier/defect concentrations for a chunk
+    of chemical potential vectors, used in
+    ``DefectThermodynamics.get_fermi_level_and_concentrations_map()``.
+    """
+    defect_thermodynamics = _chempot_map_worker_state["defect_thermodynamics"]
+    concentration_model = _chempot_map_worker_state["concentration_model"]
+    temperature = _chempot_map_worker_state["temperature"]
+    temperatures = np.full(len(chempots_vectors), temperature, dtype=float)
+    annealing_fermi_levels = None
+
+    if _chempot_map_worker_state["annealing_temperature"] is None:
+        fermi_levels = defect_thermodynamics._solve_fermi_levels(
+            defect_thermodynamics.fermi_dos,
+            concentration_model,
+            temperatures,
+            chempots_vectors,
+            solver=_chempot_map_worker_state["solver"],
+        )
+        concentrations = concentration_model.get_concentrations(
+            fermi_levels, temperatures, chempots_vectors
+        )
+    else:
+        annealing_fermi_levels, fermi_levels, total_concentrations = (
+            defect_thermodynamics._solve_quenched_fermi_levels(
+                _chempot_map_worker_state["annealing_dos"],
+                concentration_model,
+                np.full(len(chempots_vectors), _chempot_map_worker_state["annealing_temperature"]),
+                temperatures,
+                chempots_vectors,
+                solver=_chempot_map_worker_state["solver"],
+            )
+        )
+        concentrations = concentration_model.get_constrained_concentrations(
+            fermi_levels, temperatures, total_concentrations, chempots_vectors
+        )
+
+    e_concs, h_concs = get_e_h_concs(
+        defect_thermodynamics.fermi_dos, fermi_levels + defect_thermodynamics.vbm, temperatures
+    )
+    if _chempot_map_worker_state["per_site"]:
+        concentrations = concentrations / concentration_model.site_concentrations
+
+    results = {
+        "Fermi Level (eV wrt VBM)": fermi_levels,
+        "Electron Concentration (cm^-3)": e_concs,
+        "Hole Concentration (cm^-3)": h_concs,
+    }
+    if annealing_fermi_levels is not None:
+        results["Annealing Fermi Level (eV wrt VBM)"] = annealing_fermi_levels
+    results["Defect Concentrations"] = concentration_model.get_defect_totals(concentrations)
+
+    return results
+
+
+def _check_solver(solver: str, valid_solvers: list[str]):
+    """
+    Check that the chosen Fermi level ``solver`` is one of
+    ``valid_solvers``, raising a ``ValueError`` otherwise.
+    """
+    if solver not in valid_solvers:
+        raise ValueError(f"Invalid solver choice `{solver}`. Must be one of: {valid_solvers}")
+
+
+def _vectorised_bisect(
+    func, lower: np.ndarray, upper: np.ndarray, xtol: float = 2e-12, maxiter: int = 100
+) -> np.ndarray:
+    """
+    Find the roots of the vectorised function ``func`` (which takes and
+    returns arrays of the same shape as ``lower``/``upper``), within the
+    brackets ``[lower, upper]``, using bisection on all elements at once.
+
+    Used to solve for charge neutrality under many conditions simultaneously.
+    Elements without a sign change between ``lower`` and ``upper`` are
+    returned as ``NaN``, with a warning.
+
+    Args:
+        func (callable): Vectorised function for which to find the roots.
+        lower (np.ndarray): Lower bounds of the brackets.
+        upper (np.ndarray): Upper bounds of the brackets.
+        xtol (float):
+            Absolute tolerance for the roots. Default is 2e-12, matching that of
+            ``scipy.optimize.brentq``.
+        maxiter (int): Maximum number of bisection steps. Default is 100.
+
+    Returns:
+        np.ndarray: Roots of ``func``.
+    """
+    lower, upper = np.array(lower, dtype=float), np.array(upper, dtype=float)
+    f_lower, f_upper = func(lower), func(upper)
+    unbracketed = np.sign(f_lower) * np.sign(f_upper) > 0
+
+    for _ in range(maxiter):
+        if np.all(upper - lower < xtol):
+            break
+        midpoint = 0.5 * (lower + upper)
+        f_midpoint = func(midpoint)
+        same_sign_as_lower = np.sign(f_midpoint) == np.sign(f_lower)
+        lower = np.where(same_sign_as_lower, midpoint, lower)
+        f_lower = np.where(same_sign_as_lower, f_midpoint, f_lower)
+        upper = np.where(same_sign_as_lower, upper, midpoint)
+
+    roots = 0.5 * (lower + upper)
+    if np.any(unbracketed):
+        warnings.warn(
+            f"Charge neutrality could not be bracketed for {np.sum(unbracketed)} of the {roots.size} "
+            f"input conditions (i.e. the total charge does not change sign within the Fermi level "
+            f"search range), so NaN is returned for these cases."
+        )
+        roots[unbracketed] = np.nan
+
+    return roots
+
+
+def _safeguarded_newton(
+    func,
+    lower: Union[float, np.ndarray],
+    upper: Union[float, np.ndarray],
+    initial: Optional[Union[float, np.ndarray]] = None,
+    xtol: float = 2e-12,
+    maxiter: int = 100,
+) -> Union[float, np.ndarray]:
+    """
+    Find the roots of the (vectorised) strictly `decreasing` function
+    ``func`` within the brackets ``[lower, upper]``, using Newton steps
+    safeguarded by bisection.
+
+    ``func`` takes an array of positions and returns a tuple of the function
+    values and derivatives. The bracket is narrowed with the sign of each
+    function evaluation, and any Newton step which leaves the current bracket
+    (or is not finite) is replaced by a bisection step, so convergence is
+    guaranteed while typically taking only a handful of evaluations when
+    ``func`` is close to linear (as for the log charge balance) or a good
+    ``initial`` guess (e.g. from a previous solve) is given.
+
+    Roots which lie at the edges of the input brackets (i.e. without a sign
+    change within ``[lower, upper]``), or for which ``func`` is not finite or
+    which have not converged within ``maxiter`` iterations, are returned as
+    ``NaN``, with a warning, for array inputs, while a ``ValueError`` is raised
+    for scalar inputs (as with ``scipy.optimize.brentq``).
+
+    Args:
+        func (callable):
+            Vectorised function, returning ``(values, derivatives)``.
+        lower (float or np.ndarray): Lower bounds of the brackets.
+        upper (float or np.ndarray): Upper bounds of the brackets.
+        initial (float or np.ndarray):
+            Initial guesses (warm starts) for the roots. If ``None`` (default),
+            or outside the brackets, the bracket midpoints are used.
+        xtol (float):
+            Absolute tolerance for the roots. Default is 2e-12, matching that of
+            ``scipy.optimize.brentq``.
+        maxiter (int): Maximum number of iterations. Default is 100.
+
+    Returns:
+        Roots of ``func``, as a float or ``numpy`` array.
+    """
+    orig_lower, orig_upper = np.broadcast_arrays(
+        np.array(lower, dtype=float), np.array(upper, dtype=float)
+    )
+    lower, upper = orig_lower.copy(), orig_upper.copy()
+    midpoint = 0.5 * (lower + upper)
+    x = midpoint if initial is None else np.broadcast_to(np.array(initial, dtype=float), lower.shape)
+    x = np.where((x > lower) & (x < upper), x, midpoint)
+    converged = np.zeros(lower.shape, dtype=bool)
+    non_finite = np.zeros(lower.shape, dtype=bool)
+
+    for _ in range(maxiter):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values, derivatives = func(x)
+            values, derivatives = np.broadcast_to(values, x.shape), np.broadcast_to(derivatives, x.shape)
+            non_finite |= ~converged & ~np.isfinite(values)  # bracket can't be narrowed, so stop
+            lower = np.where(values > 0, x, lower)  # decreasing function, so root is above x
+            upper = np.where(values < 0, x, upper)
+            x_new = x - values / derivatives
+
+        # bisect if the Newton step is not finite or leaves the bracket:
+        bisect = ~np.isfinite(x_new) | (x_new <= lower) | (x_new >= upper)
+        x_new = np.where(bisect, 0.5 * (lower + upper), x_new)
+        step_converged = (values == 0) | (upper - lower < xtol) | (~bisect & (np.abs(x_new - x) < xtol))
+        x = np.where(converged | (values == 0), x, x_new)
+        converged |= step_converged
+        if np.all(converged | non_finite):
+            break
+
+    unbracketed = ~non_finite & ((np.abs(x - orig_lower) < xtol) | (np.abs(x - orig_upper) < xtol))
+    for failed, reason, details in [
+        (
+            unbracketed,
+            "could not be bracketed",
+            "the total charge does not change sign within the Fermi level search range",
+        ),
+        (
+            non_finite,
+            "could not be solved",
+            "the charge balance is not finite, e.g. due to underflowing concentrations",
+        ),
+        (
+            ~converged & ~non_finite,
+            "could not be solved",
+            f"the solver did not converge within {maxiter} iterations",
+        ),
+    ]:
+        if np.any(failed):
+            if x.ndim == 0:  # scalar solve, raise error as with ``scipy.optimize.brentq``
+                raise ValueError(f"Charge neutrality {reason} (i.e. {details}).")
+            warnings.warn(
+                f"Charge neutrality {reason} for {np.sum(failed)} of the {x.size} input conditions "
+                f"(i.e. {details}), so NaN is returned for these cases."
+            )
+            x = np.where(failed, np.nan, x)
+
+    return float(x) if x.ndim == 0 else x
+
+
+def scissor_dos(
+    delta_gap: float,
+    dos: Union[Dos, FermiDos, CarrierConcentrationModel],
+    tol: float = 1e-8,
+    verbose: bool = True,
+):
     """
     Given an input Dos/FermiDos object, rigidly shifts the valence and
     conduction bands of the DOS object to give a band gap that is now
@@ -3209,8 +5223,10 @@ def scissor_dos(delta_gap: float, dos: Union[Dos, FermiDos], tol: float = 1e-8,
     Args:
         delta_gap (float):
             The amount by which to increase/decrease the band gap (in eV).
-        dos (Dos/FermiDos):
-            The input DOS object to scissor.
+        dos (Dos/FermiDos/CarrierConcentrationModel):
+            The input DOS object to scissor. If a ``CarrierConcentrationModel``,
+            its ``fermi_dos`` is scissored and a new ``CarrierConcentrationModel``
+            (with the same settings) is returned.
         tol (float):
             The tolerance to use for determining the VBM and CBM (used in
             ``Dos.get_gap(tol=tol)``). Default: 1e-8.
@@ -3220,6 +5236,18 @@ def scissor_dos(delta_gap: float, dos: Union[Dos, FermiDos], tol: float = 1e-8,
     Returns:
         FermiDos: The scissored DOS object.
     """
+    if isinstance(dos, CarrierConcentrationModel):
+        return CarrierConcentrationModel(
+            scissor_dos(delta_gap, dos.fermi_dos, tol=tol, verbose=verbose),
+            temperatures=dos.temperatures or None,
+            fermi_level_range=(  # shifted symmetrically around the original gap, as for the DOS
+                dos.fermi_level_range[0] - delta_gap / 2,
+                dos.fermi_level_range[1] + delta_gap / 2,
+            ),
+            rtol=dos.rtol,
+            occupation_tol=dos.occupation_tol,
+        )
+
     dos = deepcopy(dos)  # don't overwrite object
     # shift just CBM upwards first, then shift all rigidly down by Eg/2 (simpler code with this approach)
     cbm_index = np.where(
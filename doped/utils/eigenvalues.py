@@ -39,7 +39,12 @@ try:
     user_settings.logger.setLevel(logging.CRITICAL)
     import pydefect.analyzer.make_band_edge_states
     import pydefect.cli.vasp.make_band_edge_orbital_infos as make_bes
-    from pydefect.analyzer.band_edge_states import BandEdgeOrbitalInfos, OrbitalInfo, PerfectBandEdgeState
+    from pydefect.analyzer.band_edge_states import (
+        BandEdgeOrbitalInfos,
+        EdgeInfo,
+        OrbitalInfo,
+        PerfectBandEdgeState,
+    )
     from pydefect.analyzer.eigenvalue_plotter import EigenvalueMplPlotter
     from pydefect.analyzer.make_band_edge_states import make_band_edge_states
     from pydefect.cli.vasp.make_perfect_band_edge_state import get_edge_info
@@ -108,12 +113,74 @@ def make_perfect_band_edge_state_from_vasp(
         ``PerfectBandEdgeState`` object.
     """
     band_edge_prop = band_edge_properties_from_vasprun(vasprun, integer_criterion)
-    orbs, s = procar.data, vasprun.final_structure
-    vbm_info = get_edge_info(band_edge_prop.vbm_info, orbs, s, vasprun)
-    cbm_info = get_edge_info(band_edge_prop.cbm_info, orbs, s, vasprun)
+    vbm_info = _get_edge_info_from_procar(band_edge_prop.vbm_info, procar, vasprun)
+    cbm_info = _get_edge_info_from_procar(band_edge_prop.cbm_info, procar, vasprun)
     return PerfectBandEdgeState(vbm_info, cbm_info)
 
 
+def _get_procar_band_index(procar: Union["EasyunfoldProcar", Procar], band_index: int) -> int:
+    """
+    Get the index of the band with (0-indexed) index ``band_index`` in the
+    ``procar.data`` arrays, accounting for ``StreamedProcar`` objects which
+    only contain the projections for a window of bands.
+    """
+    bands = getattr(procar, "bands", None)
+    if bands is None:
+        return band_index
+    if band_index not in bands:
+        raise ValueError(
+            f"Band index {band_index} is outside the window of bands ({bands.start}-{bands.stop - 1}) "
+            f"for which orbital projections were parsed from the PROCAR!"
+        )
+    return band_index - bands.start
+
+
+def _get_edge_info_from_procar(edge, procar: Union["EasyunfoldProcar", Procar], vasprun: Vasprun):
+    """
+    Get the ``pydefect`` ``EdgeInfo`` for a band edge (``vise`` ``BandEdge``)
+    from a ``Procar`` and ``Vasprun``.
+
+    Modified from ``pydefect``'s ``get_edge_info`` to allow ``StreamedProcar``
+    objects, which only contain the projections for a window of bands.
+    """
+    orbitals = make_bes.calc_orbital_character(
+        procar.data,
+        vasprun.final_structure,
+        Spin.up,
+        edge.kpoint_index,
+        _get_procar_band_index(procar, edge.band_index),
+    )
+    e, occ = vasprun.eigenvalues[Spin.up][edge.kpoint_index, edge.band_index, :]
+    orb_info = OrbitalInfo(energy=e, occupation=occ, orbitals=orbitals)
+    return EdgeInfo(edge.band_index, tuple(edge.kpoint_coords), orb_info)
+
+
+def _get_band_edge_window(vasprun: Vasprun, vbm: float, cbm: float) -> range:
+    """
+    Get the range of (0-indexed) band indices with eigenvalues within
+    ``pydefect``'s ``defaults.eigval_range`` of the VBM and CBM, for which
+    orbital info is generated in ``make_band_edge_orbital_infos``.
+    """
+    eigval_range = defaults.eigval_range
+    max_energy_by_band = np.amax([e[:, :, 0].max(axis=0) for e in vasprun.eigenvalues.values()], axis=0)
+    min_energy_by_band = np.amin([e[:, :, 0].min(axis=0) for e in vasprun.eigenvalues.values()], axis=0)
+
+    lower_idx = np.argwhere(max_energy_by_band > vbm - eigval_range)[0][0]
+    upper_idx = np.argwhere(min_energy_by_band < cbm + eigval_range)[-1][-1]
+    return range(lower_idx, upper_idx + 1)
+
+
+def _get_bulk_band_edge_window(bulk_vr: Vasprun) -> range:
+    """
+    Get the range of (0-indexed) band indices spanning the bulk VBM and CBM,
+    which are the only bands for which the bulk orbital projections are
+    needed in eigenvalue analysis.
+    """
+    band_edge_prop = band_edge_properties_from_vasprun(bulk_vr)
+    edge_band_indices = [band_edge_prop.vbm_info.band_index, band_edge_prop.cbm_info.band_index]
+    return range(min(edge_band_indices), max(edge_band_indices) + 1)
+
+
 def make_band_edge_orbital_infos(
     defect_vr: Vasprun,
     vbm: float,
@@ -145,19 +212,9 @@ def make_band_edge_orbital_infos(
     Returns:
         ``BandEdgeOrbitalInfos `` object
     """
-    eigval_range = defaults.eigval_range
     kpt_coords = [tuple(coord) for coord in defect_vr.actual_kpoints]
-    max_energy_by_spin, min_energy_by_spin = [], []
-
-    for e in defect_vr.eigenvalues.values():
-        max_energy_by_spin.append(np.amax(e[:, :, 0], axis=0))
-        min_energy_by_spin.append(np.amin(e[:, :, 0], axis=0))
-
-    max_energy_by_band = np.amax(np.vstack(max_energy_by_spin), axis=0)
-    min_energy_by_band = np.amin(np.vstack(min_energy_by_spin), axis=0)
-
-    lower_idx = np.argwhere(max_energy_by_band > vbm - eigval_range)[0][0]
-    upper_idx = np.argwhere(min_energy_by_band < cbm + eigval_range)[-1][-1]
+    band_window = _get_band_edge_window(defect_vr, vbm, cbm)
+    lower_idx = band_window.start
 
     orbs = defect_vr.projected_eigenvalues if defect_procar is None else defect_procar.data
     s = defect_vr.final_structure
@@ -166,11 +223,16 @@ def make_band_edge_orbital_infos(
         orb_infos.append([])
         for k_idx in range(len(kpt_coords)):
             orb_infos[-1].append([])
-            for b_idx in range(lower_idx, upper_idx + 1):
+            for b_idx in band_window:
                 e, occ = eigvals[k_idx, b_idx, :]
-                orbitals = make_bes.calc_orbital_character(orbs, s, spin, k_idx, b_idx)
+                orb_b_idx = (  # index in PROCAR data, if only window of bands parsed
+                    b_idx if defect_procar is None else _get_procar_band_index(defect_procar, b_idx)
+                )
+                orbitals = make_bes.calc_orbital_character(orbs, s, spin, k_idx, orb_b_idx)
                 if neighbor_indices:
-                    p_ratio = make_bes.calc_participation_ratio(orbs, spin, k_idx, b_idx, neighbor_indices)
+                    p_ratio = make_bes.calc_participation_ratio(
+                        orbs, spin, k_idx, orb_b_idx, neighbor_indices
+                    )
                 else:
                     p_ratio = None
                 orb_infos[-1][-1].append(OrbitalInfo(e, orbitals, occ, p_ratio))
@@ -185,7 +247,10 @@ def make_band_edge_orbital_infos(
     )
 
 
-def _parse_procar(procar: Optional[Union[str, Path, "EasyunfoldProcar", Procar]] = None):
+def _parse_procar(
+    procar: Optional[Union[str, Path, "EasyunfoldProcar", Procar]] = None,
+    bands: Optional[range] = None,
+):
     """
     Parse a ``procar`` input to a ``Procar`` object in the correct format.
 
@@ -194,6 +259,11 @@ def _parse_procar(procar: Optional[Union[str, Path, "EasyunfoldProcar", Procar]]
             Either a path to the ``VASP`` ``PROCAR``` output file (with
             ``LORBIT > 10`` in the ``INCAR``) or an ``easyunfold``/``pymatgen``
             ``Procar`` object.
+        bands (range):
+            If ``procar`` is a path, the (0-indexed) indices of the bands for
+            which to parse the orbital projections, to reduce memory demand
+            (see ``StreamedProcar``). If ``None`` (default), all bands are
+            parsed.
     """
     if not hasattr(procar, "data"):  # not a parsed Procar object
         if procar and hasattr(procar, "proj_data") and not isinstance(procar, (str, Path, Procar)):
@@ -204,7 +274,7 @@ def _parse_procar(procar: Optional[Union[str, Path, "EasyunfoldProcar", Procar]]
             del procar.proj_data
 
         elif isinstance(procar, (str, Path)):  # path to PROCAR file
-            procar = get_procar(procar)
+            procar = get_procar(procar, bands=bands)
 
     return procar
 
@@ -271,8 +341,8 @@ def get_band_edge_info(
     """
     band_edge_prop = band_edge_properties_from_vasprun(bulk_vr)
 
-    if bulk_procar is not None:
-        bulk_procar = _parse_procar(bulk_procar)
+    if bulk_procar is not None:  # only VBM and CBM orbital projections needed for bulk
+        bulk_procar = _parse_procar(bulk_procar, bands=_get_bulk_band_edge_window(bulk_vr))
         pbes = make_perfect_band_edge_state_from_vasp(vasprun=bulk_vr, procar=bulk_procar)
 
     # get defect neighbour indices
@@ -320,7 +390,12 @@ def get_band_edge_info(
         cbm_info.orbital_info.energy,
         eigval_shift=-vbm_info.orbital_info.energy,
         neighbor_indices=neighbor_indices,
-        defect_procar=_parse_procar(defect_procar),
+        defect_procar=_parse_procar(  # only orbital projections for bands near the band edges needed
+            defect_procar,
+            bands=_get_band_edge_window(
+                defect_vr, vbm_info.orbital_info.energy, cbm_info.orbital_info.energy
+            ),
+        ),
     )
 
     return band_orb, vbm_info, cbm_info
@@ -8,10 +8,9 @@ https://github.com/SMTG-Bham/aide)
 """
 
 import copy
-import itertools
-from math import erfc, exp
 
 import numpy as np
+from scipy.special import erfc
 
 from doped.utils.parsing import _get_bulk_supercell
 
@@ -46,6 +45,8 @@ def get_murphy_image_charge_correction(
     Returns:
         The image charge correction as a ``{charge: correction}`` dictionary.
     """
+    lattice = np.asarray(lattice, dtype=float)
+    dielectric_matrix = np.asarray(dielectric_matrix, dtype=float)
     inv_diel = np.linalg.inv(dielectric_matrix)
     det_diel = np.linalg.det(dielectric_matrix)
     latt = np.sqrt(np.sum(lattice**2, axis=1))
@@ -61,9 +62,6 @@ def get_murphy_image_charge_correction(
     # will be conunted.
     axis = np.array([int(r_c / a + 10) for a in latt])
 
-    # Calculate supercell parallelepiped and dimensions
-    sup_latt = np.dot(np.diag(axis), lattice)
-
     # Determine which of the lattice calculation_metadata is the largest and determine
     # reciprocal space supercell
     recip_axis = np.array([int(x) for x in factor * max(latt) / latt])
@@ -72,7 +70,7 @@ def get_murphy_image_charge_correction(
     # Calculatate the reciprocal lattice vectors (need factor of 2 pi)
     recip_latt = np.linalg.inv(lattice).T * 2 * np.pi
 
-    real_space = _get_real_space(conv, inv_diel, det_diel, r_c, axis, sup_latt)
+    real_space = _get_real_space(conv, inv_diel, det_diel, r_c, axis, lattice)
     reciprocal = _get_recip(
         conv,
         recip_axis,
@@ -131,31 +129,71 @@ def get_murphy_image_charge_correction(
     return correction
 
 
-def _get_real_space(conv, inv_diel, det_diel, r_c, axis, sup_latt):
-    # Calculate real space component
-    axis_ranges = [range(-a, a) for a in axis]
+# beyond these arguments, erfc(x) and exp(-x) underflow to zero in double precision, so lattice
+# points past the corresponding distances contribute nothing to the real/reciprocal space sums:
+_ERFC_UNDERFLOW_ARG = 26.7
+_EXP_UNDERFLOW_ARG = 746.0
 
-    # Pre-compute square of cutoff distance for cheaper comparison than
-    # separation < r_c
-    r_c_sq = r_c**2
 
-    def _real_loop_function(mno):
-        # Calculate the defect's fractional position in extended supercell
-        d_super = np.array(mno, dtype=float) / axis
-        d_super_cart = np.dot(d_super, sup_latt)
+def _get_lattice_index_ranges(axis, lattice, max_distance):
+    """
+    Get the integer index ranges (``range(-a, a)`` for each ``a`` in
+    ``axis``) for the lattice points ``mno @ lattice``, truncated to remove
+    indices for which all lattice points lie further than ``max_distance``
+    from the origin (i.e. lattice planes with ``|index| * plane_spacing >
+    max_distance``).
+    """
+    volume = abs(np.linalg.det(lattice))
+    index_ranges = []
+    for i, a in enumerate(axis):
+        plane_spacing = volume / np.linalg.norm(np.cross(lattice[(i + 1) % 3], lattice[(i + 2) % 3]))
+        max_index = int(max_distance / plane_spacing) + 1
+        index_ranges.append(np.arange(max(-a, -max_index), min(a, max_index + 1)))
+
+    return index_ranges
 
-        # Test if the new atom coordinates fall within r_c, then solve
-        separation_sq = np.sum(np.square(d_super_cart))
-        # Take all cases within r_c except m,n,o != 0,0,0
-        if separation_sq < r_c_sq and any(mno):
-            mod = np.dot(d_super_cart, inv_diel)
-            dot_prod = np.dot(mod, d_super_cart)
-            N = np.sqrt(dot_prod)
-            return 1 / np.sqrt(det_diel) * erfc(conv * N) / N
 
+def _sum_over_lattice_points(index_ranges, lattice, term_function, max_chunk_size=2_000_000):
+    """
+    Sum ``term_function(cart_coords)`` over all non-zero lattice points
+    ``mno @ lattice`` with ``m, n, o`` in ``index_ranges``.
+
+    The lattice points are evaluated as NumPy arrays in blocks of consecutive
+    ``m`` slabs, with at most ~``max_chunk_size`` points per block to bound
+    memory usage.
+    """
+    m_range, n_range, o_range = index_ranges
+    no_indices = np.stack(np.meshgrid(n_range, o_range, indexing="ij"), axis=-1).reshape(-1, 2)
+    if not len(m_range) or not len(no_indices):
         return 0.0
 
-    return sum(_real_loop_function(mno) for mno in itertools.product(*axis_ranges))
+    no_cart_coords = no_indices @ lattice[1:]
+    no_is_zero = ~np.any(no_indices, axis=1)
+    slabs_per_block = max(1, max_chunk_size // len(no_indices))
+
+    total = 0.0
+    for i in range(0, len(m_range), slabs_per_block):
+        m_block = m_range[i : i + slabs_per_block]
+        cart_coords = (m_block[:, np.newaxis, np.newaxis] * lattice[0] + no_cart_coords).reshape(-1, 3)
+        is_origin = ((m_block == 0)[:, np.newaxis] & no_is_zero).ravel()
+        total += term_function(cart_coords[~is_origin])
+
+    return total
+
+
+def _get_real_space(conv, inv_diel, det_diel, r_c, axis, lattice):
+    # Calculate real space component; only lattice points within r_c (and with non-zero erfc) count
+    r_c_sq = r_c**2
+    max_eigval_diel = max(abs(np.linalg.eigvalsh(np.linalg.inv(inv_diel))))
+    max_distance = min(r_c, _ERFC_UNDERFLOW_ARG * np.sqrt(max_eigval_diel) / conv)
+
+    def _real_space_terms(cart_coords):
+        cart_coords = cart_coords[np.sum(np.square(cart_coords), axis=1) < r_c_sq]
+        N = np.sqrt(np.einsum("ni,ij,nj->n", cart_coords, inv_diel, cart_coords))
+        return np.sum(erfc(conv * N) / N) / np.sqrt(det_diel)
+
+    index_ranges = _get_lattice_index_ranges(axis, lattice, max_distance)
+    return _sum_over_lattice_points(index_ranges, lattice, _real_space_terms)
 
 
 def _get_recip(
@@ -165,26 +203,16 @@ def _get_recip(
     recip_latt,
     dielectric_matrix,
 ):
-    # convert factional motif to reciprocal space and
-    # calculate reciprocal space supercell parallelepiped
-    recip_sup_latt = np.dot(np.diag(recip_axis), recip_latt)
+    # Calculate reciprocal space component; terms with exp(-g.eps.g / 4conv^2) = 0 can be skipped
+    min_eigval_diel = min(abs(np.linalg.eigvalsh(dielectric_matrix)))
+    max_distance = 2 * conv * np.sqrt(_EXP_UNDERFLOW_ARG / min_eigval_diel)
 
-    # Calculate reciprocal space component
-    axis_ranges = [range(-a, a) for a in recip_axis]
-
-    def _recip_loop_function(mno):
-        # Calculate the defect's fractional position in extended supercell
-        d_super = np.array(mno, dtype=float) / recip_axis
-        d_super_cart = np.dot(d_super, recip_sup_latt)
-
-        if any(mno):
-            mod = np.dot(d_super_cart, dielectric_matrix)
-            dot_prod = np.dot(mod, d_super_cart)
-            return exp(-dot_prod / (4 * conv**2)) / dot_prod
-
-        return 0.0
+    def _recip_terms(cart_coords):
+        dot_prod = np.einsum("ni,ij,nj->n", cart_coords, dielectric_matrix, cart_coords)
+        return np.sum(np.exp(-dot_prod / (4 * conv**2)) / dot_prod)
 
-    reciprocal = sum(_recip_loop_function(mno) for mno in itertools.product(*axis_ranges))
+    index_ranges = _get_lattice_index_ranges(recip_axis, recip_latt, max_distance)
+    reciprocal = _sum_over_lattice_points(index_ranges, recip_latt, _recip_terms)
     scale_factor = 4 * np.pi / recip_volume
     return reciprocal * scale_factor
 
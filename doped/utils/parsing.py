@@ -3,27 +3,72 @@ Helper functions for parsing VASP supercell defect calculations.
 """
 
 import contextlib
+import io
 import itertools
 import logging
 import os
 import re
+import sys
+import threading
+import time
 import warnings
 from collections import defaultdict
 from functools import lru_cache
+from multiprocessing.pool import ThreadPool
 from typing import TYPE_CHECKING, Optional, Union
 
 import numpy as np
+from monty.io import zopen
 from monty.serialization import loadfn
 from pymatgen.core.periodic_table import Element
 from pymatgen.core.structure import PeriodicSite, Structure
 from pymatgen.electronic_structure.core import Spin
-from pymatgen.io.vasp.inputs import POTCAR_STATS_PATH, UnknownPotcarWarning
-from pymatgen.io.vasp.outputs import Locpot, Outcar, Procar, Vasprun, _parse_vasp_array
+from pymatgen.io.vasp.inputs import POTCAR_STATS_PATH, Incar, UnknownPotcarWarning
+from pymatgen.io.vasp.outputs import (
+    Locpot,
+    Outcar,
+    Procar,
+    UnconvergedVASPWarning,
+    Vasprun,
+    _parse_vasp_array,
+)
 from pymatgen.util.coord import pbc_diff
 
 from doped.core import DefectEntry
 
+try:  # lxml allows filtering ``iterparse`` events by tag, which is much faster for large files
+    from lxml import etree as ET
+
+    _XMLParseError: type[Exception] = ET.XMLSyntaxError
+except ImportError:  # pragma: no cover
+    import xml.etree.ElementTree as ET  # type: ignore
+
+    _XMLParseError = ET.ParseError
+
+_STREAMED_VASPRUN_TAGS = (
+    "modeling",
+    "generator",
+    "incar",
+    "kpoints",
+    "parameters",
+    "atominfo",
+    "structure",
+    "calculation",
+    "eigenvalues",
+    "projected",
+    "eigenvalues_kpoints_opt",
+    "projected_kpoints_opt",
+    "dos",
+    "dielectricfunction",
+)
+
+try:  # compiled parser for volumetric data, available in newer pymatgen versions
+    from pymatgen.optimization.fast_parser import parse_n_doubles
+except ImportError:  # pragma: no cover
+    parse_n_doubles = None
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 
@@ -100,9 +145,198 @@ def parse_projected_eigen_no_mag(elem):
 Vasprun._parse_projected_eigen = parse_projected_eigen_no_mag  # skip parsing of proj magnetisation
 
 
-def get_vasprun(vasprun_path: Union[str, "Path"], **kwargs):
+class StreamedVasprun(Vasprun):
+    r"""
+    Lightweight version of ``pymatgen``'s ``Vasprun``, which streams through
+    the ``vasprun.xml(.gz)`` file once with ``iterparse``, keeping only the
+    data needed for defect parsing; i.e. the ``INCAR``/``KPOINTS``/``POTCAR``
+    metadata and parameters (incl. ``NELECT``), the initial and final
+    structures, the final ionic step (for the final energy) and optionally
+    the final eigenvalues and projected eigenvalues.
+
+    Intermediate ionic steps (structures, forces, stresses and electronic
+    steps) are discarded without being parsed, and DOS and (unless requested)
+    eigenvalue data are cleared as soon as they have been read, so that the
+    memory demand is bounded by the size of a single ionic step. As with
+    ``pymatgen``'s ``BSVasprun``, this is a ``Vasprun`` subclass, so it can be
+    used in place of a ``Vasprun`` object for defect parsing, with the
+    exceptions that ``ionic_steps`` (and thus ``structures``) only contains
+    the final ionic step, and the DOS (and ``efermi``) is not parsed (as with
+    ``Vasprun(parse_dos=False)``). ``POTCAR`` files are not parsed, so
+    ``potcar_spec`` only contains the ``POTCAR`` ``TITEL``\s from the
+    ``vasprun.xml`` file.
+    """
+
+    def __init__(
+        self,
+        filename: Union[str, "Path"],
+        parse_eigen: bool = True,
+        parse_projected_eigen: bool = False,
+        occu_tol: float = 1e-8,
+        separate_spins: bool = False,
+        exception_on_bad_xml: bool = True,
+        **kwargs,
+    ):
+        """
+        Stream and parse the ``vasprun.xml(.gz)`` file.
+
+        Args:
+            filename (str, Path):
+                Path to the ``vasprun.xml(.gz)`` file.
+            parse_eigen (bool):
+                Whether to parse the final eigenvalues. (Default: True)
+            parse_projected_eigen (bool):
+                Whether to parse the final projected eigenvalues (without
+                the projected magnetisation). (Default: False)
+            occu_tol (float):
+                Occupation tolerance for determining the VBM and CBM, as in
+                ``Vasprun``. (Default: 1e-8)
+            separate_spins (bool):
+                Whether to report the band gap, VBM and CBM for each spin
+                channel separately, as in ``Vasprun``. (Default: False)
+            exception_on_bad_xml (bool):
+                Whether to raise an exception if the XML is malformed (e.g.
+                incomplete calculation), otherwise a warning is thrown and the
+                partially-parsed data is kept. (Default: True)
+            **kwargs:
+                Additional keyword arguments accepted by ``Vasprun`` which are
+                not used here (e.g. ``parse_dos``, ``parse_potcar_file``).
+        """
+        self.filename = filename
+        self.occu_tol = occu_tol
+        self.separate_spins = separate_spins
+        self.exception_on_bad_xml = exception_on_bad_xml
+
+        self.efermi = None
+        self.eigenvalues = None
+        self.projected_eigenvalues = None
+        for attr in ["projected_magnetization", "projected_magnetisation"]:  # renamed in newer pymatgen
+            if not isinstance(getattr(type(self), attr, None), property):
+                setattr(self, attr, None)
+        self.dielectric_data: dict = {}
+        self.kpoints_opt_props = None
+        self.md_data: list = []
+        self.incar = Incar({})
+
+        final_calculation = None
+        self.nionic_steps = 0
+        with zopen(find_archived_fname(str(filename)), "rb") as f:
+            try:
+                final_calculation = self._stream(f, parse_eigen, parse_projected_eigen)
+            except _XMLParseError:
+                if self.exception_on_bad_xml:
+                    raise
+                warnings.warn("XML is malformed. Parsing has stopped but partial data is available.")
+
+        # only the final ionic step is parsed:
+        parse_ionic_step = getattr(self, "_parse_ionic_step", None) or self._parse_calculation
+        self.ionic_steps = [] if final_calculation is None else [parse_ionic_step(final_calculation)]
+        self.vasp_version = self.generator["version"]
+
+        if (
+            self.incar.get("ALGO") not in {"Chi", "Bse"}
+            and not self.converged
+            and self.parameters.get("IBRION") != 0
+        ):
+            warnings.warn(
+                f"{filename} is an unconverged VASP run.\n"
+                f"Electronic convergence reached: {self.converged_electronic}.\n"
+                f"Ionic convergence reached: {self.converged_ionic}.",
+                UnconvergedVASPWarning,
+            )
+
+    def _stream(self, stream, parse_eigen: bool, parse_projected_eigen: bool):
+        """
+        Stream through the ``vasprun.xml`` file, parsing the header data and
+        eigenvalues (if requested), and returning the final ``<calculation>``
+        element (or ``None`` if there are no ionic steps).
+        """
+        root = None
+        final_calculation = None
+        parsed_header = in_kpoints_opt = False
+        iterparse_kwargs = {"tag": _STREAMED_VASPRUN_TAGS} if hasattr(ET, "XMLSyntaxError") else {}
+        for event, elem in ET.iterparse(stream, events=("start", "end"), **iterparse_kwargs):
+            tag = elem.tag
+            if event == "start":
+                if root is None:
+                    root = elem
+                elif tag == "calculation":
+                    parsed_header = True
+                elif tag in {"eigenvalues_kpoints_opt", "projected_kpoints_opt"}:
+                    in_kpoints_opt = True
+                continue
+
+            if not parsed_header:
+                if tag == "generator":
+                    self.generator = self._parse_params(elem)
+                elif tag == "incar":
+                    self.incar = Incar(self._parse_params(elem))
+                elif tag == "kpoints" and not hasattr(self, "kpoints"):
+                    self.kpoints, self.actual_kpoints, self.actual_kpoints_weights = self._parse_kpoints(
+                        elem
+                    )
+                elif tag == "parameters":
+                    self.parameters = self._parse_params(elem)
+                elif tag == "structure" and elem.attrib.get("name") == "initialpos":
+                    self.initial_structure = self._parse_structure(elem)
+                    self.final_structure = self.initial_structure
+                elif tag == "atominfo":
+                    self.atomic_symbols, self.potcar_symbols = self._parse_atominfo(elem)
+                    self.potcar_spec = [
+                        {"titel": titel, "hash": None, "summary_stats": {}}
+                        for titel in self.potcar_symbols
+                    ]
+
+            if tag == "calculation":
+                # only keep the latest ionic step in memory, unparsed:
+                if final_calculation is not None and root is not None:
+                    with contextlib.suppress(ValueError):
+                        root.remove(final_calculation)
+                final_calculation = elem
+                self.nionic_steps += 1
+
+            elif tag in {"eigenvalues_kpoints_opt", "projected_kpoints_opt"}:
+                in_kpoints_opt = False
+                elem.clear()
+
+            elif tag == "eigenvalues" and not in_kpoints_opt:
+                if parse_eigen:
+                    self.eigenvalues = self._parse_eigen(elem)
+                elem.clear()
+
+            elif tag == "projected" and not in_kpoints_opt:
+                if parse_projected_eigen:
+                    self.projected_eigenvalues, _proj_mag = self._parse_projected_eigen(elem)
+                elem.clear()
+
+            elif tag in {"dos", "dielectricfunction"}:
+                elem.clear()
+
+            elif tag == "structure" and elem.attrib.get("name") == "finalpos":
+                self.final_structure = self._parse_structure(elem)
+
+        return final_calculation
+
+    @property
+    def converged_ionic(self) -> bool:
+        """
+        Whether ionic convergence has been reached, i.e. VASP exited before
+        reaching the maximum number of ionic steps (``NSW``) for a relaxation.
+        Uses the total number of ionic steps (``nionic_steps``), as only the
+        final ionic step is stored in ``ionic_steps``.
+        """
+        nsw = self.parameters.get("NSW", 0)
+        return nsw <= 1 or self.nionic_steps < nsw
+
+
+def get_vasprun(vasprun_path: Union[str, "Path"], streamed: bool = False, **kwargs):
     """
     Read the ``vasprun.xml(.gz)`` file as a ``pymatgen`` ``Vasprun`` object.
+
+    If ``streamed`` is ``True``, the file is instead parsed as a lightweight
+    ``StreamedVasprun`` object (a ``Vasprun`` subclass), which only parses
+    the data required for defect parsing (with much lower memory demand and
+    faster parsing for large/long calculations); see ``StreamedVasprun``.
     """
     vasprun_path = str(vasprun_path)  # convert to string if Path object
     warnings.filterwarnings(
@@ -115,7 +349,9 @@ def get_vasprun(vasprun_path: Union[str, "Path"], **kwargs):
     default_kwargs = {"parse_dos": False}
     default_kwargs.update(kwargs)
     try:
-        vasprun = Vasprun(find_archived_fname(vasprun_path), **default_kwargs)
+        vasprun = (StreamedVasprun if streamed else Vasprun)(
+            find_archived_fname(vasprun_path), **default_kwargs
+        )
     except FileNotFoundError as exc:
         raise FileNotFoundError(
             f"vasprun.xml not found at {vasprun_path}(.gz/.xz/.bz/.lzma). Needed for parsing calculation "
@@ -139,6 +375,120 @@ def get_locpot(locpot_path: Union[str, "Path"]):
     return locpot
 
 
+def _stream_doubles(file, n_values: int, chunk_size: int) -> "Iterator[np.ndarray]":
+    """
+    Stream ``n_values`` whitespace-separated floats from the binary ``file``
+    (from the current position), yielding arrays of (up to) ``chunk_size``
+    values at a time, so that only one chunk is held in memory at once.
+
+    Uses the compiled ``pymatgen`` ``parse_n_doubles`` parser (``pymatgen``
+    >= 2025) for uncompressed files if available, otherwise ``numpy`` parsing
+    of blocks of text. Stops early if the end of the file is reached.
+    """
+    if parse_n_doubles is not None and isinstance(file, io.BufferedReader):  # uncompressed, seekable
+        while n_values > 0:
+            chunk = np.empty(min(chunk_size, n_values))
+            n_parsed = parse_n_doubles(file, chunk, len(chunk))
+            if n_parsed:
+                yield chunk[:n_parsed]
+            if n_parsed < len(chunk):  # end of file
+                return
+            n_values -= n_parsed
+        return
+
+    buffer = np.empty(0)
+    while n_values > 0:
+        while len(buffer) < min(chunk_size, n_values):
+            text = file.read(min(chunk_size, 250_000) * 20)  # ~20 bytes per value in VASP files
+            if not text:  # end of file
+                if len(buffer):
+                    yield buffer[:n_values]
+                return
+            text += file.readline()  # complete the last line
+            with warnings.catch_warnings():  # if non-numeric data after the values, parsing just stops
+                warnings.simplefilter("ignore", DeprecationWarning)
+                buffer = np.concatenate([buffer, np.fromstring(text, sep=" ")])
+
+        n_chunk = min(chunk_size, n_values)
+        yield buffer[:n_chunk]
+        buffer = buffer[n_chunk:]
+        n_values -= n_chunk
+
+
+def get_locpot_planar_averages(locpot_path: Union[str, "Path"], chunk_size: int = 1_000_000) -> dict:
+    """
+    Get the planar-averaged electrostatic potentials along each lattice vector
+    direction from a ``LOCPOT(.gz)`` file, in the same format as the
+    ``bulk_locpot_dict``/``defect_locpot_dict`` used for the Freysoldt (FNV)
+    correction; i.e. ``{str(axis): Locpot.get_average_along_axis(axis) for
+    axis in [0, 1, 2]}``.
+
+    Rather than parsing the full ``LOCPOT`` as a ``pymatgen`` ``Locpot``
+    object, the volumetric data is streamed in chunks of (up to)
+    ``chunk_size`` grid points and the planar averages are accumulated on the
+    fly, so that the full potential grid is never held in memory.
+
+    Args:
+        locpot_path (str, Path):
+            Path to the ``LOCPOT(.gz)`` file.
+        chunk_size (int):
+            (Approximate) number of grid points to parse at a time, rounded to
+            a whole number of planes along the `c`-axis. Default is 1,000,000.
+
+    Returns:
+        dict: ``{"0": a-axis average, "1": b-axis average, "2": c-axis average}``
+    """
+    locpot_path = str(locpot_path)  # convert to string if Path object
+    try:
+        locpot_path = find_archived_fname(locpot_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"LOCPOT file not found at {locpot_path}(.gz/.xz/.bz/.lzma). Needed for calculating the "
+            f"Freysoldt (FNV) image charge correction!"
+        ) from None
+
+    with zopen(locpot_path, "rb") as f:
+        for _ in range(5):  # comment, scaling factor and lattice vectors
+            f.readline()
+        atom_counts = f.readline().split()
+        if not all(i.isdigit() for i in atom_counts):  # VASP 5+ format, with species names line
+            atom_counts = f.readline().split()
+        if f.readline().strip().lower().startswith(b"s"):  # selective dynamics
+            f.readline()  # Direct/Cartesian line
+        for _ in range(sum(int(i) for i in atom_counts)):
+            f.readline()
+
+        grid_line = f.readline()
+        while grid_line and not grid_line.strip():  # skip blank line(s)
+            grid_line = f.readline()
+        grid_dims = [int(i) for i in grid_line.split()]
+        if len(grid_dims) != 3:
+            raise ValueError(f"Could not parse the potential grid dimensions from {locpot_path}!")
+        ngx, ngy, ngz = grid_dims
+
+        # data is ordered with x fastest, then y, then z, so accumulate sums over whole xy planes:
+        sums = [np.zeros(ngx), np.zeros(ngy), np.zeros(ngz)]
+        z_idx = 0
+        for chunk in _stream_doubles(
+            f, ngx * ngy * ngz, chunk_size=max(1, chunk_size // (ngx * ngy)) * ngx * ngy
+        ):
+            n_planes = len(chunk) // (ngx * ngy)
+            planes = chunk[: n_planes * ngx * ngy].reshape(n_planes, ngy, ngx)
+            sums[0] += planes.sum(axis=(0, 1))
+            sums[1] += planes.sum(axis=(0, 2))
+            sums[2][z_idx : z_idx + n_planes] = planes.sum(axis=(1, 2))
+            z_idx += n_planes
+
+    if z_idx < ngz:
+        raise ValueError(f"LOCPOT file at {locpot_path} is incomplete!")
+
+    return {
+        "0": sums[0] / (ngy * ngz),
+        "1": sums[1] / (ngx * ngz),
+        "2": sums[2] / (ngx * ngy),
+    }
+
+
 def get_outcar(outcar_path: Union[str, "Path"]):
     """
     Read the ``OUTCAR(.gz)`` file as a ``pymatgen`` ``Outcar`` object.
@@ -154,7 +504,310 @@ def get_outcar(outcar_path: Union[str, "Path"]):
     return outcar
 
 
-def get_procar(procar_path: Union[str, "Path"]):
+_CORE_POTENTIALS_HEADER = b"average (electrostatic) potential at core"
+_CORE_POTENTIALS_NORM_LINE = b"(the norm of the test charge is"
+_BLANK_LINE_REGEX = re.compile(rb"\n[ \t]*\r?\n")  # core potentials table is terminated by a blank line
+_CORE_POTENTIALS_ROW_REGEX = re.compile(r"\s+\d+\s*([\.\-\d]+)")  # same as used in ``pymatgen``
+
+
+def _read_core_potentials_block(file, block_size: int) -> Optional[bytes]:
+    """
+    Read a core potentials block from the current position of ``file``
+    (which should be at the start of the block header), up to the
+    terminating blank line. Returns ``None`` if the block is incomplete.
+    """
+    buffer = b""
+    while True:
+        data = file.read(block_size)
+        buffer += data
+        if end := _BLANK_LINE_REGEX.search(buffer):
+            block = buffer[: end.end()]
+            return block if _CORE_POTENTIALS_NORM_LINE in block else None
+        if not data:  # end of file
+            return None
+
+
+def _find_last_core_potentials_block_reverse(file, block_size: int) -> Optional[bytes]:
+    """
+    Find the last complete core potentials block in a seekable ``OUTCAR``
+    ``file``, by reading backwards from the end of the file.
+    """
+    file.seek(0, os.SEEK_END)
+    pos = file.tell()
+    overlap = b""  # in case header spans two blocks
+    while pos > 0:
+        read_size = min(block_size, pos)
+        pos -= read_size
+        file.seek(pos)
+        data = file.read(read_size) + overlap
+        idx = data.rfind(_CORE_POTENTIALS_HEADER)
+        while idx >= 0:
+            file.seek(pos + idx)
+            if block := _read_core_potentials_block(file, block_size):
+                return block
+            idx = data.rfind(_CORE_POTENTIALS_HEADER, 0, idx)  # incomplete, try previous block
+        overlap = data[: len(_CORE_POTENTIALS_HEADER) - 1]
+
+    return None
+
+
+def _find_last_core_potentials_block_forward(file, block_size: int) -> Optional[bytes]:
+    """
+    Find the last complete core potentials block in a (compressed, non-
+    seekable) ``OUTCAR`` ``file``, by streaming through the file in blocks and
+    keeping only the last core potentials block found.
+    """
+    last_block = None
+    buffer = b""
+    while True:
+        data = file.read(block_size)
+        buffer += data
+        start = buffer.find(_CORE_POTENTIALS_HEADER)
+        while start >= 0:
+            end = _BLANK_LINE_REGEX.search(buffer, start)
+            if end is None:  # need to read more data
+                break
+            if _CORE_POTENTIALS_NORM_LINE in (block := buffer[start : end.end()]):
+                last_block = block
+            buffer = buffer[end.end() :]
+            start = buffer.find(_CORE_POTENTIALS_HEADER)
+
+        if not data:  # end of file
+            return last_block
+        buffer = buffer[start:] if start >= 0 else buffer[-(len(_CORE_POTENTIALS_HEADER) - 1) :]
+
+
+def get_core_potentials(outcar_path: Union[str, "Path"], block_size: int = 2**20) -> Optional[np.ndarray]:
+    r"""
+    Get the atomic core (site) electrostatic potentials from the final
+    "average (electrostatic) potential at core" block in an ``OUTCAR(.gz)``
+    file, as a ``numpy`` array. Equivalent to the ``electrostatic_potential``
+    attribute of a ``pymatgen`` ``Outcar`` object, but much faster and more
+    memory-efficient for large ``OUTCAR``\s (e.g. from long relaxations), as
+    the rest of the file is not parsed.
+
+    Uncompressed ``OUTCAR``\s are scanned backwards from the end of the file,
+    so only the final ionic step is read. Compressed files cannot be
+    efficiently read backwards, and so are instead streamed in blocks of
+    ``block_size`` bytes, keeping only the last core potentials block.
+
+    Args:
+        outcar_path (PathLike): Path to the ``OUTCAR(.gz)`` file.
+        block_size (int):
+            Number of bytes to read from the file at a time. Default is
+            1 MB.
+
+    Returns:
+        ``numpy`` array of the atomic core potentials (as printed in the
+        ``OUTCAR``, i.e. the negative of the ``site_potentials`` used in the
+        Kumagai (eFNV) correction), or ``None`` if not present in the
+        ``OUTCAR``.
+    """
+    outcar_path = str(outcar_path)  # convert to string if Path object
+    try:
+        outcar_path = find_archived_fname(outcar_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"OUTCAR file not found at {outcar_path}(.gz/.xz/.bz/.lzma). Needed for calculating the "
+            f"Kumagai (eFNV) image charge correction."
+        ) from None
+
+    with zopen(outcar_path, "rb") as f:
+        if isinstance(f, io.BufferedReader):  # uncompressed, seekable
+            block = _find_last_core_potentials_block_reverse(f, block_size)
+        else:
+            block = _find_last_core_potentials_block_forward(f, block_size)
+
+    if block is None:
+        return None
+
+    table = block.partition(_CORE_POTENTIALS_NORM_LINE)[2].partition(b"\n")[2]
+    core_potentials = _CORE_POTENTIALS_ROW_REGEX.findall(table.decode())
+    return np.array(core_potentials, dtype=float) if core_potentials else None
+
+
+_PROCAR_MARKER_REGEX = re.compile(
+    rb"^(?:(?P<section>#) of k-points|(?P<kpoint>[ \t]*k-point)[ \t]|band[ \t]+(?P<band>\d+)[ \t]+"
+    rb"# energy[ \t]+(?P<energy>\S+)[ \t]+# occ\.[ \t]+(?P<occ>\S+))",
+    re.MULTILINE,
+)
+
+
+def _iter_procar_segments(file, block_size: int) -> "Iterator[bytes]":
+    """
+    Stream through a binary ``PROCAR`` ``file`` in blocks of (at least)
+    ``block_size`` bytes, yielding segments of the file which end at band
+    boundaries (i.e. before a ``band`` header line), so that each segment only
+    contains complete bands.
+    """
+    buffer = b""
+    while data := file.read(block_size):
+        buffer += data
+        if (cut := buffer.rfind(b"\nband")) > 0:
+            yield buffer[: cut + 1]
+            buffer = buffer[cut + 1 :]
+    if buffer:
+        yield buffer
+
+
+class StreamedProcar(Procar):
+    r"""
+    Memory-efficient version of ``pymatgen``'s ``Procar``, which streams
+    through the ``PROCAR(.gz)`` file in blocks and only stores the orbital
+    projections for a window of bands (e.g. those near the band edges, which
+    are all that is needed for eigenvalue analysis), as ``float32`` arrays.
+
+    The eigenvalues and occupancies of all bands are stored, but ``data`` only
+    contains the projections for the bands in the ``bands`` attribute (a
+    ``range`` of 0-indexed band indices); i.e. ``data[spin][k, i]`` gives the
+    projections for band index ``bands[i]`` at k-point index ``k``. For
+    ``PROCAR``\s from SOC calculations, only the total projections are
+    stored (with the magnetisation projections ignored, as in
+    ``get_procar``), and phase factors (``LORBIT = 12``) are not parsed.
+    """
+
+    def __init__(
+        self,
+        filename: Union[str, "Path"],
+        bands: Optional[Union[range, list[int], tuple[int, ...]]] = None,
+        energy_window: Optional[tuple[float, float]] = None,
+        block_size: int = 2**22,
+    ):
+        """
+        Stream and parse the ``PROCAR(.gz)`` file.
+
+        Args:
+            filename (str, Path):
+                Path to the ``PROCAR(.gz)`` file.
+            bands (range, list[int], tuple[int]):
+                0-indexed indices of the bands for which to store the
+                orbital projections. The projections are stored for the
+                contiguous range of bands spanning these indices. If ``None``
+                (default), uses ``energy_window`` if set, otherwise all bands.
+            energy_window (tuple[float, float]):
+                Alternatively to ``bands``, a (min, max) window of energies
+                (in eV); projections are then stored for all bands with an
+                eigenvalue within this window at any k-point. Requires an
+                additional (fast) pass over the file to read the band energies
+                first. Ignored if ``bands`` is set. (Default: None)
+            block_size (int):
+                Number of bytes to read from the file at a time.
+                (Default: 4 MB)
+        """
+        self.filename = filename
+        self._block_size = block_size
+
+        if bands is None and energy_window is not None:
+            self._stream(range(0))  # only read band energies, to determine the bands in energy_window
+            in_window = np.any(
+                [
+                    (eigenvalues >= energy_window[0]) & (eigenvalues <= energy_window[1])
+                    for eigenvalues in self.eigenvalues.values()
+                ],
+                axis=(0, 1),
+            )
+            if not np.any(in_window):
+                raise ValueError(f"No bands found within the energy window {energy_window} in {filename}!")
+            bands = np.flatnonzero(in_window)
+
+        if bands is not None:
+            bands = range(min(bands), max(bands) + 1)
+        self._stream(bands)
+
+    def _stream(self, bands: Optional[range]):
+        """
+        Stream through the ``PROCAR`` file, parsing the band eigenvalues and
+        occupancies, and the orbital projections for ``bands`` (all bands if
+        ``None``).
+        """
+        self.eigenvalues: dict[Spin, np.ndarray] = {}
+        self.occupancies: dict[Spin, np.ndarray] = {}
+        self.data: dict[Spin, np.ndarray] = {}
+        self.orbitals: Optional[list[str]] = None
+        self.is_soc: Optional[bool] = None
+        self.phase_factors = self.xyz_data = None
+        self.bands = bands
+        kpoints, weights = [], []
+        spin = None
+        kpoint_idx = -1
+
+        with zopen(self.filename, "rb") as f:
+            for segment in _iter_procar_segments(f, self._block_size):
+                matches = list(_PROCAR_MARKER_REGEX.finditer(segment))
+                for i, match in enumerate(matches):
+                    if match["section"]:  # new spin section
+                        spin = Spin.up if spin is None else Spin.down
+                        kpoint_idx = -1
+                        header = segment[match.start() : segment.find(b"\n", match.start())]
+                        self.nkpoints, self.nbands, self.nions = map(int, re.findall(rb"\d+", header))
+                        if self.bands is None:
+                            self.bands = range(self.nbands)
+                        self.eigenvalues[spin] = np.zeros((self.nkpoints, self.nbands))
+                        self.occupancies[spin] = np.zeros((self.nkpoints, self.nbands))
+
+                    elif match["kpoint"]:
+                        kpoint_idx += 1
+                        if spin == Spin.up:  # k-points are repeated for spin down
+                            kpoint_line = segment[match.start() : segment.find(b"\n", match.start())]
+                            tokens = re.sub(r"(\d)-", r"\1 -", kpoint_line.decode()).split()
+                            kpoints.append([float(i) for i in tokens[-6:-3]])
+                            weights.append(float(tokens[-1]))
+
+                    else:
+                        band_idx = int(match["band"]) - 1
+                        try:
+                            energy = float(match["energy"])
+                        except ValueError:  # energy printed as "****" if very large
+                            energy = np.nan
+                        self.eigenvalues[spin][kpoint_idx, band_idx] = energy
+                        self.occupancies[spin][kpoint_idx, band_idx] = float(match["occ"])
+
+                        if band_idx in self.bands:
+                            band_end = matches[i + 1].start() if i + 1 < len(matches) else len(segment)
+                            self._parse_band_projections(
+                                segment[match.end() : band_end],
+                                spin,
+                                kpoint_idx,
+                                band_idx - self.bands.start,
+                            )
+
+        if not self.eigenvalues:
+            raise ValueError(f"No data found in PROCAR file {self.filename}!")
+
+        if not self.data:  # no projections parsed for this window
+            self.data = {
+                spin: np.zeros((self.nkpoints, 0, self.nions, len(self.orbitals or [])), dtype=np.float32)
+                for spin in self.eigenvalues
+            }
+        self.nspins = len(self.eigenvalues)
+        self.kpoints = np.array(kpoints)
+        self.weights = np.array(weights)
+
+    def _parse_band_projections(self, band_text: bytes, spin: Spin, kpoint_idx: int, data_band_idx: int):
+        """
+        Parse the orbital projections from the text of a single band in the
+        ``PROCAR`` file, storing them in ``self.data``.
+        """
+        header_start = band_text.find(b"\nion") + 1
+        projections_start = band_text.find(b"\n", header_start) + 1
+        projections_end = band_text.find(b"\ntot", projections_start)
+        if self.orbitals is None:
+            self.orbitals = band_text[header_start:projections_start].decode().split()[1:-1]
+            self.is_soc = band_text.count(b"\ntot") >= 4  # total and x, y, z magnetisation projections
+        if spin not in self.data:
+            self.data[spin] = np.zeros(
+                (self.nkpoints, len(self.bands), self.nions, len(self.orbitals)), dtype=np.float32
+            )
+
+        projections = np.fromstring(band_text[projections_start:projections_end].decode(), sep=" ")
+        self.data[spin][kpoint_idx, data_band_idx] = projections.reshape(self.nions, -1)[:, 1:-1]
+
+
+def get_procar(
+    procar_path: Union[str, "Path"],
+    bands: Optional[Union[range, list[int], tuple[int, ...]]] = None,
+    energy_window: Optional[tuple[float, float]] = None,
+):
     """
     Read the ``PROCAR(.gz)`` file as an ``easyunfold`` ``Procar`` object (if
     ``easyunfold`` installed), else a ``pymatgen`` ``Procar`` object (doesn't
@@ -164,12 +817,30 @@ def get_procar(procar_path: Union[str, "Path"]):
     ``easyunfold`` and then the ``proj_data`` attribute will be converted
     to a ``data`` attribute (to be compatible with ``pydefect``, which uses
     the ``pymatgen`` format).
+
+    If ``bands`` or ``energy_window`` are set, the ``PROCAR`` is instead
+    streamed with ``StreamedProcar``, storing only the orbital projections
+    for the specified window of bands (as ``float32`` arrays), which greatly
+    reduces the memory demand for large supercells.
+
+    Args:
+        procar_path (PathLike): Path to the ``PROCAR(.gz)`` file.
+        bands (range, list[int], tuple[int]):
+            0-indexed indices of the bands for which to parse the orbital
+            projections (see ``StreamedProcar``). (Default: None)
+        energy_window (tuple[float, float]):
+            (min, max) window of energies (in eV) for which to parse the
+            band orbital projections, if ``bands`` is not set (see
+            ``StreamedProcar``). (Default: None)
     """
     try:
         procar_path = find_archived_fname(str(procar_path))  # convert to string if Path object
     except FileNotFoundError:
         raise FileNotFoundError(f"PROCAR file not found at {procar_path}(.gz/.xz/.bz/.lzma)!") from None
 
+    if bands is not None or energy_window is not None:
+        return StreamedProcar(procar_path, bands=bands, energy_window=energy_window)
+
     easyunfold_installed = True  # first try loading with easyunfold
     try:
         from easyunfold.procar import Procar as EasyunfoldProcar
@@ -196,7 +867,99 @@ def get_procar(procar_path: Union[str, "Path"]):
     return procar
 
 
-def _get_output_files_and_check_if_multiple(output_file="vasprun.xml", path="."):
+def _scan_directory_tree(path: str) -> dict[str, tuple[list[str], list[str]]]:
+    """
+    Scan ``path`` and all its subdirectories (not following symlinks below
+    ``path``, as with ``os.walk``) with ``os.scandir``, returning a
+    dictionary of ``{absolute directory path: ([subdirectory names], [file
+    names])}``. Directories which cannot be read are skipped.
+    """
+    dir_index = {}
+    dirs_to_scan = [os.path.abspath(path)]
+    while dirs_to_scan:
+        dir_path = dirs_to_scan.pop()
+        subdirs, files = [], []
+        try:
+            with os.scandir(dir_path) as dir_entries:
+                for dir_entry in dir_entries:
+                    try:
+                        is_dir = dir_entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        subdirs.append(dir_entry.name)
+                        if not dir_entry.is_symlink():
+                            dirs_to_scan.append(dir_entry.path)
+                    else:
+                        files.append(dir_entry.name)
+        except OSError:
+            continue
+        dir_index[dir_path] = (subdirs, files)
+
+    return dir_index
+
+
+def _index_output_directories(path: str, threads: int = 8) -> dict[str, tuple[list[str], list[str]]]:
+    """
+    Index the directory tree under ``path`` in a single pass, returning a
+    dictionary of ``{absolute directory path: ([subdirectory names], [file
+    names])}`` for ``path`` and all its subdirectories, which can then be
+    used to locate VASP output files (with ``_get_directory_contents``)
+    without repeated directory listings (which can be slow on network file
+    systems).
+
+    Each top-level subdirectory of ``path`` (which may be a symlink, as with
+    ``os.walk`` on each subdirectory) is scanned in a separate thread, as
+    directory scanning is I/O-bound.
+
+    Args:
+        path (str): Path to the top-level directory to index.
+        threads (int):
+            Maximum number of threads to use for scanning subdirectories.
+            (Default: 8)
+    """
+    path = os.path.abspath(path)
+    subdirs, files = _get_directory_contents(path)
+    dir_index = {path: (subdirs, files)}
+    subdir_paths = [os.path.join(path, subdir) for subdir in subdirs]
+    if threads > 1 and len(subdir_paths) > 1:
+        with ThreadPool(min(threads, len(subdir_paths))) as pool:
+            subdir_indices = pool.map(_scan_directory_tree, subdir_paths)
+    else:
+        subdir_indices = [_scan_directory_tree(subdir_path) for subdir_path in subdir_paths]
+
+    for subdir_index in subdir_indices:
+        dir_index.update(subdir_index)
+
+    return dir_index
+
+
+def _get_directory_contents(
+    path: str, dir_index: Optional[dict[str, tuple[list[str], list[str]]]] = None
+) -> tuple[list[str], list[str]]:
+    """
+    Get the names of the subdirectories and files in ``path``, as
+    ``([subdirectory names], [file names])``, from ``dir_index`` (generated
+    by ``_index_output_directories``) if ``path`` is indexed, otherwise by
+    scanning ``path`` (raising ``OSError`` if it cannot be read, as with
+    ``os.listdir``).
+    """
+    if dir_index is not None and (contents := dir_index.get(os.path.abspath(path))) is not None:
+        return contents
+
+    subdirs, files = [], []
+    with os.scandir(path) as dir_entries:
+        for dir_entry in dir_entries:
+            (subdirs if dir_entry.is_dir() else files).append(dir_entry.name)
+
+    return subdirs, files
+
+
+def _get_output_files_and_check_if_multiple(
+    output_file: str = "vasprun.xml",
+    path: str = ".",
+    dir_index: Optional[dict[str, tuple[list[str], list[str]]]] = None,
+):
     """
     Search for all files with filenames matching ``output_file``, case-
     insensitive.
@@ -210,13 +973,17 @@ def _get_output_files_and_check_if_multiple(output_file="vasprun.xml", path=".")
             Should be either ``vasprun.xml``, ``OUTCAR``,
             ``LOCPOT`` or ``PROCAR``.
         path (str): The path to the directory to search in.
+        dir_index (dict):
+            Index of directory contents from ``_index_output_directories``,
+            used instead of listing ``path`` if it is indexed.
+            (Default: None)
     """
     if output_file.lower() == "vasprun.xml":
         search_patterns = ["vasprun", ".xml"]
     else:
         search_patterns = [output_file.lower()]
 
-    files = os.listdir(path)
+    files = [name for names in _get_directory_contents(path, dir_index) for name in names]
     output_files = [
         filename
         for filename in files
@@ -1443,6 +2210,93 @@ def defect_charge_from_vasprun(defect_vr: Vasprun, charge_state: Optional[int])
     return charge_state
 
 
+_parsing_profile_state = threading.local()  # current parsing profile and stage stack, if profiling
+
+
+def _get_peak_rss() -> float:
+    """
+    Get the peak resident set size (RSS; i.e. the peak memory usage) of the
+    current process, in bytes, or ``NaN`` if not available (e.g. on
+    Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return np.nan
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return float(peak_rss if sys.platform == "darwin" else peak_rss * 1024)  # kB on Linux
+
+
+def _record_parsing_stage_time(stage: str, elapsed_time: float):
+    stage_profile = _parsing_profile_state.profile.setdefault(stage, {"time": 0.0, "peak_rss": 0.0})
+    stage_profile["time"] += elapsed_time
+    stage_profile["peak_rss"] = max(stage_profile["peak_rss"], _get_peak_rss())
+
+
+@contextlib.contextmanager
+def _profile_parsing_stage(stage: str):
+    """
+    Record the wall time and peak RSS (of the current process) for a defect
+    parsing stage, in the current parsing profile if profiling (with
+    ``_profile_defect_parsing``), otherwise does nothing. Time spent in
+    nested stages is excluded (i.e. only recorded for the innermost stage),
+    so that the stage times sum to the total parsing time.
+
+    Can be used as a context manager or function decorator.
+    """
+    if getattr(_parsing_profile_state, "profile", None) is None:
+        yield
+        return
+
+    stage_stack = _parsing_profile_state.stage_stack
+    start_time = time.perf_counter()
+    if stage_stack:  # pause timing of enclosing stage
+        _record_parsing_stage_time(stage_stack[-1][0], start_time - stage_stack[-1][1])
+    stage_stack.append([stage, start_time])
+    try:
+        yield
+    finally:
+        end_time = time.perf_counter()
+        _record_parsing_stage_time(stage, end_time - stage_stack.pop()[1])
+        if stage_stack:  # resume timing of enclosing stage
+            stage_stack[-1][1] = end_time
+
+
+@contextlib.contextmanager
+def _profile_defect_parsing(profile: Optional[dict] = None):
+    """
+    Profile the defect parsing stages (marked with ``_profile_parsing_stage``)
+    run within this context, yielding the profile dictionary in the format
+    ``{stage: {"time": wall time (s), "peak_rss": peak RSS (bytes)}}``, which
+    is populated on exit, including ``"other"`` (time not spent in any marked
+    stage) and ``"total"`` entries. Note that ``peak_rss`` is the peak RSS of
+    the (worker) process by the end of the stage, which includes the memory
+    usage of any previous parsing in the same process.
+
+    Args:
+        profile (dict):
+            Existing profile dictionary to add to (e.g. if profiling multiple
+            steps for the same folder). If ``None`` (default), a new
+            dictionary is created.
+    """
+    profile = profile if profile is not None else {}
+    total_time = profile.pop("total", {}).get("time", 0.0)
+    _parsing_profile_state.profile = profile
+    _parsing_profile_state.stage_stack = []
+    start_time = time.perf_counter()
+    try:
+        with _profile_parsing_stage("other"):
+            yield profile
+    finally:
+        _parsing_profile_state.profile = None
+        profile["total"] = {
+            "time": total_time + time.perf_counter() - start_time,
+            "peak_rss": _get_peak_rss(),
+        }
+
+
+@_profile_parsing_stage("LOCPOT loading")
 def _get_bulk_locpot_dict(bulk_path, quiet=False):
     bulk_locpot_path, multiple = _get_output_files_and_check_if_multiple("LOCPOT", bulk_path)
     if multiple and not quiet:
@@ -1452,10 +2306,10 @@ def _get_bulk_locpot_dict(bulk_path, quiet=False):
             bulk_locpot_path,
             dir_type="bulk",
         )
-    bulk_locpot = get_locpot(bulk_locpot_path)
-    return {str(k): bulk_locpot.get_average_along_axis(k) for k in [0, 1, 2]}
+    return get_locpot_planar_averages(bulk_locpot_path)
 
 
+@_profile_parsing_stage("OUTCAR loading")
 def _get_bulk_site_potentials(bulk_path, quiet=False):
     from doped.corrections import _raise_incomplete_outcar_error  # avoid circular import
 
@@ -1467,12 +2321,12 @@ def _get_bulk_site_potentials(bulk_path, quiet=False):
             bulk_outcar_path,
             dir_type="bulk",
         )
-    bulk_outcar = get_outcar(bulk_outcar_path)
+    bulk_core_potentials = get_core_potentials(bulk_outcar_path)
 
-    if bulk_outcar.electrostatic_potential is None:
+    if bulk_core_potentials is None:
         _raise_incomplete_outcar_error(bulk_outcar_path, dir_type="bulk")
 
-    return -1 * np.array(bulk_outcar.electrostatic_potential)
+    return -1 * bulk_core_potentials
 
 
 def _update_defect_entry_charge_corrections(defect_entry, charge_correction_type):
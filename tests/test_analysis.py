@@ -7,8 +7,12 @@ functions.
 import gzip
 import os
 import shutil
+import threading
+import time
 import unittest
 import warnings
+from importlib.metadata import PackageNotFoundError
+from multiprocessing.pool import ThreadPool
 from unittest.mock import patch
 
 import matplotlib as mpl
@@ -16,22 +20,39 @@ import numpy as np
 import pytest
 from monty.serialization import dumpfn, loadfn
 from pymatgen.core.structure import Structure
+from pymatgen.electronic_structure.core import Spin
+from pymatgen.io.vasp.inputs import Poscar
+from pymatgen.io.vasp.outputs import Locpot
 from test_thermodynamics import custom_mpl_image_compare
 
 from doped.analysis import (
     DefectParser,
     DefectsParser,
+    _estimate_parsing_memory,
+    _get_folders_with_vasprun,
+    _initialise_defects_parser_worker,
+    _memory_bounded_imap_unordered,
+    _OutputFilesPrefetcher,
+    _parse_defect_in_worker,
+    _read_bulk_band_edge_procar,
     defect_entry_from_paths,
     defect_from_structures,
     defect_name_from_structures,
 )
 from doped.core import _orientational_degeneracy_warning
 from doped.generation import DefectsGenerator, get_defect_name_from_defect, get_defect_name_from_entry
-from doped.utils.eigenvalues import get_eigenvalue_analysis
+from doped.utils.eigenvalues import _get_bulk_band_edge_window, get_eigenvalue_analysis
 from doped.utils.parsing import (
+    StreamedProcar,
+    StreamedVasprun,
     Vasprun,
+    _get_directory_contents,
+    _get_output_files_and_check_if_multiple,
+    _index_output_directories,
+    get_core_potentials,
     get_defect_site_idxs_and_unrelaxed_structure,
     get_defect_type_and_composition_diff,
+    get_locpot_planar_averages,
     get_orientational_degeneracy,
     get_outcar,
     get_procar,
@@ -87,6 +108,7 @@ class DefectsParsingTestCase(unittest.TestCase):
         if_present_rm(os.path.join(self.CdTe_EXAMPLE_DIR, "CdTe_defect_dict.json"))
         if_present_rm(os.path.join(self.CdTe_EXAMPLE_DIR, "test_pop.json"))
         if_present_rm(os.path.join(self.YTOS_EXAMPLE_DIR, "Y2Ti2S2O5_defect_dict.json"))
+        if_present_rm(os.path.join(self.YTOS_EXAMPLE_DIR, ".doped_cache"))
         if_present_rm(os.path.join(self.Sb2Si2Te6_DATA_DIR, "SiSbTe3_defect_dict.json"))
         if_present_rm(os.path.join(self.Sb2Se3_DATA_DIR, "defect/Sb2Se3_defect_dict.json"))
         if_present_rm("V2O5_test")
@@ -642,6 +664,235 @@ class DefectsParsingTestCase(unittest.TestCase):
         )  # for test_plotting
         return thermo.plot()  # no chempots for YTOS formation energy plot test
 
+    def test_DefectsParser_YTOS_cache(self):
+        dp = DefectsParser(
+            output_path=self.YTOS_EXAMPLE_DIR,
+            dielectric=self.ytos_dielectric,
+            json_filename=False,
+            processes=1,
+            cache=True,
+        )
+        assert sorted(os.listdir(os.path.join(self.YTOS_EXAMPLE_DIR, ".doped_cache"))) == [
+            "F_O_1.json",
+            "Int_F_-1.json",
+        ]
+
+        # unchanged defect folders are loaded from the cache, without re-parsing:
+        with patch.object(DefectParser, "from_paths", side_effect=RuntimeError("Re-parsed!")) as mock:
+            cached_dp = DefectsParser(
+                output_path=self.YTOS_EXAMPLE_DIR,
+                dielectric=self.ytos_dielectric,
+                json_filename=False,
+                processes=1,
+                cache=True,
+            )
+        assert mock.call_count == 0
+        assert cached_dp.defect_dict.keys() == dp.defect_dict.keys()
+        for name, defect_entry in dp.defect_dict.items():
+            assert cached_dp.defect_dict[name].get_ediff() == defect_entry.get_ediff()
+            assert cached_dp.defect_dict[name].corrections == defect_entry.corrections
+
+        # modified defect folders are re-parsed:
+        os.utime(os.path.join(self.YTOS_EXAMPLE_DIR, "F_O_1", "vasprun.xml.gz"))
+        with patch.object(DefectParser, "from_paths", wraps=DefectParser.from_paths) as mock:
+            reparsed_dp = DefectsParser(
+                output_path=self.YTOS_EXAMPLE_DIR,
+                dielectric=self.ytos_dielectric,
+                json_filename=False,
+                processes=1,
+                cache=True,
+            )
+        assert mock.call_count == 1
+        assert "F_O_1" in mock.call_args.kwargs["defect_path"]
+        assert reparsed_dp.defect_dict["F_O_1"].get_ediff() == dp.defect_dict["F_O_1"].get_ediff()
+
+        # changed parsing settings trigger re-parsing of all defect folders:
+        with patch.object(DefectParser, "from_paths", wraps=DefectParser.from_paths) as mock:
+            DefectsParser(
+                output_path=self.YTOS_EXAMPLE_DIR,
+                skip_corrections=True,
+                json_filename=False,
+                processes=1,
+                cache=True,
+            )
+        assert mock.call_count == 2
+
+        # cache settings hash doesn't require the doped package metadata (e.g. running from source):
+        with patch("doped.analysis.version", side_effect=PackageNotFoundError("doped")):
+            assert isinstance(dp._get_cache_settings_hash(), str)
+
+    def test_DefectsParser_YTOS_multiprocessing_worker(self):
+        dp = DefectsParser(
+            output_path=self.YTOS_EXAMPLE_DIR,
+            dielectric=self.ytos_dielectric,
+            json_filename=False,
+            processes=1,
+        )
+        mp_dp = DefectsParser(
+            output_path=self.YTOS_EXAMPLE_DIR,
+            dielectric=self.ytos_dielectric,
+            json_filename=False,
+            processes=2,  # charged defect parsed first, then the other with multiprocessing
+        )
+        assert mp_dp.defect_dict.keys() == dp.defect_dict.keys()
+        for name, defect_entry in dp.defect_dict.items():
+            assert mp_dp.defect_dict[name].get_ediff() == defect_entry.get_ediff()
+            assert mp_dp.defect_dict[name].corrections == defect_entry.corrections
+
+        # worker parsing uses the parser (with bulk data) set once by the pool initializer:
+        _initialise_defects_parser_worker(dp)
+        defect_entry, _warnings_string = _parse_defect_in_worker("F_O_1")
+        assert defect_entry.get_ediff() == dp.defect_dict["F_O_1"].get_ediff()
+
+    def test_DefectsParser_YTOS_memory_budget(self):
+        # estimated parsing memory from output file sizes (compressed files scaled up):
+        f_o_memory = _estimate_parsing_memory(os.path.join(self.YTOS_EXAMPLE_DIR, "F_O_1"))
+        assert f_o_memory > os.path.getsize(os.path.join(self.YTOS_EXAMPLE_DIR, "F_O_1/vasprun.xml.gz"))
+        assert _estimate_parsing_memory(os.path.join(self.YTOS_EXAMPLE_DIR, "non_existent")) == 0
+
+        dp = DefectsParser(
+            output_path=self.YTOS_EXAMPLE_DIR,
+            dielectric=self.ytos_dielectric,
+            json_filename=False,
+            processes=1,
+        )
+        budget_dp = DefectsParser(
+            output_path=self.YTOS_EXAMPLE_DIR,
+            dielectric=self.ytos_dielectric,
+            json_filename=False,
+            processes=2,
+            memory_budget=1e-3,  # 1 MB, smaller than each folder, so parsed one at a time
+        )
+        assert budget_dp.memory_budget == 1e-3
+        assert budget_dp.defect_dict.keys() == dp.defect_dict.keys()
+        for name, defect_entry in dp.defect_dict.items():
+            assert budget_dp.defect_dict[name].get_ediff() == defect_entry.get_ediff()
+
+    def test_DefectsParser_YTOS_prefetch(self):
+        # read-ahead buffer only exceeded to read ahead the next folder:
+        paths = [os.path.join(self.YTOS_EXAMPLE_DIR, folder) for folder in ["F_O_1", "Int_F_-1"]]
+        with _OutputFilesPrefetcher(paths, buffer_size=1) as prefetcher:
+            assert len(prefetcher._folder_sizes) == 1
+            assert prefetcher._folder_sizes[0] > os.path.getsize(f"{paths[0]}/vasprun.xml.gz")
+            prefetcher.folder_parsed()
+            assert len(prefetcher._folder_sizes) == 2
+        with _OutputFilesPrefetcher([*paths, "non_existent"], buffer_size=1e9) as prefetcher:
+            assert prefetcher._folder_sizes[2] == 0
+        with _OutputFilesPrefetcher(paths, buffer_size=None) as prefetcher:  # no read-ahead
+            assert not prefetcher._folder_sizes
+
+        for processes in [1, 2]:
+            dp = DefectsParser(
+                output_path=self.YTOS_EXAMPLE_DIR,
+                dielectric=self.ytos_dielectric,
+                json_filename=False,
+                processes=processes,
+            )
+            prefetch_dp = DefectsParser(
+                output_path=self.YTOS_EXAMPLE_DIR,
+                dielectric=self.ytos_dielectric,
+                json_filename=False,
+                processes=processes,
+                prefetch_buffer=1e-3,  # 1 MB
+            )
+            assert prefetch_dp.defect_dict.keys() == dp.defect_dict.keys()
+            for name, defect_entry in dp.defect_dict.items():
+                assert prefetch_dp.defect_dict[name].get_ediff() == defect_entry.get_ediff()
+
+    def test_DefectsParser_YTOS_profile(self):
+        for processes in [1, 2]:  # profiles also recorded in worker processes
+            with patch("builtins.print") as mock_print:
+                dp = DefectsParser(
+                    output_path=self.YTOS_EXAMPLE_DIR,
+                    dielectric=self.ytos_dielectric,
+                    json_filename=False,
+                    processes=processes,
+                    profile="YTOS_parsing_profile.json",
+                )
+            assert "Defect parsing profile" in mock_print.call_args[0][0]
+            assert set(dp.parsing_profile.keys()) == {"bulk", "F_O_1", "Int_F_-1"}
+            assert "vasprun parsing" in dp.parsing_profile["bulk"]
+            for folder_profile in dp.parsing_profile.values():
+                # nested stages are excluded from enclosing stage times, so stage times sum to total:
+                stage_times = [v["time"] for k, v in folder_profile.items() if k != "total"]
+                assert np.isclose(sum(stage_times), folder_profile["total"]["time"], rtol=1e-2)
+                assert all(v["peak_rss"] > 0 for v in folder_profile.values())
+            for stage in ["vasprun parsing", "site matching", "symmetry & degeneracy", "OUTCAR loading"]:
+                assert stage in dp.parsing_profile["F_O_1"]
+
+            assert loadfn("YTOS_parsing_profile.json") == dp.parsing_profile
+            if_present_rm("YTOS_parsing_profile.json")
+
+    def test_memory_bounded_imap_unordered(self):
+        lock = threading.Lock()
+        running: list[float] = []
+        max_running_cost = []
+        start_order = []
+
+        def _task(cost):
+            with lock:
+                running.append(cost)
+                start_order.append(cost)
+                max_running_cost.append(sum(running) if len(running) > 1 else 0)
+            time.sleep(0.05 * cost)
+            with lock:
+                running.remove(cost)
+            return cost
+
+        costs = [1, 6, 2, 3, 1, 1, 4]
+        with ThreadPool(3) as pool:
+            results = list(
+                _memory_bounded_imap_unordered(
+                    pool, _task, costs, task_costs=costs, memory_budget=5, max_tasks_in_flight=3
+                )
+            )
+
+        assert sorted(results) == sorted(costs)
+        assert start_order[0] == 6  # largest first, run alone as larger than budget
+        assert max(max_running_cost) <= 5  # budget never exceeded with concurrent tasks
+        assert start_order[1:3] == [4, 1]  # then next largest, with smaller tasks fitted around it
+
+        def _failing_task(cost):
+            raise ValueError("Task failed")
+
+        with ThreadPool(2) as pool, pytest.raises(ValueError, match="Task failed"):
+            list(
+                _memory_bounded_imap_unordered(
+                    pool, _failing_task, [1, 2], task_costs=[1, 2], memory_budget=5, max_tasks_in_flight=2
+                )
+            )
+
+    def test_index_output_directories(self):
+        # single-pass directory index matches os.walk/os.listdir results, threaded or not:
+        for threads in [1, 8]:
+            dir_index = _index_output_directories(self.CdTe_EXAMPLE_DIR, threads=threads)
+            walked = {
+                os.path.abspath(dir_path): (sorted(subdirs), sorted(files))
+                for dir_path, subdirs, files in os.walk(self.CdTe_EXAMPLE_DIR)
+            }
+            assert {k: (sorted(v[0]), sorted(v[1])) for k, v in dir_index.items()} == walked
+
+        folders_with_vasprun = _get_folders_with_vasprun(self.CdTe_EXAMPLE_DIR, dir_index)
+        assert "CdTe_bulk" in folders_with_vasprun
+        assert "CdTe_chempots.json" not in folders_with_vasprun
+        assert folders_with_vasprun == [
+            folder
+            for folder in os.listdir(self.CdTe_EXAMPLE_DIR)
+            if any(
+                "vasprun" in file and ".xml" in file
+                for _dir_path, _subdirs, files in os.walk(os.path.join(self.CdTe_EXAMPLE_DIR, folder))
+                for file in files
+            )
+        ]
+
+        bulk_path = os.path.join(self.CdTe_EXAMPLE_DIR, "CdTe_bulk/vasp_ncl")
+        for output_file in ["vasprun.xml", "OUTCAR", "LOCPOT", "PROCAR"]:
+            assert _get_output_files_and_check_if_multiple(
+                output_file, bulk_path, dir_index
+            ) == _get_output_files_and_check_if_multiple(output_file, bulk_path)
+        assert _get_directory_contents(bulk_path, dir_index) is dir_index[bulk_path]  # no re-listing
+        assert _get_directory_contents(bulk_path) == dir_index[bulk_path]  # not indexed, scanned
+
     @custom_mpl_image_compare(filename="YTOS_example_defects_plot.png")
     def test_DefectsParser_YTOS_macOS_duplicated_OUTCAR(self):
         with open(f"{self.YTOS_EXAMPLE_DIR}/F_O_1/._OUTCAR", "w") as f:
@@ -2447,6 +2698,9 @@ class DopedParsingFunctionsTestCase(unittest.TestCase):
         if_present_rm(os.path.join(self.CdTe_BULK_DATA_DIR, "voronoi_nodes.json"))
         if_present_rm(os.path.join(self.YTOS_EXAMPLE_DIR, "Bulk", "voronoi_nodes.json"))
         if_present_rm("./vasprun.xml")
+        if_present_rm("./LOCPOT")
+        if_present_rm("./LOCPOT.gz")
+        if_present_rm("./OUTCAR")
 
         for dir in ["bulk", "v_Cu_0", "Si_i_-1"]:
             if os.path.exists(f"{self.Cu2SiSe3_EXAMPLE_DIR}/{dir}/vasp_std/hidden_vr.gz"):
@@ -2455,6 +2709,166 @@ class DopedParsingFunctionsTestCase(unittest.TestCase):
                     f"{self.Cu2SiSe3_EXAMPLE_DIR}/{dir}/vasp_std/vasprun.xml.gz",
                 )
 
+    def test_streamed_vasprun(self):
+        """
+        Test that ``StreamedVasprun`` matches ``Vasprun`` for the data used in
+        defect parsing.
+        """
+        for vr_path in [
+            f"{self.CdTe_EXAMPLE_DIR}/CdTe_bulk/vasp_gam/vasprun.xml.gz",
+            f"{self.YTOS_EXAMPLE_DIR}/F_O_1/vasprun.xml.gz",
+            # 16 ionic steps:
+            f"{self.EXAMPLE_DIR}/competing_phases/ZrO2/ZrO2_EaH_0.0/relax/vasprun.xml.gz",
+        ]:
+            print(f"Testing StreamedVasprun for {vr_path}")
+            vr = get_vasprun(vr_path, parse_projected_eigen=True)
+            streamed_vr = get_vasprun(vr_path, streamed=True, parse_projected_eigen=True)
+            assert isinstance(streamed_vr, StreamedVasprun)
+            assert isinstance(streamed_vr, Vasprun)
+
+            assert len(streamed_vr.ionic_steps) == 1  # only final ionic step stored
+            assert streamed_vr.nionic_steps == len(vr.ionic_steps)
+            assert streamed_vr.final_energy == vr.final_energy
+            assert streamed_vr.get_computed_entry().energy == vr.get_computed_entry().energy
+            assert streamed_vr.initial_structure == vr.initial_structure
+            assert streamed_vr.final_structure == vr.final_structure
+            assert streamed_vr.incar == vr.incar
+            assert streamed_vr.parameters == vr.parameters
+            assert streamed_vr.kpoints.as_dict() == vr.kpoints.as_dict()
+            np.testing.assert_array_equal(streamed_vr.actual_kpoints, vr.actual_kpoints)
+            assert streamed_vr.potcar_symbols == vr.potcar_symbols
+            assert streamed_vr.atomic_symbols == vr.atomic_symbols
+            assert streamed_vr.converged == vr.converged
+            assert streamed_vr.eigenvalue_band_properties == vr.eigenvalue_band_properties
+            for spin, eigenvalues in vr.eigenvalues.items():
+                np.testing.assert_array_equal(streamed_vr.eigenvalues[spin], eigenvalues)
+            if vr.projected_eigenvalues is not None:
+                for spin, proj_eigenvalues in vr.projected_eigenvalues.items():
+                    np.testing.assert_array_equal(
+                        streamed_vr.projected_eigenvalues[spin], proj_eigenvalues
+                    )
+            assert streamed_vr.efermi is None  # DOS not parsed
+            assert set(streamed_vr.as_dict()["output"].keys()) == set(vr.as_dict()["output"].keys())
+
+        streamed_vr = get_vasprun(
+            f"{self.CdTe_EXAMPLE_DIR}/CdTe_bulk/vasp_gam/vasprun.xml.gz", streamed=True, parse_eigen=False
+        )
+        assert streamed_vr.eigenvalues is None
+        assert streamed_vr.projected_eigenvalues is None
+
+    def test_locpot_planar_averages(self):
+        """
+        Test that the streamed planar averages from ``get_locpot_planar_averages``
+        match those from the full ``pymatgen`` ``Locpot``.
+        """
+        rng = np.random.default_rng(42)
+        locpot = Locpot(
+            Poscar(self.prim_cdte * [2, 1, 1]),
+            {"total": rng.normal(size=(14, 9, 11))},  # odd dims to test chunking across lines/planes
+        )
+        locpot.write_file("./LOCPOT")
+        with open("./LOCPOT", "rb") as f_in, gzip.open("./LOCPOT.gz", "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        locpot = Locpot.from_file("./LOCPOT")  # with written precision
+
+        for locpot_path in ["./LOCPOT", "./LOCPOT.gz"]:
+            for chunk_size in [1, 200, 1_000_000]:  # single plane, multiple planes, all at once
+                locpot_dict = get_locpot_planar_averages(locpot_path, chunk_size=chunk_size)
+                assert list(locpot_dict.keys()) == ["0", "1", "2"]
+                for axis in range(3):
+                    np.testing.assert_allclose(
+                        locpot_dict[str(axis)], locpot.get_average_along_axis(axis), rtol=1e-12
+                    )
+
+        with patch("doped.utils.parsing.parse_n_doubles", None):  # numpy parsing, e.g. older pymatgen
+            locpot_dict = get_locpot_planar_averages("./LOCPOT", chunk_size=200)
+        for axis in range(3):
+            np.testing.assert_allclose(locpot_dict[str(axis)], locpot.get_average_along_axis(axis))
+
+        with open("./LOCPOT") as f:  # truncated file
+            lines = f.readlines()
+        with open("./LOCPOT", "w") as f:
+            f.writelines(lines[: len(lines) // 2])
+        with pytest.raises(ValueError, match="is incomplete"):
+            get_locpot_planar_averages("./LOCPOT")
+
+        with pytest.raises(FileNotFoundError, match="LOCPOT file not found"):
+            get_locpot_planar_averages("./non_existent_LOCPOT")
+
+    def test_core_potentials(self):
+        """
+        Test that the core potentials from ``get_core_potentials`` match the
+        ``electrostatic_potential`` attribute of the full ``pymatgen``
+        ``Outcar``, for both compressed and uncompressed files.
+        """
+        outcar_path = f"{self.MgO_EXAMPLE_DIR}/Defects/Mg_O_0/vasp_std/OUTCAR.gz"  # many ionic steps
+        outcar = get_outcar(outcar_path)
+        with gzip.open(outcar_path, "rb") as f_in, open("./OUTCAR", "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+        for path in [outcar_path, "./OUTCAR"]:
+            for block_size in [64, 2**20]:  # header/table split across blocks, or within one
+                core_potentials = get_core_potentials(path, block_size=block_size)
+                assert isinstance(core_potentials, np.ndarray)
+                assert len(core_potentials) == 216
+                np.testing.assert_allclose(core_potentials, outcar.electrostatic_potential)
+
+        no_core_levels_outcar_path = (
+            f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/OUTCAR_no_core_levels.gz"
+        )
+        assert get_core_potentials(no_core_levels_outcar_path) is None
+
+        with open("./OUTCAR", "rb") as f:  # truncated final potentials block; last complete one used
+            outcar_text = f.read()
+        final_block_idx = outcar_text.rfind(b"average (electrostatic) potential at core")
+        with open("./OUTCAR", "wb") as f:
+            f.write(outcar_text[:final_block_idx])
+        previous_core_potentials = get_core_potentials("./OUTCAR")
+        with open("./OUTCAR", "wb") as f:
+            f.write(outcar_text[: final_block_idx + 500])
+        np.testing.assert_allclose(get_core_potentials("./OUTCAR"), previous_core_potentials)
+        assert not np.allclose(previous_core_potentials, outcar.electrostatic_potential)
+
+        with pytest.raises(FileNotFoundError, match="OUTCAR file not found"):
+            get_core_potentials("./non_existent_OUTCAR")
+
+    def test_streamed_procar(self):
+        """
+        Test that ``get_procar`` with ``bands`` or ``energy_window`` set
+        streams only the requested window of band projections, matching the
+        full parsed ``Procar``.
+        """
+        procar_path = f"{self.Cu2SiSe3_EXAMPLE_DIR}/bulk/vasp_std/PROCAR.gz"
+        procar = get_procar(procar_path)
+
+        for block_size in [512, 2**22]:  # band blocks split across reads, or within one
+            streamed_procar = StreamedProcar(procar_path, bands=range(200, 260), block_size=block_size)
+            assert streamed_procar.bands == range(200, 260)
+            for spin_idx, (spin, data) in enumerate(procar.data.items()):
+                assert streamed_procar.data[spin].dtype == np.float32
+                assert streamed_procar.data[spin].shape == (*data.shape[:1], 60, *data.shape[2:])
+                np.testing.assert_allclose(streamed_procar.data[spin], data[:, 200:260], atol=1e-6)
+                np.testing.assert_allclose(streamed_procar.eigenvalues[spin], procar.eigenvalues[spin_idx])
+
+        energies = procar.eigenvalues[0][0]  # easyunfold eigenvalues array: (nspins, nkpoints, nbands)
+        window_procar = get_procar(procar_path, energy_window=(energies[210], energies[230]))
+        assert window_procar.bands[0] <= 210
+        assert window_procar.bands[-1] >= 230
+        np.testing.assert_allclose(
+            window_procar.data[Spin.up], procar.data[Spin.up][:, window_procar.bands], atol=1e-6
+        )
+
+        with pytest.raises(ValueError, match="No bands found"):
+            get_procar(procar_path, energy_window=(1e4, 1e5))
+
+        # bulk band edge projections read once in ``DefectsParser``, falling back to the path on failure:
+        with patch("doped.utils.eigenvalues._get_bulk_band_edge_window", return_value=range(200, 260)):
+            bulk_procar = _read_bulk_band_edge_procar(procar_path, bulk_vr=None)
+        assert isinstance(bulk_procar, StreamedProcar)
+        assert bulk_procar.bands == range(200, 260)
+        np.testing.assert_allclose(bulk_procar.data[Spin.up], procar.data[Spin.up][:, 200:260], atol=1e-6)
+        assert _read_bulk_band_edge_procar(procar_path, bulk_vr=None) == procar_path
+
     def test_defect_name_from_structures(self):
         # by proxy also tests defect_from_structures
         for defect_gen_name in [
@@ -2996,6 +3410,10 @@ class DopedParsingFunctionsTestCase(unittest.TestCase):
             f"{self.Cu2SiSe3_EXAMPLE_DIR}/bulk/vasp_std/vasprun.xml.gz",
         )
         dp = DefectsParser(f"{self.Cu2SiSe3_EXAMPLE_DIR}", skip_corrections=True)
+        # only the bulk band edge projections are read (once) from the PROCAR, and shared for each defect:
+        assert isinstance(dp.bulk_procar, StreamedProcar)
+        assert dp.bulk_procar.bands == _get_bulk_band_edge_window(dp.bulk_vr)
+        assert dp.bulk_procar.data[Spin.up].shape[1] == len(dp.bulk_procar.bands)
 
         print("Testing v_Cu_0 with plot = True")
         bes, fig = dp.defect_dict["v_Cu_0"].get_eigenvalue_analysis()  # Test plotting KS
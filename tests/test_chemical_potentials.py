@@ -564,6 +564,49 @@ class CombineExtrinsicTestCase(unittest.TestCase):
             chemical_potentials.combine_extrinsic(self.first, self.second, "R")
 
 
+class ChempotGridTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.path = Path(__file__).parents[1].joinpath("examples/competing_phases")
+        self.zro2_chempots = loadfn(self.path / "zro2_chempots.json")
+        # square stability region for a ternary ABC2 host, with formation energy -3 eV/fu:
+        self.ternary_chempots = {
+            "limits_wrt_el_refs": {
+                limit: {"A": mu_A, "B": mu_B, "C": (-3 - mu_A - mu_B) / 2}
+                for limit, (mu_A, mu_B) in zip(
+                    ["L1", "L2", "L3", "L4"], [(0, 0), (-1, 0), (-1, -1), (0, -1)]
+                )
+            }
+        }
+
+    def test_binary_chempot_grid(self):
+        for method in ["simplex", "grid"]:
+            chempot_grid = chemical_potentials.get_chempot_grid(self.zro2_chempots, 5, method=method)
+            assert list(chempot_grid.columns) == ["Zr", "O"]
+            assert len(chempot_grid) == 5
+            for limit_dict in self.zro2_chempots["limits_wrt_el_refs"].values():
+                assert np.any(np.all(np.isclose(chempot_grid, list(limit_dict.values())), axis=1))
+            assert np.allclose(np.diff(chempot_grid["O"]), np.diff(chempot_grid["O"])[0])  # evenly spaced
+
+    def test_ternary_chempot_grid(self):
+        simplex_grid = chemical_potentials.get_chempot_grid(self.ternary_chempots, 4)
+        assert len(simplex_grid) == 16  # 2 triangles with 10 points each, sharing 4 on diagonal
+        grid = chemical_potentials.get_chempot_grid(self.ternary_chempots, 4, method="grid")
+        assert len(grid) == 16  # square grid, including corners
+
+        for chempot_grid in [simplex_grid, grid]:
+            assert np.allclose(chempot_grid["A"] + chempot_grid["B"] + 2 * chempot_grid["C"], -3)
+            assert np.all((chempot_grid[["A", "B"]] < 1e-8) & (chempot_grid[["A", "B"]] > -1 - 1e-8))
+            for limit_dict in self.ternary_chempots["limits_wrt_el_refs"].values():
+                assert np.any(np.all(np.isclose(chempot_grid, list(limit_dict.values())), axis=1))
+
+    def test_chempot_grid_errors(self):
+        with pytest.raises(ValueError):
+            chemical_potentials.get_chempot_grid(self.zro2_chempots, method="random")
+
+        with pytest.raises(ValueError):
+            chemical_potentials.get_chempot_grid(self.zro2_chempots, n_points=1)
+
+
 class CompetingPhasesTestCase(unittest.TestCase):
     def setUp(self) -> None:
         self.path = Path(__file__).parents[0]
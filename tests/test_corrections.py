@@ -8,17 +8,20 @@ developers.
 
 import os
 import unittest
+import warnings
+from itertools import product
 from typing import Any
 from unittest.mock import patch
 
 import matplotlib as mpl
 import numpy as np
 import pytest
+from pymatgen.analysis.defects.corrections import freysoldt
 from pymatgen.core.structure import PeriodicSite, Structure
 from pymatgen.entries.computed_entries import ComputedStructureEntry
 from test_analysis import if_present_rm
 
-from doped import analysis
+from doped import analysis, corrections
 from doped.core import DefectEntry, Vacancy
 from doped.corrections import get_freysoldt_correction, get_kumagai_correction
 
@@ -142,6 +145,148 @@ class FiniteSizeChargeCorrectionTest(unittest.TestCase):
             get_kumagai_correction(self.defect_entry, self.dielectric, verbose=False)
         mock_print.assert_not_called()
 
+    def test_correction_cache(self):
+        """
+        Test that the supercell point-charge terms of the Kumagai (eFNV) and
+        Freysoldt (FNV) corrections are computed once and reused across
+        charge states.
+        """
+        from pydefect.corrections import ewald
+
+        corrections.clear_correction_cache()
+        with patch("pydefect.corrections.ewald.Ewald", wraps=ewald.Ewald) as mock_ewald:
+            efnv_corr = get_kumagai_correction(self.defect_entry, self.dielectric, verbose=False)
+            self.defect_entry.charge_state = 3
+            efnv_corr_plus_3 = get_kumagai_correction(self.defect_entry, self.dielectric, verbose=False)
+        mock_ewald.assert_called_once()
+        assert np.isclose(efnv_corr.correction_energy, 1.2651776920778381)
+        assert np.isclose(
+            efnv_corr.metadata["pydefect_ExtendedFnvCorrection"].point_charge_correction,
+            efnv_corr_plus_3.metadata["pydefect_ExtendedFnvCorrection"].point_charge_correction,
+        )
+
+        with patch(
+            "pymatgen.analysis.defects.corrections.freysoldt.perform_es_corr",
+            wraps=freysoldt.perform_es_corr,
+        ) as mock_perform_es_corr:
+            fnv_corr_plus_3 = get_freysoldt_correction(self.defect_entry, self.dielectric, verbose=False)
+            self.defect_entry.charge_state = -3
+            fnv_corr = get_freysoldt_correction(self.defect_entry, self.dielectric, verbose=False)
+        mock_perform_es_corr.assert_called_once()
+        assert np.isclose(fnv_corr.correction_energy, 5.445950368792991)
+        assert np.isclose(fnv_corr.metadata["electrostatic"], fnv_corr_plus_3.metadata["electrostatic"])
+        assert len([key for key in corrections._correction_cache if key[0] == "freysoldt_es_corr"]) == 1
+
+        corrections.clear_correction_cache()
+        assert not corrections._correction_cache
+
+    def test_recompute_corrections(self):
+        self.defect_entry.get_kumagai_correction(self.dielectric, verbose=False)
+        with warnings.catch_warnings(record=True):
+            corrections.recompute_corrections(
+                {"v_O_-3": self.defect_entry}, correction_type="freysoldt", dielectric=self.dielectric
+            )
+        assert set(self.defect_entry.corrections.keys()) == {"freysoldt_charge_correction"}
+        assert np.isclose(self.defect_entry.corrections["freysoldt_charge_correction"], 5.445950368792991)
+        assert not any(k.startswith("kumagai") for k in self.defect_entry.corrections_metadata)
+        assert self.defect_entry.calculation_metadata["dielectric"] == self.dielectric
+
+        # previous correction type used by default, and previous corrections (and dielectric) kept if
+        # recomputing fails:
+        del self.defect_entry.calculation_metadata["bulk_locpot_dict"]
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            corrections.recompute_corrections([self.defect_entry], dielectric=50, processes=1)
+        assert any("Previous corrections will be kept" in str(warning.message) for warning in w)
+        assert np.isclose(self.defect_entry.corrections["freysoldt_charge_correction"], 5.445950368792991)
+        assert self.defect_entry.calculation_metadata["dielectric"] == self.dielectric
+
+        with pytest.raises(ValueError):
+            corrections.recompute_corrections([self.defect_entry], correction_type="makov-payne")
+
+    def test_get_kumagai_sampling_region_scan(self):
+        excluded_indices_list = [None, list(range(0, 30, 2))]
+        scan_df = corrections.get_kumagai_sampling_region_scan(
+            self.defect_entry,
+            defect_region_radii=[None, 4, 6.5],
+            excluded_indices=excluded_indices_list,
+            dielectric=self.dielectric,
+        )
+        assert len(scan_df) == 6
+        assert list(scan_df.columns) == [
+            "Defect Region Radius (Å)",
+            "Excluded Indices",
+            "Sampled Sites",
+            "Correction Energy (eV)",
+            "Alignment Term (eV)",
+            "Plateau Variance (V^2)",
+            "Correction Error (eV)",
+        ]
+        assert np.isclose(scan_df["Correction Energy (eV)"][0], 1.2651776920778381)
+
+        # results should match the full correction for each sampling region:
+        for (_i, row), (defect_region_radius, excluded_indices) in zip(
+            scan_df.iterrows(), product([None, 4, 6.5], excluded_indices_list)
+        ):
+            efnv_corr, correction_error = self.defect_entry.get_kumagai_correction(
+                self.dielectric,
+                defect_region_radius=defect_region_radius,
+                excluded_indices=excluded_indices,
+                return_correction_error=True,
+            )
+            efnv_corr_obj = efnv_corr.metadata["pydefect_ExtendedFnvCorrection"]
+            assert np.isclose(row["Defect Region Radius (Å)"], efnv_corr_obj.defect_region_radius)
+            assert np.isclose(row["Correction Energy (eV)"], efnv_corr.correction_energy)
+            assert np.isclose(row["Alignment Term (eV)"], efnv_corr_obj.alignment_correction)
+            assert np.isclose(row["Correction Error (eV)"], correction_error)
+            assert row["Sampled Sites"] == sum(
+                site.distance > efnv_corr_obj.defect_region_radius for site in efnv_corr_obj.sites
+            )
+
+    def test_get_ewald_site_potentials(self):
+        """
+        Test that the batched Ewald site potential evaluation matches the
+        per-site ``pydefect`` ``Ewald.atomic_site_potential()`` results.
+        """
+        from pydefect.corrections.ewald import Ewald
+
+        ytos_bulk = Structure.from_file(f"{module_path}/../examples/YTOS/Bulk/POSCAR")
+        ewald = Ewald(ytos_bulk.lattice.matrix, np.diag([40.7, 40.7, 25.2]))
+        rel_coords = ytos_bulk.frac_coords[::20] - np.array([0.1, 0.23, 0.47])
+        site_potentials = [ewald.atomic_site_potential(list(rel_coord)) for rel_coord in rel_coords]
+
+        for max_chunk_size in [2_000_000, 1_000]:  # default and multiple chunks
+            assert np.allclose(
+                corrections._get_ewald_site_potentials(ewald, rel_coords, max_chunk_size=max_chunk_size),
+                site_potentials,
+                rtol=1e-10,
+                atol=1e-14,
+            )
+
+    def test_get_murphy_image_charge_correction(self):
+        """
+        Test the vectorised Murphy image-charge correction against reference
+        values from the previous (explicit loop) implementation, for cubic,
+        hexagonal and triclinic cells with isotropic and anisotropic dielectric
+        tensors.
+        """
+        from doped.utils.legacy_corrections import get_murphy_image_charge_correction
+
+        for lattice, dielectric, factor, point_charge_energy in [
+            (np.eye(3) * 6.0, np.eye(3) * 10, 10, 0.3404619840851089),
+            ([[4.2, 0, 0], [-2.1, 3.637, 0], [0, 0, 12.0]], np.diag([8, 8, 20]), 8, 0.27488333042654933),
+            (
+                [[5.0, 0.3, 0], [0.2, 7.0, 0.1], [0, 0.4, 9.0]],
+                [[12, 1, 0], [1, 15, 0.5], [0, 0.5, 9]],
+                12,
+                0.21369831001832726,
+            ),
+        ]:
+            correction = get_murphy_image_charge_correction(lattice, dielectric, factor=factor)
+            assert list(correction.keys()) == list(range(1, 8))
+            for q, q_correction in correction.items():
+                assert np.isclose(q_correction, point_charge_energy * q**2, rtol=1e-10, atol=0)
+
 
 class CorrectionsPlottingTestCase(unittest.TestCase):
     module_path: str
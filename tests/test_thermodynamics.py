@@ -11,6 +11,8 @@ import warnings
 from copy import deepcopy
 from functools import wraps
 from io import StringIO
+from itertools import product
+from unittest.mock import patch
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -20,7 +22,20 @@ import pytest
 from monty.serialization import dumpfn, loadfn
 
 from doped.generation import _sort_defect_entries
-from doped.thermodynamics import DefectThermodynamics, get_fermi_dos, scissor_dos
+from doped.thermodynamics import (
+    CarrierConcentrationModel,
+    DefectConcentrationModel,
+    DefectThermodynamics,
+    _get_lower_envelope,
+    _get_periodic_site_kdtree,
+    _query_periodic_site_kdtree,
+    _safeguarded_newton,
+    get_doping,
+    get_e_h_concs,
+    get_fermi_dos,
+    group_defects_by_distance,
+    scissor_dos,
+)
 from doped.utils.parsing import get_vasprun
 from doped.utils.symmetry import _get_sga, point_symmetry
 
@@ -552,11 +567,22 @@ class DefectThermodynamicsTestCase(DefectThermodynamicsSetupMixin):
         """
         Test outputs of transition level functions for CdTe.
         """
-        assert self.CdTe_defect_thermo.transition_level_map == {
+        # transition level keys compared with np.isclose, as the lower-envelope intersections can
+        # differ from the previous HalfspaceIntersection values in the last floating point digit:
+        expected_transition_level_map = {
             "v_Cd": {0.46988348089141413: [0, -2]},
             "Te_Cd": {},
             "Int_Te_3": {0.03497090517885537: [2, 1]},
         }
+        assert self.CdTe_defect_thermo.transition_level_map.keys() == expected_transition_level_map.keys()
+        for defect_name, expected_tl_dict in expected_transition_level_map.items():
+            tl_dict = self.CdTe_defect_thermo.transition_level_map[defect_name]
+            assert len(tl_dict) == len(expected_tl_dict)
+            for (tl, charges), (expected_tl, expected_charges) in zip(
+                sorted(tl_dict.items()), sorted(expected_tl_dict.items())
+            ):
+                assert np.isclose(tl, expected_tl, rtol=0, atol=1e-12)
+                assert charges == expected_charges
 
         tl_info = ["Defect: v_Cd", "Defect: Te_Cd"]
         tl_info_not_all = ["Transition level ε(0/-2) at 0.470 eV above the VBM"]
@@ -1562,6 +1588,96 @@ class DefectThermodynamicsTestCase(DefectThermodynamicsSetupMixin):
             self.CdTe_defect_thermo.get_symmetries_and_degeneracies()
         )
 
+    def test_recompute_corrections(self):
+        orig_corrections = {
+            entry.name: entry.corrections.copy() for entry in self.YTOS_defect_thermo.defect_entries
+        }
+        orig_transition_level_map = deepcopy(self.YTOS_defect_thermo.transition_level_map)
+        for processes in [1, 2]:  # serial and parallel, with shared bulk data
+            self.YTOS_defect_thermo.recompute_corrections(processes=processes)
+            for entry in self.YTOS_defect_thermo.defect_entries:
+                assert entry.corrections.keys() == orig_corrections[entry.name].keys()
+                for key, value in orig_corrections[entry.name].items():
+                    assert np.isclose(entry.corrections[key], value)
+            assert self.YTOS_defect_thermo.transition_level_map == orig_transition_level_map
+
+        self.YTOS_defect_thermo.recompute_corrections(dielectric=20)
+        F_O_1 = next(entry for entry in self.YTOS_defect_thermo.defect_entries if entry.name == "F_O_1")
+        assert F_O_1.calculation_metadata["dielectric"] == 20
+        assert np.isclose(F_O_1.corrections["kumagai_charge_correction"], 0.14577026569284715)
+        assert np.isclose(
+            self.YTOS_defect_thermo.get_formation_energy("F_O_1", fermi_level=0)
+            - self.orig_YTOS_defect_thermo.get_formation_energy("F_O_1", fermi_level=0),
+            0.14577026569284715 - orig_corrections["F_O_1"]["kumagai_charge_correction"],
+        )
+
+    def test_periodic_site_kdtree(self):
+        # KD-tree distances should match brute-force ``PeriodicSite.distance_and_image()``:
+        for defect_dict in [self.Sb2Se3_defect_dict, self.YTOS_defect_dict]:
+            defect_site_dict = group_defects_by_distance(list(defect_dict.values()))
+            for entry in defect_dict.values():
+                equiv_site_tuples = list(defect_site_dict[entry.defect.name].keys())
+                bulk_site = entry.calculation_metadata["bulk_site"]
+                tree, tuple_indices = _get_periodic_site_kdtree(equiv_site_tuples, bulk_site.lattice)
+                min_dist, tree_idx = _query_periodic_site_kdtree(
+                    tree, bulk_site.frac_coords, bulk_site.lattice
+                )
+                min_dist_list = [
+                    min(bulk_site.distance_and_image(site)[0] for site in equiv_site_tuple)
+                    for equiv_site_tuple in equiv_site_tuples
+                ]
+                assert np.isclose(min_dist, min(min_dist_list))
+                assert np.isclose(min_dist_list[tuple_indices[tree_idx]], min(min_dist_list))
+
+                # no points within ``dist_tol`` returns ``np.inf``:
+                if min_dist > 0.1:
+                    assert (
+                        _query_periodic_site_kdtree(
+                            tree, bulk_site.frac_coords, bulk_site.lattice, dist_tol=min_dist / 2
+                        )[0]
+                        == np.inf
+                    )
+
+    def test_add_entries_incremental_regrouping(self):
+        cdte_defect_dict = loadfn(os.path.join(self.module_path, "data/CdTe_defect_dict_v2.3.json"))
+        entries = list(cdte_defect_dict.values())
+        new_entries = [entry for entry in entries if entry.defect.name == "v_Cd"]
+        defect_thermo = DefectThermodynamics([entry for entry in entries if entry not in new_entries])
+        cached_groupings = {
+            defect_type: groups for defect_type, (_, _, groups) in defect_thermo._grouping_cache.items()
+        }
+        cached_group_info = {
+            key: group_info for key, (_, _, group_info) in defect_thermo._transition_level_cache.items()
+        }
+
+        defect_thermo.add_entries(new_entries)
+        ref_defect_thermo = DefectThermodynamics(entries)
+        for attr in ["transition_level_map", "stable_charges", "defect_charge_map"]:
+            assert getattr(defect_thermo, attr) == getattr(ref_defect_thermo, attr)
+        assert {k: [e.name for e in v] for k, v in defect_thermo.all_entries.items()} == {
+            k: [e.name for e in v] for k, v in ref_defect_thermo.all_entries.items()
+        }
+
+        # only the added defect type is regrouped/reparsed, other cached info is reused:
+        for defect_type, (_, _, groups) in defect_thermo._grouping_cache.items():
+            if defect_type == "v_Cd":
+                assert defect_type not in cached_groupings
+            else:
+                assert groups is cached_groupings[defect_type]
+        reused = [
+            key
+            for key, (_, _, group_info) in defect_thermo._transition_level_cache.items()
+            if cached_group_info.get(key) is group_info
+        ]
+        assert len(reused) == len(defect_thermo._transition_level_cache) - 1  # only v_Cd reparsed
+
+        # changing ``dist_tol`` regroups all defects:
+        defect_thermo.dist_tol = 0.5
+        assert all(
+            groups is not cached_groupings.get(defect_type)
+            for defect_type, (_, _, groups) in defect_thermo._grouping_cache.items()
+        )
+
     def test_CdTe_all_intrinsic_defects(self):
         for i in [
             "CdTe_defect_dict_v2.3",
@@ -2252,6 +2368,460 @@ class DefectThermodynamicsCdTePlotsTestCases(unittest.TestCase):
         return f
 
 
+class DefectThermodynamicsSolversTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.module_path = os.path.dirname(os.path.abspath(__file__))
+        cls.CdTe_EXAMPLE_DIR = os.path.join(cls.module_path, "../examples/CdTe")
+        cls.CdTe_chempots = loadfn(os.path.join(cls.CdTe_EXAMPLE_DIR, "CdTe_chempots.json"))
+        cls.orig_defect_thermo = loadfn(os.path.join(cls.CdTe_EXAMPLE_DIR, "CdTe_example_thermo.json"))
+        cls.orig_defect_thermo.chempots = cls.CdTe_chempots
+        cls.fermi_dos = get_fermi_dos(os.path.join(data_dir, "CdTe/CdTe_prim_k101010_dos_vr.xml.gz"))
+
+    def setUp(self):
+        self.defect_thermo = deepcopy(self.orig_defect_thermo)
+
+    def test_concentration_model(self):
+        model = DefectConcentrationModel(self.defect_thermo.defect_entries, vbm=self.defect_thermo.vbm)
+        assert model.elements == ["Cd", "Te"]
+        assert len(model.defect_names) == len(set(model.names))
+        chempots_vector = model.get_chempots_vector(self.CdTe_chempots, limit="Te-rich")
+        assert np.allclose(chempots_vector, list(self.CdTe_chempots["limits"]["CdTe-Te"].values()))
+
+        for fermi_level, temperature in [(0.2, 300), (1.0, 1000)]:
+            concentrations = model.get_concentrations(fermi_level, temperature, chempots_vector)
+            for entry, concentration in zip(self.defect_thermo.defect_entries, concentrations):
+                assert np.isclose(
+                    concentration,
+                    entry.equilibrium_concentration(
+                        chempots=self.CdTe_chempots,
+                        limit="Te-rich",
+                        fermi_level=fermi_level,
+                        temperature=temperature,
+                        vbm=self.defect_thermo.vbm,
+                    ),
+                    rtol=1e-8,
+                )
+
+        # broadcasting over Fermi levels and temperatures:
+        fermi_levels = np.linspace(0, 1.5, 4)
+        temperatures = np.array([300, 1000])[:, np.newaxis]
+        concentrations = model.get_concentrations(fermi_levels, temperatures, chempots_vector)
+        assert concentrations.shape == (2, 4, len(self.defect_thermo.defect_entries))
+        assert np.allclose(
+            concentrations[1, 2], model.get_concentrations(fermi_levels[2], 1000, chempots_vector)
+        )
+        totals = model.get_defect_totals(concentrations)
+        assert totals.shape == (2, 4, len(model.defect_names))
+        assert np.allclose(totals.sum(axis=-1), concentrations.sum(axis=-1))
+
+    def test_concentration_model_cache(self):
+        model = self.defect_thermo._get_concentration_model()
+        stable_model = self.defect_thermo._get_concentration_model(stable_entries_only=True)
+        assert model.defect_entries == self.defect_thermo.defect_entries
+        assert stable_model.defect_entries == self.defect_thermo.all_stable_entries
+        fermi_level = self.defect_thermo.get_equilibrium_fermi_level(
+            self.fermi_dos, limit="Te-rich", temperature=900
+        )
+        assert self.defect_thermo._get_concentration_model() is model  # reused by solvers
+        assert self.defect_thermo._get_concentration_model(stable_entries_only=True) is stable_model
+
+        # rebuilt if entry energies or the VBM change:
+        self.defect_thermo.defect_entries[0].corrections["test"] = 0.1
+        new_model = self.defect_thermo._get_concentration_model()
+        assert new_model is not model
+        assert np.isclose(new_model.ediffs[0], model.ediffs[0] + 0.1)
+        del self.defect_thermo.defect_entries[0].corrections["test"]
+        self.defect_thermo.vbm += 0.1
+        assert self.defect_thermo._get_concentration_model() is not new_model
+        self.defect_thermo.vbm -= 0.1
+
+        # cleared when reparsing, e.g. when adding entries or changing ``dist_tol``:
+        model = self.defect_thermo._get_concentration_model()
+        self.defect_thermo.dist_tol = 2.0
+        assert self.defect_thermo._get_concentration_model() is not model
+        assert np.isclose(
+            self.defect_thermo.get_equilibrium_fermi_level(limit="Te-rich", temperature=900),
+            fermi_level,
+            atol=1e-8,
+        )
+
+        # changed degeneracy factors are used after a first solve:
+        for entry in self.defect_thermo.defect_entries:
+            entry.degeneracy_factors["spin degeneracy"] = 1000
+        fresh_defect_thermo = DefectThermodynamics(
+            self.defect_thermo.defect_entries, chempots=self.CdTe_chempots
+        )
+        conc_dfs = [
+            defect_thermo.get_equilibrium_concentrations(
+                limit="Te-rich", fermi_level=fermi_level, temperature=900, lean=True
+            )
+            for defect_thermo in [self.defect_thermo, fresh_defect_thermo]
+        ]
+        assert np.allclose(
+            conc_dfs[0]["Concentration (cm^-3)"], conc_dfs[1]["Concentration (cm^-3)"], rtol=1e-10
+        )
+        new_fermi_level = self.defect_thermo.get_equilibrium_fermi_level(limit="Te-rich", temperature=900)
+        assert not np.isclose(new_fermi_level, fermi_level, atol=1e-3)
+        assert np.isclose(
+            new_fermi_level,
+            fresh_defect_thermo.get_equilibrium_fermi_level(
+                self.fermi_dos, limit="Te-rich", temperature=900
+            ),
+            atol=1e-10,
+        )
+
+    def test_equilibrium_fermi_level_with_concentration_model(self):
+        """
+        Check the model-based solver matches the charge neutrality condition
+        evaluated with the ``DataFrame``-based concentrations.
+        """
+        fermi_level = self.defect_thermo.get_equilibrium_fermi_level(
+            self.fermi_dos, limit="Te-rich", temperature=900
+        )
+        conc_df = self.defect_thermo.get_equilibrium_concentrations(
+            limit="Te-rich", fermi_level=fermi_level, temperature=900, lean=True
+        )
+        total_q = (conc_df["Charge"] * conc_df["Concentration (cm^-3)"]).sum() + get_doping(
+            self.fermi_dos, fermi_level + self.defect_thermo.vbm, 900
+        )
+        assert np.isclose(total_q, 0, atol=1e-3 * conc_df["Concentration (cm^-3)"].max())
+
+    def test_get_equilibrium_fermi_levels(self):
+        temperatures = [300, 700, 1100]
+        fermi_levels_df = self.defect_thermo.get_equilibrium_fermi_levels(
+            self.fermi_dos, limits=["Cd-rich", "Te-rich"], temperatures=temperatures
+        )
+        assert list(fermi_levels_df.columns) == [
+            "limit",
+            "Temperature (K)",
+            "Fermi Level (eV wrt VBM)",
+            "Electron Concentration (cm^-3)",
+            "Hole Concentration (cm^-3)",
+        ]
+        assert len(fermi_levels_df) == 6
+        for _i, row in fermi_levels_df.iterrows():
+            fermi_level, e_conc, h_conc = self.defect_thermo.get_equilibrium_fermi_level(
+                limit=row["limit"], temperature=row["Temperature (K)"], return_concs=True
+            )
+            assert np.isclose(row["Fermi Level (eV wrt VBM)"], fermi_level, atol=1e-8)
+            assert np.isclose(row["Electron Concentration (cm^-3)"], e_conc, rtol=1e-6)
+            assert np.isclose(row["Hole Concentration (cm^-3)"], h_conc, rtol=1e-6)
+
+        # all limits used by default, with previously-parsed fermi_dos:
+        fermi_levels_df = self.defect_thermo.get_equilibrium_fermi_levels(temperatures=500)
+        assert list(fermi_levels_df["limit"]) == list(self.CdTe_chempots["limits"].keys())
+        assert np.allclose(fermi_levels_df["Temperature (K)"], 500)
+
+    def test_carrier_concentration_model(self):
+        model = CarrierConcentrationModel(self.fermi_dos, temperatures=[300, 1000])
+        fermi_levels = np.linspace(*model.fermi_level_range, 101)
+        for temperature in [300, 1000, 500]:  # tabulated and non-tabulated temperatures
+            e_concs, h_concs = model.get_e_h_concs(fermi_levels, temperature)
+            ref_e_concs, ref_h_concs = get_e_h_concs(self.fermi_dos, fermi_levels, temperature)
+            assert np.allclose(e_concs, ref_e_concs, rtol=1e-6, atol=0)
+            assert np.allclose(h_concs, ref_h_concs, rtol=1e-6, atol=0)
+
+        # outside tabulated range, and scalar inputs:
+        for fermi_level in [model.fermi_level_range[0] - 1, model.fermi_level_range[1] + 1, 1.0]:
+            e_conc, h_conc = model.get_e_h_concs(fermi_level, 300)
+            assert isinstance(e_conc, float)
+            assert np.allclose(
+                (e_conc, h_conc), get_e_h_concs(self.fermi_dos, fermi_level, 300), rtol=1e-6, atol=0
+            )
+        assert np.isclose(get_doping(model, 1.0, 300), get_doping(self.fermi_dos, 1.0, 300), rtol=1e-6)
+
+        # unconverged tabulation falls back to direct integration, with a warning:
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            unconverged_model = CarrierConcentrationModel(self.fermi_dos, temperatures=1000, rtol=1e-30)
+        assert any("did not converge to within rtol = 1e-30" in str(warning.message) for warning in w)
+        assert not unconverged_model._tables
+        assert np.allclose(
+            unconverged_model.get_e_h_concs(1.0, 1000),
+            get_e_h_concs(self.fermi_dos, 1.0, 1000),
+            rtol=1e-10,
+            atol=0,
+        )
+
+        # drop-in replacement for FermiDos in solvers:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", "Using UFloat")
+            for bulk_dos in [self.fermi_dos, model]:
+                fermi_level, e_conc, h_conc = self.defect_thermo.get_equilibrium_fermi_level(
+                    bulk_dos, limit="Te-rich", temperature=300, return_concs=True
+                )
+                assert np.isclose(fermi_level, 0.8135382, atol=1e-6)
+                assert np.isclose(e_conc, 94895.2, rtol=1e-5)
+                quenched_fermi_level = self.defect_thermo.get_quenched_fermi_level_and_concentrations(
+                    bulk_dos, limit="Te-rich", delta_gap=0.2
+                )[0]
+                assert np.isclose(quenched_fermi_level, 0.4080794, atol=1e-6)
+
+    def test_newton_solver(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", "Using UFloat")
+            for limit, temperature in product(["Te-rich", "Cd-rich"], [300, 1000]):
+                brentq_results = self.defect_thermo.get_equilibrium_fermi_level(
+                    self.fermi_dos, limit=limit, temperature=temperature, return_concs=True
+                )
+                newton_results = self.defect_thermo.get_equilibrium_fermi_level(
+                    limit=limit, temperature=temperature, return_concs=True, solver="newton"
+                )
+                assert np.isclose(newton_results[0], brentq_results[0], atol=1e-10)
+                assert np.allclose(newton_results[1:], brentq_results[1:], rtol=1e-8)
+
+                brentq_quenched = self.defect_thermo.get_quenched_fermi_level_and_concentrations(
+                    limit=limit, annealing_temperature=temperature + 200, skip_formatting=True
+                )
+                newton_quenched = self.defect_thermo.get_quenched_fermi_level_and_concentrations(
+                    limit=limit,
+                    annealing_temperature=temperature + 200,
+                    skip_formatting=True,
+                    solver="newton",
+                    initial_fermi_level=brentq_quenched[0] + 0.05,  # warm start
+                )
+                assert np.isclose(newton_quenched[0], brentq_quenched[0], atol=1e-10)
+                assert np.allclose(
+                    newton_quenched[3]["Concentration (cm^-3)"],
+                    brentq_quenched[3]["Concentration (cm^-3)"],
+                    rtol=1e-8,
+                )
+
+            fermi_levels_df = self.defect_thermo.get_equilibrium_fermi_levels(temperatures=[300, 600, 900])
+            newton_fermi_levels_df = self.defect_thermo.get_equilibrium_fermi_levels(
+                temperatures=[300, 600, 900], solver="newton"
+            )
+            assert np.allclose(
+                newton_fermi_levels_df["Fermi Level (eV wrt VBM)"],
+                fermi_levels_df["Fermi Level (eV wrt VBM)"],
+                atol=1e-10,
+            )
+
+        with pytest.raises(ValueError) as exc:
+            self.defect_thermo.get_equilibrium_fermi_level(solver="halley")
+        assert "Invalid solver choice `halley`" in str(exc.value)
+
+        # unbracketed roots raise an error for scalar solves (as with brentq), and are NaN for arrays:
+        def _unbracketed_func(x):
+            return -x - 10, -np.ones_like(x)
+
+        with pytest.raises(ValueError) as exc:
+            _safeguarded_newton(_unbracketed_func, -1.0, 2.0)
+        assert "Charge neutrality could not be bracketed" in str(exc.value)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            roots = _safeguarded_newton(_unbracketed_func, np.array([-1.0, -20.0]), np.array([2.0, 2.0]))
+        assert any("could not be bracketed for 1 of the 2" in str(warning.message) for warning in w)
+        assert np.isnan(roots[0])
+        assert np.isclose(roots[1], -10)
+
+        # non-finite (e.g. underflowing) charge balances and unconverged roots are also failures:
+        def _non_finite_func(x):
+            return np.where(x > 0, np.nan, -x), -np.ones_like(x)
+
+        with pytest.raises(ValueError) as exc:
+            _safeguarded_newton(_non_finite_func, -1.0, 2.0)
+        assert "charge balance is not finite" in str(exc.value)
+        with pytest.raises(ValueError) as exc:
+            _safeguarded_newton(_unbracketed_func, -20.0, 2.0, initial=1.9, maxiter=1)
+        assert "did not converge within 1 iterations" in str(exc.value)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            roots = _safeguarded_newton(
+                _non_finite_func, np.array([-1.0, -1.0]), np.array([2.0, 0.5]), initial=[1.0, -0.5]
+            )
+        assert any("could not be solved for 1 of the 2" in str(warning.message) for warning in w)
+        assert np.isnan(roots[0])
+        assert np.isclose(roots[1], 0)
+
+    def test_get_quenched_fermi_levels_and_concentrations(self):
+        annealing_temperatures = [600, 900, 1200]
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", "Using UFloat")
+            for solver in ["bisect", "newton"]:
+                conditions_df, concentrations = (
+                    self.defect_thermo.get_quenched_fermi_levels_and_concentrations(
+                        self.fermi_dos,
+                        annealing_temperatures=annealing_temperatures,
+                        delta_gaps=[0, 0.2],
+                        solver=solver,
+                    )
+                )
+                assert len(conditions_df) == len(concentrations) == 2 * 2 * 3  # limits, delta_gaps, T
+                assert concentrations.shape[1] == len(self.defect_thermo.defect_entries)
+
+                for (_idx, row), row_concentrations in zip(conditions_df.iterrows(), concentrations):
+                    fermi_level, e_conc, h_conc, conc_df, annealing_fermi_level, *_ = (
+                        self.defect_thermo.get_quenched_fermi_level_and_concentrations(
+                            limit=row["limit"],
+                            annealing_temperature=row["Annealing Temperature (K)"],
+                            quenched_temperature=row["Quenched Temperature (K)"],
+                            delta_gap=row["Delta Gap (eV)"],
+                            skip_formatting=True,
+                            return_annealing_values=True,
+                        )
+                    )
+                    assert np.isclose(row["Fermi Level (eV wrt VBM)"], fermi_level, atol=1e-8)
+                    assert np.isclose(
+                        row["Annealing Fermi Level (eV wrt VBM)"], annealing_fermi_level, atol=1e-8
+                    )
+                    assert np.isclose(row["Electron Concentration (cm^-3)"], e_conc, rtol=1e-6)
+                    assert np.isclose(row["Hole Concentration (cm^-3)"], h_conc, rtol=1e-6)
+                    assert np.allclose(row_concentrations, conc_df["Concentration (cm^-3)"], rtol=1e-6)
+
+        # per-defect, per-site concentrations:
+        conditions_df, concentrations = self.defect_thermo.get_quenched_fermi_levels_and_concentrations(
+            limits=["Te-rich"], annealing_temperatures=900, per_charge=False, per_site=True
+        )
+        conc_df = self.defect_thermo.get_quenched_fermi_level_and_concentrations(
+            limit="Te-rich",
+            annealing_temperature=900,
+            per_charge=False,
+            per_site=True,
+            skip_formatting=True,
+        )[3]
+        model = DefectConcentrationModel(self.defect_thermo.defect_entries, vbm=self.defect_thermo.vbm)
+        assert np.allclose(
+            concentrations[0],
+            [conc_df.loc[defect_name, "Concentration (per site)"] for defect_name in model.defect_names],
+            rtol=1e-6,
+        )
+
+    def test_fermi_level_and_concentrations_map(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", "Using UFloat")
+            map_df = self.defect_thermo.get_fermi_level_and_concentrations_map(self.fermi_dos, n_points=7)
+            assert len(map_df) == 7
+            assert set(map_df["Dominant Defect"]) == {"v_Cd"}
+            for limit, limit_dict in self.CdTe_chempots["limits_wrt_el_refs"].items():
+                row = map_df[np.isclose(map_df["Cd"], limit_dict["Cd"])].iloc[0]
+                fermi_level, e_conc, h_conc = self.defect_thermo.get_equilibrium_fermi_level(
+                    limit=limit, return_concs=True
+                )
+                assert np.isclose(row["Fermi Level (eV wrt VBM)"], fermi_level, atol=1e-8)
+                assert np.isclose(row["Electron Concentration (cm^-3)"], e_conc, rtol=1e-6)
+                assert np.isclose(row["Hole Concentration (cm^-3)"], h_conc, rtol=1e-6)
+
+            # quenched, with multiprocessing over chunks:
+            quenched_map_df = self.defect_thermo.get_fermi_level_and_concentrations_map(
+                n_points=7, annealing_temperature=900, solver="newton", processes=2, chunk_size=3
+            )
+            assert len(quenched_map_df) == 7
+            row = quenched_map_df[np.isclose(quenched_map_df["Te"], 0)].iloc[0]
+            fermi_level, e_conc, h_conc, conc_df = (
+                self.defect_thermo.get_quenched_fermi_level_and_concentrations(
+                    limit="Te-rich", annealing_temperature=900, per_charge=False, skip_formatting=True
+                )
+            )
+            assert np.isclose(row["Fermi Level (eV wrt VBM)"], fermi_level, atol=1e-8)
+            assert np.isclose(row["Hole Concentration (cm^-3)"], h_conc, rtol=1e-6)
+            assert np.isclose(row["v_Cd"], conc_df.loc["v_Cd", "Concentration (cm^-3)"], rtol=1e-6)
+
+            # unbracketed points give NaN Fermi levels and concentrations, and no dominant defect:
+            orig_solve_fermi_levels = DefectThermodynamics._solve_fermi_levels
+
+            def _solve_fermi_levels_with_unbracketed_point(*args, **kwargs):
+                fermi_levels = orig_solve_fermi_levels(*args, **kwargs)
+                fermi_levels[0] = np.nan
+                return fermi_levels
+
+            with patch.object(
+                DefectThermodynamics,
+                "_solve_fermi_levels",
+                autospec=True,
+                side_effect=_solve_fermi_levels_with_unbracketed_point,
+            ):
+                unbracketed_map_df = self.defect_thermo.get_fermi_level_and_concentrations_map(n_points=7)
+            assert np.isnan(unbracketed_map_df["Fermi Level (eV wrt VBM)"][0])
+            assert np.isnan(unbracketed_map_df["v_Cd"][0])
+            assert pd.isna(unbracketed_map_df["Dominant Defect"][0])
+            assert set(unbracketed_map_df["Dominant Defect"][1:]) == {"v_Cd"}
+
+    def test_dopability_map(self):
+        map_df = self.defect_thermo.get_dopability_map(n_points=5)
+        assert len(map_df) == 5
+        for limit, limit_dict in self.CdTe_chempots["limits_wrt_el_refs"].items():
+            row = map_df[np.isclose(map_df["Cd"], limit_dict["Cd"])].iloc[0]
+            # brute-force comparison with ``get_formation_energy()``:
+            donor_intercepts, acceptor_intercepts = {}, {}
+            for entry in self.defect_thermo.all_stable_entries:
+                formation_energy = self.defect_thermo.get_formation_energy(
+                    entry, limit=limit, fermi_level=0
+                )
+                if entry.charge_state > 0:
+                    donor_intercepts[entry.name] = -formation_energy / entry.charge_state
+                elif entry.charge_state < 0:
+                    acceptor_intercepts[entry.name] = -formation_energy / entry.charge_state
+
+            compensating_donor = max(donor_intercepts, key=donor_intercepts.get)
+            compensating_acceptor = min(acceptor_intercepts, key=acceptor_intercepts.get)
+            assert row["p-type Dopability Compensating Defect"] == compensating_donor
+            assert np.isclose(
+                row["p-type Dopability Limit (eV from VBM/CBM)"], donor_intercepts[compensating_donor]
+            )
+            assert row["n-type Dopability Compensating Defect"] == compensating_acceptor
+            assert np.isclose(
+                row["n-type Dopability Limit (eV from VBM/CBM)"],
+                acceptor_intercepts[compensating_acceptor],
+            )
+
+        # most p/n-type points match ``get_dopability_limits()`` and ``get_doping_windows()``:
+        dopability_df = self.defect_thermo.get_dopability_limits()
+        doping_window_df = self.defect_thermo.get_doping_windows()
+        assert np.isclose(
+            map_df["p-type Dopability Limit (eV from VBM/CBM)"].min(),
+            dopability_df.loc["p-type", "Dopability Limit (eV from VBM/CBM)"],
+            atol=1e-3,
+        )
+        assert np.isclose(
+            map_df["n-type Dopability Limit (eV from VBM/CBM)"].max(),
+            dopability_df.loc["n-type", "Dopability Limit (eV from VBM/CBM)"],
+            atol=1e-3,
+        )
+        for doping_type in ["p-type", "n-type"]:
+            assert np.isclose(
+                map_df[f"{doping_type} Doping Window (eV at VBM/CBM)"].max(),
+                doping_window_df.loc[doping_type, "Doping Window (eV at VBM/CBM)"],
+                atol=1e-3,
+            )
+
+        # user-supplied chempot points:
+        chempot_grid = map_df[["Cd", "Te"]].iloc[[0, -1]].reset_index(drop=True)
+        grid_map_df = self.defect_thermo.get_dopability_map(chempot_grid=chempot_grid)
+        pd.testing.assert_frame_equal(grid_map_df, map_df.iloc[[0, -1]].reset_index(drop=True))
+
+    def test_lower_envelope(self):
+        # lines: y = 2x + 1 (q=+2), y = x + 0.5 (q=+1), y = 0.3 (q=0), y = -x + 3 (q=-1, for x > 2.7)
+        slopes, intercepts = [2, 1, 0, -1], [1, 0.5, 0.3, 3]
+        indices, breakpoints = _get_lower_envelope(slopes, intercepts, [-1, 2])
+        assert indices == [0, 1, 2]
+        assert np.allclose(breakpoints, [-0.5, -0.2])
+
+        # restricted range drops +2 and gives no breakpoint left of the range:
+        indices, breakpoints = _get_lower_envelope(slopes, intercepts, [-0.4, 2])
+        assert indices == [1, 2]
+        assert np.allclose(breakpoints, [-0.2])
+
+        # brute-force comparison with random lines:
+        rng = np.random.default_rng(0)
+        x_values = np.linspace(-1, 3, 4001)
+        for _ in range(50):
+            slopes = list(rng.permutation(np.arange(-3, 4))[: rng.integers(1, 7)])
+            intercepts = list(rng.uniform(-2, 2, len(slopes)))
+            indices, breakpoints = _get_lower_envelope(slopes, intercepts, [-1, 3])
+            lowest = np.argmin(np.outer(x_values, slopes) + intercepts, axis=1)
+            assert indices == list(dict.fromkeys(lowest))
+            assert len(breakpoints) == len(indices) - 1
+
+        # transition levels from the lower envelope:
+        tl_map = self.defect_thermo.transition_level_map
+        assert np.isclose(next(iter(tl_map["v_Cd"])), 0.469883, atol=1e-5)
+        assert list(tl_map["v_Cd"].values()) == [[0, -2]]
+        assert np.isclose(next(iter(tl_map["Int_Te_3"])), 0.034971, atol=1e-5)
+        assert list(tl_map["Int_Te_3"].values()) == [[2, 1]]
+
+
 # TODO: Test all DefectThermodynamics methods (doping windows/limits, etc)
 # TODO: Test check_compatibility
 # TODO: Test how attributes change when reloaded from JSON (e.g.